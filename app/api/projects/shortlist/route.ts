@@ -1,13 +1,10 @@
 import { NextRequest, NextResponse } from "next/server"
 import { prisma } from "@/lib/prisma"
 import { getUserById } from "@/lib/auth"
-import { exec } from "child_process"
-import { promisify } from "util"
+import { resumeSelectorWorker } from "@/lib/resume-selector-worker"
 import path from "path"
 import fs from "fs/promises"
 
-const execAsync = promisify(exec)
-
 export async function POST(request: NextRequest) {
   try {
     const userId = request.headers.get("x-user-id")
@@ -89,8 +86,6 @@ Requirements: Looking for candidates with relevant skills and experience for thi
 Expected completion: ${new Date(project.expected_completion_date).toLocaleDateString()}
     `.trim()
 
-    // Create a temporary Python script to run the resume selector
-    const scriptPath = path.join(process.cwd(), "scripts", "run_resume_selector.py")
     const mistralApiKey = process.env.MISTRAL_API_KEY || ""
 
     if (!mistralApiKey) {
@@ -99,133 +94,33 @@ Expected completion: ${new Date(project.expected_completion_date).toLocaleDateSt
       }, { status: 500 })
     }
 
-    // Create the Python script
-    const pythonScript = `
-import sys
-import os
-import json
-import warnings
-
-# Redirect all prints and warnings to stderr except our final JSON output
-warnings.filterwarnings("ignore")
-os.environ['TOKENIZERS_PARALLELISM'] = 'false'
-os.environ['HF_HUB_DISABLE_SYMLINKS_WARNING'] = '1'
-
-sys.path.append('${path.join(process.cwd(), "scripts").replace(/\\/g, "\\\\")}')
-
-from resume_selector_main_class import ResumeSelector
-
-def main():
-    try:
-        # Initialize the resume selector (quiet mode for API)
-        print("Initializing AI Resume Selector...", file=sys.stderr)
-        selector = ResumeSelector(api_key="${mistralApiKey}", quiet=True)
-        
-        # Process resumes from the project folder
-        resume_folder = "${resumesFolder.replace(/\\/g, "\\\\")}"
-        print(f"Processing resumes from: {resume_folder}", file=sys.stderr)
-        success = selector.process_resumes(resume_folder)
-        
-        if not success:
-            print(json.dumps({"error": "Failed to process resumes"}))
-            return
-        
-        print(f"Successfully processed {selector.get_resume_count()} resumes", file=sys.stderr)
-        
-        # Project description
-        project_desc = """${projectDescription.replace(/"/g, '\\"')}"""
-        
-        # Search for top candidates
-        print("Searching for top candidates...", file=sys.stderr)
-        candidates = selector.search_resumes(project_desc, top_k=${top_k})
-        
-        if not candidates:
-            print(json.dumps({"error": "No suitable candidates found"}))
-            return
-        
-        # Generate summaries for candidates
-        print("Generating AI analysis for candidates...", file=sys.stderr)
-        results = []
-        for i, candidate in enumerate(candidates, 1):
-            print(f"Analyzing candidate {i}/{len(candidates)}...", file=sys.stderr)
-            summary = selector.generate_candidate_summary(project_desc, candidate)
-            results.append({
-                "file_name": candidate["file_name"],
-                "file_path": candidate["file_path"],
-                "score": candidate["score"],
-                "name": summary.get("name", "Unknown"),
-                "skills": summary.get("skills", []),
-                "reasons": summary.get("reasons", []),
-                "metadata": candidate.get("metadata", {})
-            })
-        
-        print(f"AI analysis completed successfully!", file=sys.stderr)
-        # Only print JSON to stdout
-        print(json.dumps({"success": True, "candidates": results}))
-        
-    except Exception as e:
-        print(json.dumps({"error": str(e)}))
-
-if __name__ == "__main__":
-    main()
-`
-
-    // Write the script
-    await fs.writeFile(scriptPath, pythonScript)
-
     try {
-      // Get Python path from environment or use dynamic detection
-      let pythonPath = process.env.PYTHON_VENV_PATH;
-      
-      if (!pythonPath) {
-        // Try to detect virtual environment automatically
-        const venvPaths = [
-          path.join(process.cwd(), "..", ".venv", process.platform === "win32" ? "Scripts" : "bin", process.platform === "win32" ? "python.exe" : "python"),
-          path.join(process.cwd(), ".venv", process.platform === "win32" ? "Scripts" : "bin", process.platform === "win32" ? "python.exe" : "python"),
-          path.join(process.env.HOME || process.env.USERPROFILE || "", ".venv", process.platform === "win32" ? "Scripts" : "bin", process.platform === "win32" ? "python.exe" : "python"),
-        ];
-        
-        // Check which python path exists
-        for (const checkPath of venvPaths) {
-          try {
-            await fs.access(checkPath);
-            pythonPath = checkPath;
-            break;
-          } catch {
-            // Continue to next path
-          }
-        }
-        
-        // Fallback to system python
-        if (!pythonPath) {
-          pythonPath = process.platform === "win32" ? "python.exe" : "python3";
-          console.warn("Virtual environment not found, using system Python");
-        }
-      }
-      
-      console.log("Using Python path:", pythonPath);
-      const { stdout, stderr } = await execAsync(`"${pythonPath}" "${scriptPath}"`, {
-        cwd: process.cwd(),
-        timeout: 3000, // 2 minutes timeout
-        env: { ...process.env, PYTHONIOENCODING: 'utf-8' }
-      })
-
-      if (stderr) {
-        console.error("Python script stderr:", stderr)
-      }
+      // The worker keeps the embedding model and one resume index shared by all projects warm between requests
+      await resumeSelectorWorker.request("process", { folder: resumesFolder, project_id })
 
-      // Parse the result
-      const result = JSON.parse(stdout.trim())
+      const { candidates } = await resumeSelectorWorker.request("search", {
+        description: projectDescription,
+        top_k,
+        project_id,
+      })
 
-      if (result.error) {
+      if (!candidates || candidates.length === 0) {
         return NextResponse.json({ 
-          error: result.error 
+          error: "No suitable candidates found" 
         }, { status: 500 })
       }
 
+      const { summaries } = await resumeSelectorWorker.request("summarize", {
+        description: projectDescription,
+        candidates: candidates.map((candidate: any) => ({ id: candidate.id, score: candidate.score })),
+        timeout: 30,
+      })
+
       // Map results to include student information from database
       const shortlistedCandidates = []
-      for (const candidate of result.candidates) {
+      for (const [index, candidate] of candidates.entries()) {
+        const summary = summaries[index] || {}
+
         // Find the corresponding project request
         const projectRequest = project.project_requests.find(req => 
           req.resume_path && req.resume_path.includes(candidate.file_name)
@@ -241,22 +136,15 @@ if __name__ == "__main__":
             file_path: candidate.file_path,
             score: candidate.score,
             ai_analysis: {
-              name: candidate.name,
-              skills: candidate.skills,
-              reasons: candidate.reasons,
-              metadata: candidate.metadata
+              name: summary.name || "Unknown",
+              skills: summary.skills || [],
+              reasons: summary.reasons || [],
+              metadata: candidate.metadata || {}
             }
           })
         }
       }
 
-      // Clean up the temporary script
-      try {
-        await fs.unlink(scriptPath)
-      } catch (error) {
-        console.log("Could not delete temporary script:", error)
-      }
-
       return NextResponse.json({ 
         success: true,
         project: {
@@ -269,15 +157,7 @@ if __name__ == "__main__":
       })
 
     } catch (error) {
-      console.error("Error running Python script:", error)
-      
-      // Clean up the temporary script
-      try {
-        await fs.unlink(scriptPath)
-      } catch (cleanupError) {
-        console.log("Could not delete temporary script:", cleanupError)
-      }
-
+      console.error("Error running resume selector worker:", error)
       return NextResponse.json({ 
         error: "Failed to process resumes with AI" 
       }, { status: 500 })
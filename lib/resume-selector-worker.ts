@@ -0,0 +1,162 @@
+import { spawn, ChildProcessWithoutNullStreams } from "child_process"
+import readline from "readline"
+import path from "path"
+import fs from "fs/promises"
+
+type PendingRequest = {
+  resolve: (value: any) => void
+  reject: (error: Error) => void
+  timer: NodeJS.Timeout
+  onEvent?: (event: WorkerEvent) => void
+}
+
+// Progress line streamed by commands such as "shortlist" before their response
+export type WorkerEvent = { event: string; [key: string]: any }
+
+// Resolve the Python interpreter: explicit env var, then known venv locations, then system Python
+async function resolvePythonPath(): Promise<string> {
+  if (process.env.PYTHON_VENV_PATH) {
+    return process.env.PYTHON_VENV_PATH
+  }
+
+  const binDir = process.platform === "win32" ? "Scripts" : "bin"
+  const exe = process.platform === "win32" ? "python.exe" : "python"
+  const venvPaths = [
+    path.join(process.cwd(), "..", ".venv", binDir, exe),
+    path.join(process.cwd(), ".venv", binDir, exe),
+    path.join(process.env.HOME || process.env.USERPROFILE || "", ".venv", binDir, exe),
+  ]
+
+  for (const checkPath of venvPaths) {
+    try {
+      await fs.access(checkPath)
+      return checkPath
+    } catch {
+      // Continue to next path
+    }
+  }
+
+  console.warn("Virtual environment not found, using system Python")
+  return process.platform === "win32" ? "python.exe" : "python3"
+}
+
+/**
+ * Client for scripts/resume_selector_worker.py.
+ *
+ * The worker is spawned once and kept alive, so the embedding model and the
+ * indexed resumes stay warm between shortlist requests. Requests and responses
+ * are JSON lines matched by id.
+ */
+export class ResumeSelectorWorker {
+  private child: ChildProcessWithoutNullStreams | null = null
+  private starting: Promise<ChildProcessWithoutNullStreams> | null = null
+  private pending = new Map<number, PendingRequest>()
+  private nextId = 1
+
+  private async start(): Promise<ChildProcessWithoutNullStreams> {
+    if (this.child) return this.child
+    if (this.starting) return this.starting
+
+    this.starting = (async () => {
+      const pythonPath = await resolvePythonPath()
+      const scriptPath = path.join(process.cwd(), "scripts", "resume_selector_worker.py")
+      console.log("Starting resume selector worker with:", pythonPath)
+
+      const child = spawn(pythonPath, [scriptPath], {
+        cwd: process.cwd(),
+        env: { ...process.env, PYTHONIOENCODING: "utf-8" },
+      })
+
+      readline.createInterface({ input: child.stdout }).on("line", (line) => this.onLine(line))
+      child.stderr.on("data", (data) => console.error("Resume worker:", data.toString().trimEnd()))
+      child.on("exit", (code) => this.onExit(child, code))
+      // Spawn failures (ENOENT for a missing interpreter) and writes to a worker that just died (EPIPE)
+      // surface as 'error' events, which would crash the server if left unhandled
+      child.on("error", (error) => this.onError(child, error))
+      child.stdin.on("error", (error) => this.onError(child, error))
+
+      this.child = child
+      this.starting = null
+      return child
+    })()
+
+    return this.starting
+  }
+
+  private onLine(line: string) {
+    let response: any
+    try {
+      response = JSON.parse(line)
+    } catch {
+      console.error("Resume worker sent invalid JSON:", line)
+      return
+    }
+
+    const pending = this.pending.get(response.id)
+    if (!pending) return
+    if (!("ok" in response)) {
+      pending.onEvent?.(response)
+      return
+    }
+    this.pending.delete(response.id)
+    clearTimeout(pending.timer)
+
+    if (response.ok) {
+      pending.resolve(response.result)
+    } else {
+      pending.reject(new Error(response.error || "Resume worker error"))
+    }
+  }
+
+  private onExit(child: ChildProcessWithoutNullStreams, code: number | null) {
+    console.error("Resume selector worker exited with code", code)
+    this.drop(child, new Error("Resume selector worker exited"))
+  }
+
+  private onError(child: ChildProcessWithoutNullStreams, error: Error) {
+    console.error("Resume selector worker error:", error.message)
+    child.kill()
+    this.drop(child, new Error(`Resume selector worker failed: ${error.message}`))
+  }
+
+  // Forget a dead worker, so the next request respawns it, and reject the requests it still owed.
+  // An exit may follow an error for the same child; only the first one is acted on.
+  private drop(child: ChildProcessWithoutNullStreams, error: Error) {
+    if (this.child !== child) return
+    this.child = null
+    this.starting = null
+    for (const [id, pending] of this.pending) {
+      clearTimeout(pending.timer)
+      pending.reject(error)
+      this.pending.delete(id)
+    }
+  }
+
+  async request<T = any>(
+    cmd: string,
+    payload: Record<string, unknown> = {},
+    timeoutMs = 120000,
+    onEvent?: (event: WorkerEvent) => void,
+  ): Promise<T> {
+    const child = await this.start()
+    const id = this.nextId++
+
+    return new Promise<T>((resolve, reject) => {
+      const timer = setTimeout(() => {
+        this.pending.delete(id)
+        reject(new Error(`Resume worker command '${cmd}' timed out`))
+      }, timeoutMs)
+
+      this.pending.set(id, { resolve, reject, timer, onEvent })
+      child.stdin.write(JSON.stringify({ id, cmd, ...payload }) + "\n")
+    })
+  }
+}
+
+const globalForWorker = globalThis as unknown as {
+  resumeSelectorWorker: ResumeSelectorWorker | undefined
+}
+
+export const resumeSelectorWorker = globalForWorker.resumeSelectorWorker ?? new ResumeSelectorWorker()
+
+globalForWorker.resumeSelectorWorker = resumeSelectorWorker
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Benchmark bulk index encoding: one torch process versus encode_parallel.
+
+For every core count C it encodes the same synthetic resume profiles (see
+benchmark_resume_encoder) three ways and reports resumes/sec:
+
+  * threads:    one process with C torch intra-op threads
+  * processes:  encode_parallel with C processes of 1 thread each
+  * mixed:      encode_parallel with C/2 processes of 2 threads each (C >= 4)
+
+and checks that the sharded embeddings match the single-process ones.
+
+Usage:
+    python scripts/benchmark_resume_bulk_encode.py [--resumes 2000] [--cores 1,2,4,8]
+                                                   [--batch-size 32] [--model BAAI/bge-base-en-v1.5]
+"""
+import os
+import sys
+import time
+import argparse
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from benchmark_resume_encoder import synthetic_profiles
+from resume_encoder import encode_parallel, limit_threads
+
+
+def default_cores():
+    cores, count = [], 1
+    while count <= (os.cpu_count() or 1):
+        cores.append(count)
+        count *= 2
+    return ",".join(map(str, cores))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", default="BAAI/bge-base-en-v1.5")
+    parser.add_argument("--resumes", type=int, default=2000)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--cores", default=default_cores(), help="Comma-separated core counts")
+    args = parser.parse_args()
+
+    from sentence_transformers import SentenceTransformer
+    model = SentenceTransformer(args.model, device="cpu")
+    model.eval()
+    texts = synthetic_profiles(args.resumes)
+    model.encode(texts[:8], batch_size=args.batch_size)  # warm-up
+
+    print(f"{args.resumes} resumes, model {args.model}, batch {args.batch_size}")
+    print(f"{'cores':>5} {'layout':<10} {'procs':>5} {'threads':>7} {'seconds':>8} {'resumes/s':>10} {'max |Δ|':>9}")
+    for cores in (int(c) for c in args.cores.split(",")):
+        layouts = [("threads", 1, cores), ("processes", cores, 1)]
+        if cores >= 4:
+            layouts.append(("mixed", cores // 2, 2))
+
+        reference = None
+        for layout, processes, threads in layouts:
+            started = time.perf_counter()
+            if processes == 1:
+                limit_threads(threads)
+                embeddings = np.asarray(model.encode(texts, batch_size=args.batch_size), dtype=np.float32)
+            else:
+                embeddings = encode_parallel(model, texts, processes, threads=threads, batch_size=args.batch_size)
+            seconds = time.perf_counter() - started
+            if reference is None:
+                reference = embeddings
+            print(f"{cores:>5} {layout:<10} {processes:>5} {threads:>7} {seconds:>8.2f} "
+                  f"{len(texts) / seconds:>10.1f} {np.abs(embeddings - reference).max():>9.2e}")
+
+
+if __name__ == "__main__":
+    main()
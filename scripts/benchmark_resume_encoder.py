@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Benchmark the embedding backends against SentenceTransformer on PyTorch CPU.
+
+Builds resume-like texts shaped like the selector's enhanced text (a short
+metadata profile followed by up to 3000 characters of resume) and reports,
+for every backend: throughput in resumes/sec, and cosine agreement with the
+torch encoder (mean and minimum cosine between the two embeddings of the
+same text, and recall@k of nearest-neighbour searches over the corpus).
+
+The first ONNX run exports (and for onnx_int8 quantizes) the model; that
+one-off cost is reported separately as "load s".
+
+Usage:
+    python scripts/benchmark_resume_encoder.py [--resumes 500] [--batch-size 32] [--threads 4]
+                                               [--backends torch,onnx,onnx_int8]
+"""
+import os
+import sys
+import time
+import random
+import argparse
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from resume_encoder import ENCODER_BACKENDS, OnnxSentenceEncoder
+
+SKILLS = ["Python", "Django", "React", "SQL", "Verilog", "FPGA", "ROS", "Embedded C", "Docker", "Java",
+          "Machine Learning", "PyTorch", "Kubernetes", "MATLAB", "Signal Processing", "Computer Vision"]
+WORDS = ["designed", "implemented", "optimized", "led", "built", "tested", "deployed", "analysed", "team",
+         "project", "pipeline", "firmware", "dashboard", "robot", "sensor", "model", "service", "latency",
+         "throughput", "research", "internship", "university", "award", "publication", "course"]
+
+
+def synthetic_profiles(count: int, seed: int = 0):
+    """Enhanced texts of varied length, like the ones build_index embeds."""
+    rng = random.Random(seed)
+    profiles = []
+    for i in range(count):
+        skills = rng.sample(SKILLS, rng.randint(2, 8))
+        body = " ".join(rng.choice(WORDS + skills) for _ in range(rng.randint(40, 600)))
+        profiles.append(
+            f"Candidate Profile:\nName: Student {i}\nSkills: {', '.join(skills)}\n"
+            f"Experience: {rng.randint(0, 8)} years\nSummary: \n\nResume Content:\n{body[:3000]}"
+        )
+    return profiles
+
+
+def load_encoder(backend: str, model: str, batch_size: int, threads: int):
+    if backend == "torch":
+        import torch
+        from sentence_transformers import SentenceTransformer
+        torch.set_num_threads(threads)
+        return SentenceTransformer(model, device="cpu")
+    return OnnxSentenceEncoder(model, quantize=backend == "onnx_int8", batch_size=batch_size, threads=threads)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", default="BAAI/bge-base-en-v1.5")
+    parser.add_argument("--resumes", type=int, default=500)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--threads", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--backends", default=",".join(ENCODER_BACKENDS))
+    args = parser.parse_args()
+
+    texts = synthetic_profiles(args.resumes)
+    backends = args.backends.split(",")
+    if "torch" not in backends:
+        backends.insert(0, "torch")
+
+    reference = None
+    print(f"{args.resumes} resumes, model {args.model}, batch {args.batch_size}, {args.threads} thread(s)")
+    print(f"{'backend':<10} {'load s':>8} {'encode s':>9} {'resumes/s':>10} {'cos mean':>9} {'cos min':>8} {'recall@k':>9}")
+    for backend in backends:
+        started = time.perf_counter()
+        encoder = load_encoder(backend, args.model, args.batch_size, args.threads)
+        load_seconds = time.perf_counter() - started
+
+        encoder.encode(texts[:4], batch_size=args.batch_size)  # warm-up
+        started = time.perf_counter()
+        embeddings = np.asarray(encoder.encode(texts, batch_size=args.batch_size), dtype=np.float32)
+        encode_seconds = time.perf_counter() - started
+        embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+
+        if reference is None:
+            reference = embeddings
+        cosines = np.sum(reference * embeddings, axis=1)
+        queries = embeddings[:min(100, len(texts))]
+        expected = np.argsort(-(reference[:len(queries)] @ reference.T), axis=1)[:, :args.k]
+        found = np.argsort(-(queries @ embeddings.T), axis=1)[:, :args.k]
+        recall = np.mean([len(set(e) & set(f)) / args.k for e, f in zip(expected, found)])
+
+        print(f"{backend:<10} {load_seconds:>8.1f} {encode_seconds:>9.2f} {len(texts) / encode_seconds:>10.1f} "
+              f"{cosines.mean():>9.4f} {cosines.min():>8.4f} {recall:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Benchmark: PDF extraction backends and budgets, speed and text fidelity.
+
+Generates a synthetic corpus of multi-page resume PDFs, a share of whose
+pages are set in two columns, then extracts it with every backend of
+resume_extraction, with and without an extraction budget, and reports:
+
+    pages/s     pages of the corpus covered per second of extraction
+    recall      share of the reference words (as a multiset) that were extracted
+    order       difflib ratio between the extracted and the reference word sequences
+
+The reference is pdfplumber, the current extractor, under the same budget.
+
+Usage:
+    python scripts/benchmark_resume_extraction.py [--documents 50] [--pages 4] [--max-chars 4000]
+"""
+import os
+import sys
+import time
+import random
+import argparse
+import difflib
+import tempfile
+from collections import Counter
+from pathlib import Path
+from typing import List
+
+import pypdfium2
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from benchmark_resume_encoder import SKILLS, WORDS
+from resume_extraction import extract_pdf_text, extraction_backends
+from resume_selector_main_class import PDF_EXTRACT_SETTINGS
+
+LINES_PER_COLUMN = 48
+LINE_WORDS = 9
+
+
+def write_document(path: Path, pages: List[List[List[str]]]) -> None:
+    """Write a PDF whose pages each hold one or two columns of text lines."""
+    def escape(value: str) -> str:
+        return value.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+    page_refs = " ".join(f"{4 + 2 * i} 0 R" for i in range(len(pages)))
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        f"<< /Type /Pages /Kids [{page_refs}] /Count {len(pages)} >>",
+        "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    for i, columns in enumerate(pages):
+        x_positions = [50] if len(columns) == 1 else [40, 316]
+        stream = " ".join(
+            f"BT /F1 9 Tf 14 TL {x} 800 Td " + " ".join(f"({escape(line)}) Tj T*" for line in lines) + " ET"
+            for x, lines in zip(x_positions, columns)
+        )
+        objects.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] /Contents {5 + 2 * i} 0 R "
+                       f"/Resources << /Font << /F1 3 0 R >> >> >>")
+        objects.append(f"<< /Length {len(stream.encode('latin-1'))} >>\nstream\n{stream}\nendstream")
+
+    out = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n{body}\nendobj\n".encode("latin-1")
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode("latin-1")
+    out += b"".join(f"{offset:010d} 00000 n \n".encode("latin-1") for offset in offsets)
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode("latin-1")
+    path.write_bytes(out)
+
+
+def synthetic_corpus(workdir: Path, documents: int, pages: int, two_column_share: float, seed: int = 0) -> List[str]:
+    """Resume PDFs of 1..pages pages; returns their paths."""
+    rng = random.Random(seed)
+    paths = []
+    for i in range(documents):
+        skills = rng.sample(SKILLS, rng.randint(3, 8))
+
+        def line() -> str:
+            return " ".join(rng.choice(WORDS + skills) for _ in range(LINE_WORDS))
+
+        document = []
+        for number in range(rng.randint(1, pages)):
+            if rng.random() < two_column_share:
+                # Two narrow columns side by side, the layout fast extractors most often read out of order
+                columns = [[line()[:48] for _ in range(LINES_PER_COLUMN)] for _ in range(2)]
+            else:
+                columns = [[line() for _ in range(LINES_PER_COLUMN)]]
+            if number == 0:
+                columns[0][:2] = [f"Name: Student {i}", f"Skills: {', '.join(skills)}"]
+            document.append(columns)
+        path = workdir / f"STU{i:05d}.pdf"
+        write_document(path, document)
+        paths.append(str(path))
+    return paths
+
+
+def fidelity(text: str, reference: str):
+    words, reference_words = text.split(), reference.split()
+    if not reference_words:
+        return 1.0, 1.0
+    recall = sum((Counter(words) & Counter(reference_words)).values()) / len(reference_words)
+    order = difflib.SequenceMatcher(None, words, reference_words, autojunk=False).ratio()
+    return recall, order
+
+
+def run(paths: List[str], backend: str, max_chars, max_pages):
+    started = time.perf_counter()
+    texts = [extract_pdf_text(path, PDF_EXTRACT_SETTINGS, backend=backend, max_chars=max_chars, max_pages=max_pages)
+             for path in paths]
+    return texts, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--documents", type=int, default=50)
+    parser.add_argument("--pages", type=int, default=4, help="Maximum pages per document")
+    parser.add_argument("--two-column", type=float, default=0.25, help="Share of pages set in two columns")
+    parser.add_argument("--max-chars", type=int, default=4000, help="Character budget of the budgeted runs")
+    parser.add_argument("--max-pages", type=int, default=None, help="Page budget of the budgeted runs")
+    parser.add_argument("--backends", default=",".join(extraction_backends()))
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        paths = synthetic_corpus(Path(workdir), args.documents, args.pages, args.two_column)
+        total_pages = sum(len(pypdfium2.PdfDocument(path)) for path in paths)
+
+        backends = args.backends.split(",")
+        if "pdfplumber" in backends:
+            backends.remove("pdfplumber")
+        backends.insert(0, "pdfplumber")
+
+        print(f"{args.documents} documents, {total_pages} pages ({args.two_column:.0%} two-column)")
+        print(f"{'backend':<11} {'budget':<16} {'seconds':>8} {'pages/s':>9} {'speedup':>8} {'recall':>7} {'order':>7}")
+        for max_chars, max_pages in ((None, None), (args.max_chars, args.max_pages)):
+            budget = "none" if max_chars is None and max_pages is None else \
+                f"{max_chars or '-'} chars/{max_pages or '-'} pg"
+            reference, reference_seconds = None, None
+            for backend in backends:
+                texts, seconds = run(paths, backend, max_chars, max_pages)
+                if reference is None:
+                    reference, reference_seconds = texts, seconds
+                scores = [fidelity(text, expected) for text, expected in zip(texts, reference)]
+                recall = sum(score[0] for score in scores) / len(scores)
+                order = sum(score[1] for score in scores) / len(scores)
+                print(f"{backend:<11} {budget:<16} {seconds:>8.2f} {total_pages / seconds:>9.1f} "
+                      f"{reference_seconds / seconds:>7.1f}x {recall:>7.3f} {order:>7.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Benchmark the resume_index types against exact search.
+
+Generates synthetic bge-base sized (768-d, normalized, clustered) vectors and
+reports, for every index type: build time including training, serialized
+index size, memory taken by the stored vectors, single-query latency
+(p50/p95), and the ranking delta against the exact float32 index: recall@k,
+how often the top hit is unchanged, and the mean absolute difference of the
+top-k scores. ResumeSelector reranks the nearest ANN_RERANK_POOL hits of an
+approximate index, so recall@k of ivf_pq matters less than its size.
+
+Usage:
+    python scripts/benchmark_resume_index.py [--vectors 50000] [--queries 200] [--k 10]
+                                             [--types flat,sqfp16,sq8,ivf_flat,hnsw,ivf_pq]
+"""
+import os
+import sys
+import time
+import argparse
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import faiss
+
+from resume_index import INDEX_TYPES, index_type_of, make_index, vector_bytes
+
+
+def synthetic_vectors(count: int, dim: int, clusters: int, seed: int) -> np.ndarray:
+    """Normalized vectors scattered around random centres, like embeddings of similar resumes."""
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(clusters, dim)).astype("float32")
+    vectors = centers[rng.integers(0, clusters, count)] + 0.6 * rng.normal(size=(count, dim)).astype("float32")
+    faiss.normalize_L2(vectors)
+    return vectors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--vectors", type=int, default=50000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--dim", type=int, default=768)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--types", default=",".join(INDEX_TYPES))
+    parser.add_argument("--threads", type=int, default=1, help="FAISS threads while querying (1 = per-request latency)")
+    args = parser.parse_args()
+
+    build_threads = faiss.omp_get_max_threads()
+    vectors = synthetic_vectors(args.vectors, args.dim, clusters=max(10, args.vectors // 500), seed=0)
+    queries = synthetic_vectors(args.queries, args.dim, clusters=max(10, args.vectors // 500), seed=0)[:args.queries]
+    queries += 0.05 * np.random.default_rng(1).normal(size=queries.shape).astype("float32")
+    faiss.normalize_L2(queries)
+    ids = np.arange(args.vectors, dtype="int64")
+
+    exact_index = make_index("flat", args.dim, vectors, ids)
+    exact_scores, exact = exact_index.search(queries, args.k)
+    float32_mb = vector_bytes(exact_index) / 1e6
+
+    print(f"{args.vectors} vectors x {args.dim} dims, {args.queries} queries, k={args.k}, {args.threads} thread(s)")
+    print(f"{'type':<10} {'layout':<10} {'build s':>9} {'size MB':>9} {'vec MB':>8} {'saved':>6} "
+          f"{'p50 ms':>8} {'p95 ms':>8} {'recall@k':>9} {'top1 same':>10} {'score Δ':>8}")
+    for index_type in args.types.split(","):
+        faiss.omp_set_num_threads(build_threads)
+        started = time.perf_counter()
+        index = make_index(index_type, args.dim, vectors, ids)
+        build_seconds = time.perf_counter() - started
+        size_mb = faiss.serialize_index(index).nbytes / 1e6
+
+        faiss.omp_set_num_threads(args.threads)
+        latencies = []
+        scores = np.empty((args.queries, args.k), dtype="float32")
+        found = np.empty((args.queries, args.k), dtype="int64")
+        for i in range(args.queries):
+            started = time.perf_counter()
+            scores[i], found[i] = index.search(queries[i:i + 1], args.k)
+            latencies.append((time.perf_counter() - started) * 1000)
+
+        recall = np.mean([len(set(e) & set(f)) / args.k for e, f in zip(exact, found)])
+        top1_same = np.mean(exact[:, 0] == found[:, 0])
+        score_delta = np.mean(np.abs(scores - exact_scores))
+        vector_mb = vector_bytes(index) / 1e6
+
+        print(f"{index_type:<10} {index_type_of(index):<10} {build_seconds:>9.2f} {size_mb:>9.1f} {vector_mb:>8.1f} "
+              f"{1 - vector_mb / float32_mb:>6.0%} {np.percentile(latencies, 50):>8.3f} "
+              f"{np.percentile(latencies, 95):>8.3f} {recall:>9.3f} {top1_same:>10.3f} {score_delta:>8.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: BM25Index build time, memory and keyword query latency.
+
+Indexes N synthetic resume profiles (see benchmark_resume_encoder) with
+their skills, then times single-keyword and multi-term project queries over
+the whole corpus and reports p50/p99 latency and the size of the postings.
+
+Usage:
+    python scripts/benchmark_resume_lexical.py [--resumes 10000] [--queries 1000]
+"""
+import os
+import sys
+import time
+import random
+import argparse
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from benchmark_resume_encoder import SKILLS, synthetic_profiles
+from resume_lexical import BM25Index
+
+PROJECT_QUERIES = [
+    "Robotics project using ROS and Embedded C",
+    "Backend developer with Python, Django and SQL",
+    "FPGA design in Verilog for signal processing",
+    "Machine Learning research with PyTorch and Computer Vision",
+]
+
+
+def latency(index: BM25Index, queries, top_k: int):
+    timings = []
+    for query in queries:
+        started = time.perf_counter()
+        index.search(query, top_k)
+        timings.append(time.perf_counter() - started)
+    return np.percentile(timings, 50) * 1000, np.percentile(timings, 99) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--resumes", type=int, default=10000)
+    parser.add_argument("--queries", type=int, default=1000)
+    parser.add_argument("--top-k", type=int, default=100)
+    args = parser.parse_args()
+
+    profiles = synthetic_profiles(args.resumes)
+    index = BM25Index()
+    started = time.perf_counter()
+    for row, profile in enumerate(profiles):
+        skills = profile.split("Skills: ", 1)[1].split("\n", 1)[0].split(", ")
+        index.set_row(row, profile, skills)
+    ingest_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    offsets, rows, impacts = index._build()
+    build_seconds = time.perf_counter() - started
+    postings_mb = (offsets.nbytes + rows.nbytes + impacts.nbytes) / 2**20
+
+    rng = random.Random(0)
+    keyword_queries = [rng.choice(SKILLS) for _ in range(args.queries)]
+    project_queries = [rng.choice(PROJECT_QUERIES) for _ in range(args.queries)]
+
+    print(f"{args.resumes} resumes: ingest {ingest_seconds:.2f}s, postings build {build_seconds * 1000:.1f} ms, "
+          f"{len(rows)} postings ({postings_mb:.1f} MB)")
+    print(f"{'queries':<10} {'p50 ms':>8} {'p99 ms':>8}")
+    for name, queries in (("keyword", keyword_queries), ("project", project_queries)):
+        p50, p99 = latency(index, queries, args.top_k)
+        print(f"{name:<10} {p50:>8.3f} {p99:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
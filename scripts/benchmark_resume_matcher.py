@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: TermMatcher versus one substring check per vocabulary term.
+
+Builds a vocabulary of N distinct skill/title-like terms and times finding
+the terms mentioned in project descriptions, the per-query step of
+MetadataReranker, both with `term in description` over the vocabulary and
+with a single scan of the Aho-Corasick automaton.
+
+Usage:
+    python scripts/benchmark_resume_matcher.py [--vocab 1000,10000,50000] [--queries 200]
+"""
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from resume_matcher import TermMatcher
+
+BASE_TERMS = ["python", "django", "react", "sql", "verilog", "fpga", "ros", "embedded c", "docker", "java",
+              "machine learning", "pytorch", "kubernetes", "software intern", "backend developer",
+              "research assistant", "data analyst", "embedded engineer"]
+DESCRIPTIONS = [
+    "robotics project using ros and embedded c on a custom fpga board; python tooling is a plus",
+    "senior backend developer with python, django, sql and docker for a research dashboard",
+    "junior software intern for a react and sql dashboard, some java experience welcome",
+    "phd researcher in machine learning with pytorch and kubernetes-based training pipelines",
+]
+
+
+def vocabulary(size: int, seed: int = 0):
+    rng = random.Random(seed)
+    terms = list(BASE_TERMS)
+    while len(terms) < size:
+        terms.append(f"{rng.choice(BASE_TERMS)} {rng.randint(0, 10 ** 6)}")
+    return list(dict.fromkeys(terms))[:size]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--vocab", default="1000,10000,50000")
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    queries = [DESCRIPTIONS[i % len(DESCRIPTIONS)] for i in range(args.queries)]
+    print(f"{'terms':>7} {'build ms':>9} {'in-scan ms/q':>13} {'automaton ms/q':>15} {'speedup':>8}")
+    for size in (int(v) for v in args.vocab.split(",")):
+        terms = vocabulary(size)
+        started = time.perf_counter()
+        matcher = TermMatcher()
+        for term in terms:
+            matcher.add(term)
+        matcher.match("")
+        build_ms = (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        expected = [{i for i, term in enumerate(terms) if term in query} for query in queries]
+        scan_ms = (time.perf_counter() - started) * 1000 / len(queries)
+
+        started = time.perf_counter()
+        found = [matcher.match(query) for query in queries]
+        automaton_ms = (time.perf_counter() - started) * 1000 / len(queries)
+
+        assert found == expected
+        print(f"{size:>7} {build_ms:>9.1f} {scan_ms:>13.3f} {automaton_ms:>15.3f} {scan_ms / automaton_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
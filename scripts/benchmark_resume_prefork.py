@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Benchmark the pre-forked worker pool against independently started workers.
+
+Both layouts run N worker processes serving "search" requests over Unix
+sockets against the same synthetic bundle (see benchmark_resume_startup):
+
+  * independent: N processes that each load the model and the bundle
+  * prefork: one process loads them, then serve_prefork() forks N children
+    that share the pages copy-on-write
+
+For each layout it reports per-worker RSS and PSS after the requests
+(PSS splits shared pages between the processes sharing them, so its sum
+is the real footprint) and the aggregate throughput of --clients
+concurrent connections sending --requests searches each.
+
+Usage:
+    python scripts/benchmark_resume_prefork.py [--workers 4] [--clients 8] [--requests 50]
+                                               [--resumes 500] [--model BAAI/bge-base-en-v1.5]
+"""
+import os
+import sys
+import json
+import time
+import signal
+import socket
+import argparse
+import tempfile
+import threading
+from pathlib import Path
+from typing import List
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from benchmark_resume_startup import build_bundle
+from resume_encoder import limit_threads
+from resume_selector_main_class import ResumeSelector
+from resume_selector_worker import ShortlistWorker, process_memory, serve_prefork, serve_socket
+
+QUERIES = [
+    "Robotics project using ROS and Embedded C",
+    "Backend developer with Python, Django and SQL",
+    "FPGA design in Verilog for signal processing",
+    "Machine Learning research with PyTorch and Computer Vision",
+]
+
+
+def load_worker(model: str, bundle_dir: str) -> ShortlistWorker:
+    selector = ResumeSelector(api_key="unused", embedding_model=model, quiet=True)
+    selector.warm_up()
+    assert selector.load_bundle(bundle_dir)
+    return ShortlistWorker(selector)
+
+
+def fork(target) -> int:
+    pid = os.fork()
+    if pid == 0:
+        try:
+            target()
+        finally:
+            os._exit(0)
+    return pid
+
+
+def wait_for_socket(path: str) -> None:
+    while True:
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+                probe.connect(path)
+                return
+        except OSError:
+            time.sleep(0.1)
+
+
+def run_clients(socket_paths: List[str], clients: int, requests: int) -> float:
+    """Send searches from concurrent connections; returns requests per second."""
+    def client(number: int) -> None:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+            connection.connect(socket_paths[number % len(socket_paths)])
+            reader = connection.makefile("r", encoding="utf-8")
+            for i in range(requests):
+                request = {"id": i, "cmd": "search", "description": QUERIES[(number + i) % len(QUERIES)], "top_k": 5}
+                connection.sendall((json.dumps(request) + "\n").encode("utf-8"))
+                assert json.loads(reader.readline())["ok"]
+
+    threads = [threading.Thread(target=client, args=(number,)) for number in range(clients)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return clients * requests / (time.perf_counter() - started)
+
+
+def children_of(pid: int) -> List[int]:
+    with open(f"/proc/{pid}/task/{pid}/children") as f:
+        return [int(child) for child in f.read().split()]
+
+
+def report(layout: str, pids: List[int], throughput: float) -> None:
+    memory = [process_memory(pid) for pid in pids]
+    for pid, usage in zip(pids, memory):
+        print(f"{layout:<12} {pid:>8} {usage['rss_bytes'] / 2**20:>10.1f} {usage['pss_bytes'] / 2**20:>10.1f}")
+    total_rss = sum(usage["rss_bytes"] for usage in memory) / 2**20
+    total_pss = sum(usage["pss_bytes"] for usage in memory) / 2**20
+    print(f"{layout:<12} {'total':>8} {total_rss:>10.1f} {total_pss:>10.1f}   {throughput:.1f} searches/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", default="BAAI/bge-base-en-v1.5")
+    parser.add_argument("--resumes", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--threads-per-worker", type=int, default=None)
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=50)
+    args = parser.parse_args()
+    threads = args.threads_per_worker or max(1, (os.cpu_count() or 1) // args.workers)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        bundle_dir = build_bundle(Path(workdir), args.resumes, args.model)
+        print(f"{args.workers} workers x {threads} thread(s), {args.clients} clients x {args.requests} searches, "
+              f"{args.resumes} resumes, model {args.model}")
+        print(f"{'layout':<12} {'pid':>8} {'RSS MB':>10} {'PSS MB':>10}")
+
+        # Independent workers: every process loads its own model
+        paths = [os.path.join(workdir, f"independent-{i}.sock") for i in range(args.workers)]
+
+        def independent(path: str):
+            limit_threads(threads)
+            serve_socket(load_worker(args.model, bundle_dir), path)
+
+        pids = [fork(lambda path=path: independent(path)) for path in paths]
+        for path in paths:
+            wait_for_socket(path)
+        throughput = run_clients(paths, args.clients, args.requests)
+        report("independent", pids, throughput)
+        for pid in pids:
+            os.kill(pid, signal.SIGKILL)
+            os.waitpid(pid, 0)
+
+        # Pre-forked workers: one model, shared copy-on-write
+        path = os.path.join(workdir, "prefork.sock")
+        server = fork(lambda: serve_prefork(load_worker(args.model, bundle_dir), path, args.workers, threads))
+        wait_for_socket(path)
+        throughput = run_clients([path], args.clients, args.requests)
+        report("prefork", children_of(server), throughput)
+        os.kill(server, signal.SIGTERM)
+        os.waitpid(server, 0)
+
+
+if __name__ == "__main__":
+    main()
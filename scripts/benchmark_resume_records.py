@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: ResumeRecordStore versus scanning raw metadata.
+
+Builds synthetic metadata for N resumes (10,000 by default) and times the
+three hot paths the record store replaced:
+
+  * path -> id lookups (previously a linear scan of resume_metadata per hit)
+  * building the texts to embed (previously re-normalizing the raw LLM JSON)
+  * metadata reranking of every resume (previously re-normalizing per call),
+    per record and with the vectorized MetadataReranker
+
+Usage:
+    python scripts/benchmark_resume_records.py [--resumes 10000] [--lookups 1000]
+"""
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+
+from resume_records import ResumeRecord, ResumeRecordStore, normalize_list_items, normalize_skills
+from resume_rerank import MetadataReranker
+
+SKILLS = ["Python", "JavaScript", "React", "Django", "SQL", "Verilog", "ROS", "Machine Learning",
+          "Embedded C", "Docker", "Java", "FPGA", "Kubernetes", "Go", "Rust", "TensorFlow"]
+TITLES = ["Software Intern", "Backend Developer", "Data Analyst", "Embedded Engineer", "Research Assistant"]
+DEGREES = ["Bachelor of Engineering", "Master of Technology", "PhD in Computer Science"]
+QUERY = "Senior backend developer with Python, Django, SQL and Docker; Master degree preferred"
+
+
+def synthetic_metadata(count: int, seed: int = 0):
+    rng = random.Random(seed)
+    entries = {}
+    for i in range(count):
+        # Mix the shapes the LLM actually returns: plain strings, dicts and delimited strings
+        skills = rng.sample(SKILLS, 6)
+        if i % 3 == 1:
+            skills = [{"skill": skill, "level": "advanced"} for skill in skills]
+        elif i % 3 == 2:
+            skills = ", ".join(skills)
+        entries[f"{i:08x}"] = {
+            "file_name": f"STU{i:05d}.pdf",
+            "file_path": f"/data/project-applications/proj/STU{i:05d}.pdf",
+            "text": "",
+            "metadata": {
+                "name": f"Student {i}",
+                "skills": skills,
+                "experience_years": rng.randint(0, 10),
+                "education": [{"degree": rng.choice(DEGREES)}],
+                "job_titles": rng.sample(TITLES, 2),
+                "summary": "",
+            },
+        }
+    return entries
+
+
+def legacy_metadata_score(query_lower: str, metadata) -> float:
+    """calculate_metadata_similarity as it was before records were normalized at ingest."""
+    score = 0.0
+    skills = normalize_skills(metadata.get("skills", []))
+    score += min(0.4, sum(1 for skill in skills if skill.lower() in query_lower) * 0.05)
+    experience_years = metadata.get("experience_years", 0)
+    if not isinstance(experience_years, (int, float)):
+        experience_years = 0
+    if "senior" in query_lower and experience_years >= 5:
+        score += 0.2
+    elif "junior" in query_lower and experience_years < 5:
+        score += 0.2
+    for degree in normalize_list_items(metadata.get("education", [])):
+        if "phd" in query_lower and "phd" in degree.lower():
+            score += 0.1
+        elif "master" in query_lower and "master" in degree.lower():
+            score += 0.1
+    for title in normalize_list_items(metadata.get("job_titles", [])):
+        if title.lower() in query_lower:
+            score += 0.05
+    return min(1.0, score)
+
+
+def record_metadata_score(query_lower: str, record: ResumeRecord) -> float:
+    score = min(0.4, sum(1 for skill in record.skills_lower if skill in query_lower) * 0.05)
+    if "senior" in query_lower and record.experience_years >= 5:
+        score += 0.2
+    elif "junior" in query_lower and record.experience_years < 5:
+        score += 0.2
+    for degree in record.education_lower:
+        if "phd" in query_lower and "phd" in degree:
+            score += 0.1
+        elif "master" in query_lower and "master" in degree:
+            score += 0.1
+    for title in record.job_titles_lower:
+        if title in query_lower:
+            score += 0.05
+    return min(1.0, score)
+
+
+def timed(fn, repeat: int = 3) -> float:
+    """Best wall time of several runs, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def report(label: str, before: float, after: float) -> None:
+    print(f"{label:<34} {before * 1000:>10.2f} ms {after * 1000:>10.2f} ms {before / max(after, 1e-9):>9.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--resumes", type=int, default=10000)
+    parser.add_argument("--lookups", type=int, default=1000)
+    args = parser.parse_args()
+
+    entries = synthetic_metadata(args.resumes)
+    file_ids = list(entries)
+    paths = [entries[file_id]["file_path"] for file_id in random.Random(1).sample(file_ids, args.lookups)]
+    query_lower = QUERY.lower()
+
+    started = time.perf_counter()
+    store = ResumeRecordStore()
+    for file_id, entry in entries.items():
+        store.add(ResumeRecord.from_entry(file_id, entry))
+    ingest = time.perf_counter() - started
+    records = [store.get(file_id) for file_id in file_ids]
+
+    def legacy_lookup():
+        for path in paths:
+            next(fid for fid, entry in entries.items() if entry["file_path"] == path)
+
+    def store_lookup():
+        for path in paths:
+            store.file_id_for_path(path)
+
+    def legacy_profiles():
+        for entry in entries.values():
+            ", ".join(normalize_skills(entry["metadata"].get("skills", [])))
+
+    def store_profiles():
+        for record in records:
+            ", ".join(record.skills)
+
+    legacy_scores = [legacy_metadata_score(query_lower, entries[fid]["metadata"]) for fid in file_ids]
+    store_scores = [record_metadata_score(query_lower, record) for record in records]
+    assert legacy_scores == store_scores, "record scores must match the legacy scorer"
+
+    reranker = MetadataReranker()
+    for file_id in file_ids:
+        reranker.set_row(store.row(file_id), store.get(file_id))
+    rows = np.array([store.row(file_id) for file_id in file_ids])
+    assert np.allclose(reranker.score(QUERY, rows), legacy_scores), "vectorized scores must match the legacy scorer"
+
+    print(f"{args.resumes} resumes, {args.lookups} path lookups; one-off normalization at ingest: {ingest * 1000:.1f} ms")
+    print(f"{'':<34} {'before':>13} {'after':>13} {'speedup':>10}")
+    report(f"path -> id ({args.lookups} lookups)", timed(legacy_lookup), timed(store_lookup))
+    report("skills for embedding profiles", timed(legacy_profiles), timed(store_profiles))
+    report("metadata rerank (all resumes)",
+           timed(lambda: [legacy_metadata_score(query_lower, entries[fid]["metadata"]) for fid in file_ids]),
+           timed(lambda: [record_metadata_score(query_lower, record) for record in records]))
+    report("metadata rerank, vectorized",
+           timed(lambda: [legacy_metadata_score(query_lower, entries[fid]["metadata"]) for fid in file_ids]),
+           timed(lambda: reranker.score(QUERY)))
+
+
+if __name__ == "__main__":
+    main()
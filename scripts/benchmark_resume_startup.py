@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Benchmark cold-start latency of the resume selector.
+
+Two measurements, each in a fresh interpreter so nothing is already imported:
+
+  * import breakdown: `python -X importtime -c "import resume_selector_main_class"`,
+    reporting the total and the top-level packages with the largest
+    cumulative import time. Anything heavy showing up here means a module
+    lost its lazy import (see resume_lazy).
+  * time to first search: import, construct a ResumeSelector, load a bundle
+    of synthetic resumes and run one search, with the model loaded eagerly
+    by warm_up() (the worker default) and on first use (--fast-start).
+
+The bundle is built once up front from generated PDFs; metadata is
+synthetic, so no Mistral API key is needed. The time-to-first-search part
+needs the embedding model; pass --import-only to skip it.
+
+Usage:
+    python scripts/benchmark_resume_startup.py [--resumes 200] [--model BAAI/bge-base-en-v1.5]
+                                               [--top 15] [--import-only]
+"""
+import os
+import sys
+import json
+import random
+import argparse
+import tempfile
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(SCRIPTS_DIR)
+
+QUERY = "Robotics project using ROS and Embedded C"
+SKILLS = ["Python", "Django", "React", "SQL", "Verilog", "FPGA", "ROS", "Embedded C", "Docker", "Java",
+          "Machine Learning", "PyTorch", "Kubernetes", "MATLAB", "Signal Processing", "Computer Vision"]
+
+# Runs in the child interpreter; prints one JSON line of timings
+FIRST_SEARCH_SCRIPT = """
+import json, sys, time
+started = time.perf_counter()
+from resume_selector_main_class import ResumeSelector
+imported = time.perf_counter()
+selector = ResumeSelector(api_key="unused", embedding_model=sys.argv[1], quiet=True)
+constructed = time.perf_counter()
+if sys.argv[3] == "eager":
+    selector.warm_up()
+warmed = time.perf_counter()
+assert selector.load_bundle(sys.argv[2])
+loaded = time.perf_counter()
+selector.search_resumes(%r, top_k=5)
+searched = time.perf_counter()
+print(json.dumps({"import": imported - started, "construct": constructed - imported, "warm_up": warmed - constructed,
+                  "load_bundle": loaded - warmed, "first_search": searched - loaded, "total": searched - started}))
+""" % QUERY
+
+
+def import_breakdown() -> Tuple[float, List[Tuple[str, float]]]:
+    """Total import time of the selector and cumulative seconds per top-level package."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import resume_selector_main_class"],
+        cwd=SCRIPTS_DIR, capture_output=True, text=True, check=True
+    )
+    packages: Dict[str, float] = {}
+    for line in result.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package", indented by nesting depth
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        name = name.strip()
+        if "." not in name:
+            # A package's own line is printed once, where it is first imported, and covers its submodules
+            packages[name] = int(cumulative) / 1e6
+    total = packages.pop("resume_selector_main_class", 0.0)
+    return total, sorted(packages.items(), key=lambda item: -item[1])
+
+
+def write_pdf(path: Path, lines: List[str]) -> None:
+    """Write a minimal single-page PDF containing the given text lines."""
+    escaped = [line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)") for line in lines]
+    stream = "BT /F1 11 Tf 14 TL 50 780 Td " + " ".join(f"({line}) Tj T*" for line in escaped) + " ET"
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        "<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] /Contents 4 0 R /Resources << /Font << /F1 5 0 R >> >> >>",
+        f"<< /Length {len(stream.encode('latin-1'))} >>\nstream\n{stream}\nendstream",
+        "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    out = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n{body}\nendobj\n".encode("latin-1")
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode("latin-1")
+    out += b"".join(f"{offset:010d} 00000 n \n".encode("latin-1") for offset in offsets)
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode("latin-1")
+    path.write_bytes(out)
+
+
+def build_bundle(workdir: Path, count: int, model: str) -> str:
+    """Index generated PDFs with synthetic metadata and save them as a bundle."""
+    from resume_selector_main_class import ResumeSelector
+
+    class OfflineSelector(ResumeSelector):
+        def extract_metadata_many(self, texts, *args, on_result=None, **kwargs):
+            results = []
+            for position, text in enumerate(texts):
+                skills = [skill for skill in SKILLS if skill in text]
+                results.append({"name": text.splitlines()[0], "skills": skills, "experience_years": 3,
+                                "education": [], "job_titles": [], "summary": ""})
+                if on_result:
+                    on_result(position, results[-1])
+            return results
+
+    rng = random.Random(0)
+    folder = workdir / "resumes"
+    folder.mkdir()
+    for i in range(count):
+        skills = rng.sample(SKILLS, 4)
+        write_pdf(folder / f"STU{i:05d}.pdf", [f"Name: Student {i}", f"Skills: {', '.join(skills)}",
+                                                f"{rng.randint(0, 8)} years building projects with {skills[0]}"])
+
+    bundle_dir = str(workdir / "bundle")
+    selector = OfflineSelector(api_key="unused", embedding_model=model, quiet=True, extraction_workers=1)
+    assert selector.process_resumes(str(folder)) and selector.save_bundle(bundle_dir, str(folder))
+    return bundle_dir
+
+
+def first_search(model: str, bundle_dir: str, mode: str) -> Dict[str, float]:
+    result = subprocess.run(
+        [sys.executable, "-c", FIRST_SEARCH_SCRIPT, model, bundle_dir, mode],
+        cwd=SCRIPTS_DIR, capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", default="BAAI/bge-base-en-v1.5")
+    parser.add_argument("--resumes", type=int, default=200)
+    parser.add_argument("--top", type=int, default=15, help="Packages to list in the import breakdown")
+    parser.add_argument("--import-only", action="store_true", help="Skip the time-to-first-search runs")
+    args = parser.parse_args()
+
+    total, packages = import_breakdown()
+    print(f"import resume_selector_main_class: {total * 1000:.0f} ms")
+    print(f"{'package':<28} {'cumulative ms':>14}")
+    for name, seconds in packages[:args.top]:
+        print(f"{name:<28} {seconds * 1000:>14.1f}")
+    if args.import_only:
+        return
+
+    with tempfile.TemporaryDirectory() as workdir:
+        bundle_dir = build_bundle(Path(workdir), args.resumes, args.model)
+        print(f"\ntime to first search, {args.resumes} resumes, model {args.model} (seconds)")
+        columns = ["import", "construct", "warm_up", "load_bundle", "first_search", "total"]
+        print(f"{'mode':<12} " + " ".join(f"{column:>12}" for column in columns))
+        for mode in ("eager", "fast-start"):
+            timings = first_search(args.model, bundle_dir, mode)
+            print(f"{mode:<12} " + " ".join(f"{timings[column]:>12.2f}" for column in columns))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Benchmark the memory cost of resume texts in normal and low-memory mode.
+
+Builds synthetic resume texts and compares, for a list of str (normal mode)
+and a DiskTextList (low-memory mode): Python heap held by the texts and their
+metadata copies, time to read every excerpt used for embedding, and the
+JSON size of one page of search results.
+
+Usage:
+    python scripts/benchmark_resume_texts.py [--resumes 5000] [--chars 8000] [--top-k 50]
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from resume_texts import DiskTextList
+
+WORDS = ["python", "embedded", "robotics", "django", "verilog", "research", "intern", "design",
+         "developer", "machine", "learning", "project", "systems", "data", "team", "built"]
+
+
+def synthetic_texts(count: int, chars: int, seed: int = 0):
+    rng = random.Random(seed)
+    for _ in range(count):
+        words = []
+        size = 0
+        while size < chars:
+            word = rng.choice(WORDS)
+            words.append(word)
+            size += len(word) + 1
+        yield " ".join(words)[:chars]
+
+
+def measure(low_memory: bool, args) -> dict:
+    tracemalloc.start()
+    texts = DiskTextList() if low_memory else []
+    entries = []
+    for text in synthetic_texts(args.resumes, args.chars):
+        texts.append(text)
+        # Normal mode also keeps a 2000 character copy in each metadata entry
+        entries.append({} if low_memory else {"text": text[:2000] + "..."})
+    heap_mb = tracemalloc.get_traced_memory()[0] / 1e6
+    tracemalloc.stop()
+
+    started = time.perf_counter()
+    for position in range(len(texts)):
+        texts.excerpt(position, 3000) if low_memory else texts[position][:3000]
+    excerpt_ms = (time.perf_counter() - started) * 1000
+
+    page = [
+        {"id": f"{position:08x}", "excerpt": texts.excerpt(position, 500)} if low_memory
+        else {"id": f"{position:08x}", "text": texts[position]}
+        for position in range(min(args.top_k, len(texts)))
+    ]
+    return {"heap_mb": heap_mb, "excerpt_ms": excerpt_ms, "payload_kb": len(json.dumps(page)) / 1e3}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--resumes", type=int, default=5000)
+    parser.add_argument("--chars", type=int, default=8000)
+    parser.add_argument("--top-k", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{args.resumes} resumes x {args.chars} chars, {args.top_k} results per page")
+    print(f"{'mode':<12} {'heap MB':>9} {'excerpts ms':>12} {'page KB':>9}")
+    for low_memory in (False, True):
+        stats = measure(low_memory, args)
+        print(f"{'low_memory' if low_memory else 'normal':<12} {stats['heap_mb']:>9.1f} "
+              f"{stats['excerpt_ms']:>12.1f} {stats['payload_kb']:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
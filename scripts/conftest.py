@@ -0,0 +1,212 @@
+"""
+Shared pytest fixtures for the resume selector tests.
+
+The real embedding model is downloaded from HuggingFace and the LLM calls go to
+Mistral, neither of which is available to unit tests. These fixtures swap both
+for small deterministic stand-ins so the indexing, caching and ranking logic
+can be exercised offline against real PDFs.
+"""
+import os
+import sys
+import json
+import re
+import zlib
+import asyncio
+from pathlib import Path
+from typing import Dict, List
+
+import httpx
+import numpy as np
+import pytest
+from mistralai import models
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import resume_selector_main_class
+
+KNOWN_SKILLS = [
+    "Python", "JavaScript", "React", "Django", "SQL", "Verilog", "ROS",
+    "Machine Learning", "Embedded C", "Docker", "Java", "FPGA",
+]
+
+
+class FakeSentenceTransformer:
+    """Deterministic bag-of-words hashing encoder with the SentenceTransformer surface we use."""
+
+    dim = 64
+
+    def __init__(self, model_name: str = "fake-model", *args, **kwargs):
+        self.model_name = model_name
+        self.encode_calls = 0
+        self.encoded_texts = 0
+
+    def get_sentence_embedding_dimension(self) -> int:
+        return self.dim
+
+    def encode(self, texts, show_progress_bar: bool = False, batch_size: int = 32, **kwargs):
+        self.encode_calls += 1
+        self.encoded_texts += len(texts)
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for token in re.findall(r"[a-z0-9+#]+", text.lower()):
+                vectors[row, zlib.crc32(token.encode("utf-8")) % self.dim] += 1.0
+        return vectors
+
+
+class _Message:
+    def __init__(self, content: str):
+        self.content = content
+
+
+class _Choice:
+    def __init__(self, content: str):
+        self.message = _Message(content)
+
+
+class _Response:
+    def __init__(self, content: str):
+        self.choices = [_Choice(content)]
+
+
+class _FakeChat:
+    def __init__(self, client: "FakeMistral"):
+        self.client = client
+
+    def complete(self, model: str, messages: List[Dict[str, str]], **kwargs):
+        self.client.calls += 1
+        return self._respond(messages[0]["content"])
+
+    async def complete_async(self, model: str, messages: List[Dict[str, str]], **kwargs):
+        client = self.client
+        # Like mistralai's pooled httpx.AsyncClient, the fake is bound to the loop of its first request
+        loop = asyncio.get_running_loop()
+        if client.loop is None:
+            client.loop = loop
+        elif client.loop is not loop:
+            raise RuntimeError("Event loop is closed")
+        client.calls += 1
+        client.in_flight += 1
+        client.max_in_flight = max(client.max_in_flight, client.in_flight)
+        try:
+            await asyncio.sleep(client.delay)
+            if client.rate_limited > 0:
+                client.rate_limited -= 1
+                raise models.SDKError("rate limited", httpx.Response(429, headers={"Retry-After": "0.01"}))
+            return self._respond(messages[0]["content"])
+        finally:
+            client.in_flight -= 1
+
+    def _respond(self, prompt: str):
+        if self.client.fail:
+            raise RuntimeError("LLM unavailable")
+        if "extract structured metadata" in prompt:
+            return _Response(json.dumps(fake_metadata_for(prompt)))
+        name = re.search(r"Name: (.*)", prompt).group(1).strip()
+        return _Response(json.dumps({
+            "name": name,
+            "skills": [],
+            "reasons": [f"{name} matches the project"],
+            "score": 0.0,
+        }))
+
+
+class FakeMistral:
+    """Offline Mistral client that derives metadata from the prompt text."""
+
+    def __init__(self, api_key: str = "", *args, **kwargs):
+        self.api_key = api_key
+        self.calls = 0
+        self.fail = False
+        self.delay = 0.0
+        self.rate_limited = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.loop = None
+        self.chat = _FakeChat(self)
+
+
+def fake_metadata_for(text: str) -> Dict:
+    """Metadata the fake LLM returns: the first 'Name:' line plus every known skill mentioned."""
+    name_match = re.search(r"Name: (.*)", text)
+    years_match = re.search(r"(\d+) years", text)
+    return {
+        "name": name_match.group(1).strip() if name_match else "Unknown",
+        "email": "",
+        "phone": "",
+        "skills": [skill for skill in KNOWN_SKILLS if skill.lower() in text.lower()],
+        "experience_years": float(years_match.group(1)) if years_match else 0.0,
+        "education": ["Master of Technology"] if "Master" in text else ["Bachelor of Engineering"],
+        "job_titles": ["Software Intern"] if "Intern" in text else [],
+        "summary": "",
+    }
+
+
+def write_pdf(path: Path, lines: List[str]) -> Path:
+    """Write a minimal single-page PDF containing the given text lines."""
+    return write_pages_pdf(path, [lines])
+
+
+def write_pages_pdf(path: Path, pages: List[List[str]]) -> Path:
+    """Write a minimal PDF with one page per list of text lines."""
+    def escape(value: str) -> str:
+        return value.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+    # Objects 1-3 are the catalog, page tree and font; each page is followed by its content stream
+    page_refs = " ".join(f"{4 + 2 * i} 0 R" for i in range(len(pages)))
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        f"<< /Type /Pages /Kids [{page_refs}] /Count {len(pages)} >>",
+        "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    for i, lines in enumerate(pages):
+        stream = "BT /F1 11 Tf 14 TL 50 780 Td " + " ".join(f"({escape(line)}) Tj T*" for line in lines) + " ET"
+        objects.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] /Contents {5 + 2 * i} 0 R "
+                       f"/Resources << /Font << /F1 3 0 R >> >> >>")
+        objects.append(f"<< /Length {len(stream.encode('latin-1'))} >>\nstream\n{stream}\nendstream")
+
+    out = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n{body}\nendobj\n".encode("latin-1")
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode("latin-1")
+    for offset in offsets:
+        out += f"{offset:010d} 00000 n \n".encode("latin-1")
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode("latin-1")
+
+    path.write_bytes(out)
+    return path
+
+
+SAMPLE_RESUMES = {
+    "STU001_alice.pdf": ["Name: Alice Rao", "Software Intern with 2 years of Python and Django", "Built React dashboards backed by SQL"],
+    "STU002_bala.pdf": ["Name: Bala Krishnan", "Embedded engineer, 6 years of Verilog and FPGA design", "Master of Technology in VLSI"],
+    "STU003_chitra.pdf": ["Name: Chitra Nair", "Robotics developer using ROS and Embedded C", "3 years of Python for Machine Learning"],
+    "STU004_dev.pdf": ["Name: Dev Patel", "Backend developer, 4 years of Java and Docker", "Some JavaScript and SQL"],
+    "STU005_esha.pdf": ["Name: Esha Menon", "Data science Intern, Python and Machine Learning", "1 years of SQL reporting"],
+}
+
+
+@pytest.fixture
+def resume_folder(tmp_path: Path) -> Path:
+    """A project-applications style folder holding a handful of synthetic resumes."""
+    folder = tmp_path / "project-applications" / "proj123"
+    folder.mkdir(parents=True)
+    for file_name, lines in SAMPLE_RESUMES.items():
+        write_pdf(folder / file_name, lines)
+    return folder
+
+
+@pytest.fixture
+def selector_factory(monkeypatch):
+    """Build ResumeSelector instances backed by the fake encoder and fake LLM."""
+    monkeypatch.setattr(resume_selector_main_class, "SentenceTransformer", FakeSentenceTransformer)
+    monkeypatch.setattr(resume_selector_main_class, "Mistral", FakeMistral)
+
+    def factory(**kwargs):
+        kwargs.setdefault("api_key", "test_key")
+        kwargs.setdefault("quiet", True)
+        return resume_selector_main_class.ResumeSelector(**kwargs)
+
+    return factory
@@ -28,10 +28,10 @@ echo Setting up Python environment...
 %VENV_PYTHON% -m pip install --upgrade pip
 
 echo Installing AI packages...
-%VENV_PYTHON% -m pip install numpy sentence-transformers faiss-cpu pdfplumber mistralai python-dotenv
+%VENV_PYTHON% -m pip install numpy scipy sentence-transformers faiss-cpu pdfplumber pypdfium2 mistralai python-dotenv
 
 echo Testing installation...
-%VENV_PYTHON% -c "import numpy, sentence_transformers, faiss, pdfplumber, mistralai; print('✅ All packages installed successfully!')"
+%VENV_PYTHON% -c "import numpy, scipy, sentence_transformers, faiss, pdfplumber, pypdfium2, mistralai; print('✅ All packages installed successfully!')"
 
 echo Done! You can now use the AI shortlist feature.
 pause
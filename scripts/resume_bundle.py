@@ -0,0 +1,289 @@
+"""
+On-disk index bundles for ResumeSelector.
+
+A bundle is a directory holding everything a selector builds for one project
+folder, so a later process can warm-start without re-extracting, re-analysing
+or re-embedding anything:
+
+    manifest.json               format version, model, ids, and the fingerprint of the source folder
+    <generation>/index.faiss    the FAISS index (any resume_index type), written with faiss.write_index
+    <generation>/records.jsonl  one JSON record (file name/path, truncated text, LLM metadata) per resume
+    <generation>/texts.bin      full resume texts as concatenated UTF-8
+
+The manifest stores byte offsets into records.jsonl and texts.bin, so loading
+only reads the manifest and memory-maps the index; records and texts are
+decoded on first access. Each save writes a new generation directory and then
+swaps the manifest, so readers always see one consistent generation. Saves
+to the same bundle hold an exclusive lock on its .lock file (pre-forked
+workers may save bundles/global concurrently), so one writer's cleanup never
+deletes a generation another writer is still filling.
+"""
+import os
+import json
+import mmap
+import time
+import shutil
+from collections.abc import MutableMapping, MutableSequence
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union
+
+from resume_index import supports_mmap
+from resume_lazy import LazyModule
+from resume_texts import DiskTextList
+
+faiss = LazyModule("faiss")
+
+BUNDLE_FORMAT_VERSION = 1
+
+MANIFEST_FILE = "manifest.json"
+INDEX_FILE = "index.faiss"
+RECORDS_FILE = "records.jsonl"
+TEXTS_FILE = "texts.bin"
+LOCK_FILE = ".lock"
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+def folder_fingerprint(folder: str) -> Dict[str, List[int]]:
+    """
+    Cheap change detector for a resume folder.
+
+    Args:
+        folder (str): Folder containing PDF resumes
+
+    Returns:
+        Dict[str, List[int]]: File name -> [size, mtime_ns] for every PDF
+    """
+    fingerprint = {}
+    for pdf_file in sorted(Path(folder).glob("*.pdf")):
+        stat = pdf_file.stat()
+        fingerprint[pdf_file.name] = [stat.st_size, stat.st_mtime_ns]
+    return fingerprint
+
+
+class _MappedFile:
+    """Read-only memory map of a file, tolerant of empty files."""
+
+    def __init__(self, path: str):
+        self._file = open(path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+
+    def read(self, start: int, end: int) -> bytes:
+        return self._map[start:end]
+
+
+class LazyTextList(MutableSequence):
+    """
+    List of resume texts whose entries may still live in a mapped texts.bin.
+
+    Unloaded entries are stored as (start, end) byte ranges and decoded on
+    access. Appends, assignments and deletions work like a normal list.
+    """
+
+    def __init__(self, blob: _MappedFile, ranges: List[List[int]]):
+        self._blob = blob
+        self._items: List[Union[str, tuple]] = [tuple(r) for r in ranges]
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self[i] for i in range(*position.indices(len(self._items)))]
+        item = self._items[position]
+        if isinstance(item, tuple):
+            item = self._blob.read(*item).decode("utf-8")
+            self._items[position] = item
+        return item
+
+    def __setitem__(self, position, value):
+        self._items[position] = value
+
+    def __delitem__(self, position):
+        del self._items[position]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def insert(self, position, value):
+        self._items.insert(position, value)
+
+    def clear(self):
+        self._items.clear()
+
+
+class LazyRecordMap(MutableMapping):
+    """
+    file_id -> metadata record mapping backed by a mapped records.jsonl.
+
+    Records are parsed from JSON the first time they are looked up; new or
+    replaced records are held in memory like a normal dict. Iteration order is
+    the order of the bundle, followed by insertions.
+    """
+
+    def __init__(self, blob: _MappedFile, ranges: Dict[str, List[int]]):
+        self._blob = blob
+        self._items: Dict[str, Any] = {file_id: tuple(r) for file_id, r in ranges.items()}
+
+    def __getitem__(self, file_id: str) -> Dict[str, Any]:
+        item = self._items[file_id]
+        if isinstance(item, tuple):
+            item = json.loads(self._blob.read(*item))
+            self._items[file_id] = item
+        return item
+
+    def __setitem__(self, file_id: str, value: Dict[str, Any]):
+        self._items[file_id] = value
+
+    def __delitem__(self, file_id: str):
+        del self._items[file_id]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, file_id) -> bool:
+        return file_id in self._items
+
+    def clear(self):
+        self._items.clear()
+
+
+@contextmanager
+def _bundle_lock(bundle: Path):
+    """Hold the bundle's exclusive writer lock, blocking until it is free."""
+    bundle.mkdir(parents=True, exist_ok=True)
+    with open(bundle / LOCK_FILE, "a+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    # LK_LOCK gives up after about 10 seconds; keep waiting
+                    continue
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def write_bundle(bundle_dir: str, index, file_ids: List[str], index_ids: List[int], texts: Sequence[str],
+                 records: List[Dict[str, Any]], manifest_extra: Dict[str, Any]) -> None:
+    """
+    Write a new bundle generation and atomically point the manifest at it.
+
+    Concurrent writers of the same bundle take turns; the last one to finish
+    wins, and every generation but its own is then removed.
+
+    Args:
+        bundle_dir (str): Destination directory
+        index: FAISS index to persist
+        file_ids (List[str]): Resume ids in selector order
+        index_ids (List[int]): FAISS id of each resume
+        texts (List[str]): Full text of each resume
+        records (List[Dict[str, Any]]): Metadata record of each resume
+        manifest_extra (Dict[str, Any]): Additional manifest fields (model, source fingerprint, ...)
+    """
+    bundle = Path(bundle_dir)
+    with _bundle_lock(bundle):
+        _write_generation(bundle, index, file_ids, index_ids, texts, records, manifest_extra)
+
+
+def _write_generation(bundle: Path, index, file_ids: List[str], index_ids: List[int], texts: Sequence[str],
+                      records: List[Dict[str, Any]], manifest_extra: Dict[str, Any]) -> None:
+    """Body of write_bundle, run under the bundle lock."""
+    generation = f"{time.time_ns()}-{os.getpid()}"
+    generation_dir = bundle / generation
+    generation_dir.mkdir(parents=True)
+
+    text_ranges = []
+    with open(generation_dir / TEXTS_FILE, "wb") as f:
+        for text in texts:
+            data = text.encode("utf-8")
+            start = f.tell()
+            f.write(data)
+            text_ranges.append([start, start + len(data)])
+
+    record_ranges = []
+    with open(generation_dir / RECORDS_FILE, "wb") as f:
+        for record in records:
+            data = json.dumps(record).encode("utf-8")
+            start = f.tell()
+            f.write(data + b"\n")
+            record_ranges.append([start, start + len(data)])
+
+    faiss.write_index(index, str(generation_dir / INDEX_FILE))
+
+    manifest = {
+        **manifest_extra,
+        "format_version": BUNDLE_FORMAT_VERSION,
+        "generation": generation,
+        "created_at": time.time(),
+        "count": len(file_ids),
+        "file_ids": file_ids,
+        "index_ids": index_ids,
+        "text_ranges": text_ranges,
+        "record_ranges": record_ranges,
+    }
+    manifest_tmp = bundle / f"{MANIFEST_FILE}.{generation}.tmp"
+    with open(manifest_tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f)
+    os.replace(manifest_tmp, bundle / MANIFEST_FILE)
+
+    # No other writer holds the lock, so every other generation is finished or abandoned.
+    # Older generations may still be mapped by readers; on POSIX their data stays valid until unmapped
+    for child in bundle.iterdir():
+        if child.is_dir() and child.name != generation:
+            shutil.rmtree(child, ignore_errors=True)
+
+
+def read_manifest(bundle_dir: str) -> Optional[Dict[str, Any]]:
+    """Return the bundle manifest, or None if the directory holds no readable bundle."""
+    try:
+        with open(Path(bundle_dir) / MANIFEST_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def open_bundle(bundle_dir: str, manifest: Dict[str, Any], low_memory: bool = False,
+                spill_dir: Optional[str] = None):
+    """
+    Open the index (memory-mapped where possible) and the lazy record/text views of a bundle.
+
+    Args:
+        bundle_dir (str): Bundle directory
+        manifest (Dict[str, Any]): Manifest returned by read_manifest
+        low_memory (bool): Return texts as a DiskTextList that never caches decoded texts
+        spill_dir (Optional[str]): Spill file directory of the DiskTextList
+
+    Returns:
+        tuple: (index, LazyTextList or DiskTextList, LazyRecordMap)
+    """
+    generation_dir = Path(bundle_dir) / manifest["generation"]
+    # IVF inverted lists cannot grow once mapped, so those indexes are read into memory
+    io_flags = faiss.IO_FLAG_MMAP if supports_mmap(manifest.get("index_layout", "flat")) else 0
+    index = faiss.read_index(str(generation_dir / INDEX_FILE), io_flags)
+    texts_blob = _MappedFile(str(generation_dir / TEXTS_FILE))
+    if low_memory:
+        texts = DiskTextList(spill_dir, texts_blob, manifest["text_ranges"])
+    else:
+        texts = LazyTextList(texts_blob, manifest["text_ranges"])
+    records = LazyRecordMap(
+        _MappedFile(str(generation_dir / RECORDS_FILE)),
+        dict(zip(manifest["file_ids"], manifest["record_ranges"]))
+    )
+    return index, texts, records
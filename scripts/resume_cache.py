@@ -0,0 +1,397 @@
+"""
+Persistent caches used by ResumeSelector to avoid repeating expensive work.
+
+Every cache lives under a single configurable cache root so that a worker,
+the test suite and ad-hoc scripts can each point at their own directory.
+"""
+import os
+import re
+import json
+import time
+import zlib
+import sqlite3
+import hashlib
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+def hash_bytes(data: bytes) -> str:
+    """Return the hex SHA-256 digest of a byte string."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def hash_file(path: str, chunk_size: int = 1 << 20) -> str:
+    """
+    Return the hex SHA-256 digest of a file's contents.
+
+    Args:
+        path (str): Path to the file
+        chunk_size (int): Read size used while streaming the file
+
+    Returns:
+        str: Hex digest of the file contents
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def settings_fingerprint(settings: Dict[str, Any]) -> str:
+    """Return a short stable digest of a settings dict, used as part of cache keys."""
+    return hash_bytes(json.dumps(settings, sort_keys=True).encode("utf-8"))[:16]
+
+
+class TextCache:
+    """
+    Content-addressed SQLite store for text extracted from PDF resumes.
+
+    Entries are keyed by the SHA-256 of the PDF bytes plus a fingerprint of the
+    extractor settings, so a renamed or re-uploaded file with identical content
+    is a hit and a change in extraction settings is a miss. Texts are stored
+    zlib-compressed and the least recently used entries are evicted once the
+    stored size exceeds max_bytes.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = 256 * 1024 * 1024):
+        """
+        Open (or create) the text cache.
+
+        Args:
+            cache_dir (str): Cache root directory
+            max_bytes (int): Upper bound on the compressed size of all stored texts
+        """
+        Path(cache_dir).mkdir(parents=True, exist_ok=True)
+        self.path = os.path.join(cache_dir, "pdf_text.sqlite")
+        self.max_bytes = max_bytes
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS pdf_text ("
+            " key TEXT PRIMARY KEY,"
+            " text BLOB NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " last_access REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS pdf_text_last_access ON pdf_text(last_access)")
+        self._conn.commit()
+        self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM pdf_text").fetchone()[0]
+
+    @staticmethod
+    def make_key(content_hash: str, settings: Dict[str, Any]) -> str:
+        """Build the cache key for a file hash and extractor settings."""
+        return f"{content_hash}:{settings_fingerprint(settings)}"
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up extracted text.
+
+        Args:
+            key (str): Key built with make_key
+
+        Returns:
+            Optional[str]: Cached text, or None on a miss
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT text FROM pdf_text WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._conn.execute("UPDATE pdf_text SET last_access = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+            return zlib.decompress(row[0]).decode("utf-8")
+
+    def put(self, key: str, text: str) -> None:
+        """
+        Store extracted text and evict old entries if the size bound is exceeded.
+
+        Args:
+            key (str): Key built with make_key
+            text (str): Extracted text
+        """
+        blob = zlib.compress(text.encode("utf-8"))
+        with self._lock:
+            previous = self._conn.execute("SELECT size FROM pdf_text WHERE key = ?", (key,)).fetchone()
+            if previous is not None:
+                self._total_bytes -= previous[0]
+
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pdf_text (key, text, size, last_access) VALUES (?, ?, ?, ?)",
+                (key, blob, len(blob), time.time())
+            )
+            self._total_bytes += len(blob)
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the store fits in max_bytes."""
+        while self._total_bytes > self.max_bytes:
+            row = self._conn.execute(
+                "SELECT key, size FROM pdf_text ORDER BY last_access ASC LIMIT 1"
+            ).fetchone()
+            if row is None:
+                self._total_bytes = 0
+                break
+            self._conn.execute("DELETE FROM pdf_text WHERE key = ?", (row[0],))
+            self._total_bytes -= row[1]
+            self.evictions += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss/eviction counters and the current store size."""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM pdf_text").fetchone()[0]
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": entries,
+            "bytes": self._total_bytes,
+        }
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class JsonCache:
+    """
+    Durable SQLite key/value store for JSON-serializable results.
+
+    Used to memoize LLM responses. Callers are responsible for folding every
+    input that affects the result (prompt version, model name, content hash)
+    into the key, so stale entries are simply never looked up again.
+    """
+
+    def __init__(self, cache_dir: str, name: str):
+        """
+        Open (or create) a named JSON cache.
+
+        Args:
+            cache_dir (str): Cache root directory
+            name (str): Store name, used as the database file name
+        """
+        Path(cache_dir).mkdir(parents=True, exist_ok=True)
+        self.path = os.path.join(cache_dir, f"{name}.sqlite")
+
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " key TEXT PRIMARY KEY,"
+            " value TEXT NOT NULL,"
+            " created_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Build a cache key from its components."""
+        return hash_bytes("\x1f".join(parts).encode("utf-8"))
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a stored value.
+
+        Args:
+            key (str): Key built with make_key
+
+        Returns:
+            Optional[Any]: Decoded JSON value, or None on a miss
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return json.loads(row[0])
+
+    def put(self, key: str, value: Any) -> None:
+        """
+        Store a JSON-serializable value.
+
+        Args:
+            key (str): Key built with make_key
+            value (Any): Value to store
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, created_at) VALUES (?, ?, ?)",
+                (key, json.dumps(value), time.time())
+            )
+            self._conn.commit()
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and the number of stored entries."""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        return {"hits": self.hits, "misses": self.misses, "entries": entries}
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class EmbeddingStore:
+    """
+    Persistent store of embedding vectors for one embedding model.
+
+    Vectors are appended to a flat float32 file that is read back through a
+    read-only memory map, and a SQLite table maps each key (the hash of the
+    embedded text) to its row. The model name and dimension are part of the
+    directory name, so switching models never mixes incompatible vectors.
+    Appends run inside an immediate SQLite transaction, which serializes
+    writers across processes sharing the same cache root.
+    """
+
+    def __init__(self, cache_dir: str, model_name: str, dim: int):
+        """
+        Open (or create) the embedding store for a model.
+
+        Args:
+            cache_dir (str): Cache root directory
+            model_name (str): Embedding model name
+            dim (int): Embedding dimension
+        """
+        slug = re.sub(r"[^A-Za-z0-9._-]+", "_", model_name)
+        self.dir = Path(cache_dir) / "embeddings" / f"{slug}-{dim}"
+        self.dir.mkdir(parents=True, exist_ok=True)
+        self.vectors_path = self.dir / "vectors.f32"
+        self.vectors_path.touch(exist_ok=True)
+        self.dim = dim
+        self.row_bytes = dim * 4
+
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._matrix: Optional[np.ndarray] = None
+        self._conn = sqlite3.connect(str(self.dir / "keys.sqlite"), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS vectors (key TEXT PRIMARY KEY, row INTEGER NOT NULL)")
+
+    @staticmethod
+    def make_key(text: str) -> str:
+        """Build the store key for a text to be embedded."""
+        return hash_bytes(text.encode("utf-8"))
+
+    def _rows(self, min_rows: int) -> np.ndarray:
+        """Return a memory map covering at least min_rows rows, remapping after appends."""
+        if self._matrix is None or len(self._matrix) < min_rows:
+            count = self.vectors_path.stat().st_size // self.row_bytes
+            if count == 0:
+                return np.zeros((0, self.dim), dtype=np.float32)
+            self._matrix = np.memmap(self.vectors_path, dtype=np.float32, mode="r", shape=(count, self.dim))
+        return self._matrix
+
+    def get_many(self, keys: List[str]) -> Tuple[np.ndarray, List[int]]:
+        """
+        Look up vectors for many keys at once.
+
+        Args:
+            keys (List[str]): Keys built with make_key
+
+        Returns:
+            Tuple[np.ndarray, List[int]]: A (len(keys), dim) float32 matrix with
+            found rows filled in, and the positions of keys that were not found
+        """
+        vectors = np.zeros((len(keys), self.dim), dtype=np.float32)
+        if not keys:
+            return vectors, []
+
+        with self._lock:
+            found: Dict[str, int] = {}
+            unique_keys = list(dict.fromkeys(keys))
+            for start in range(0, len(unique_keys), 500):
+                chunk = unique_keys[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                found.update(self._conn.execute(
+                    f"SELECT key, row FROM vectors WHERE key IN ({placeholders})", chunk
+                ).fetchall())
+
+            missing = []
+            if found:
+                matrix = self._rows(max(found.values()) + 1)
+                for position, key in enumerate(keys):
+                    row = found.get(key)
+                    if row is None:
+                        missing.append(position)
+                    else:
+                        vectors[position] = matrix[row]
+            else:
+                missing = list(range(len(keys)))
+
+            self.hits += len(keys) - len(missing)
+            self.misses += len(missing)
+            return vectors, missing
+
+    def put_many(self, keys: List[str], vectors: np.ndarray) -> None:
+        """
+        Append vectors for keys that are not stored yet.
+
+        Args:
+            keys (List[str]): Keys built with make_key
+            vectors (np.ndarray): (len(keys), dim) matrix of vectors
+        """
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        if vectors.shape != (len(keys), self.dim):
+            raise ValueError(f"Expected vectors of shape ({len(keys)}, {self.dim}), got {vectors.shape}")
+
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                new_rows = []
+                seen = set()
+                for position, key in enumerate(keys):
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    if self._conn.execute("SELECT 1 FROM vectors WHERE key = ?", (key,)).fetchone() is None:
+                        new_rows.append(position)
+
+                if new_rows:
+                    with open(self.vectors_path, "r+b") as f:
+                        f.seek(0, os.SEEK_END)
+                        # Discard a torn trailing row left by an interrupted writer
+                        first_row = f.tell() // self.row_bytes
+                        f.seek(first_row * self.row_bytes)
+                        f.truncate()
+                        f.write(vectors[new_rows].tobytes())
+                    self._conn.executemany(
+                        "INSERT INTO vectors (key, row) VALUES (?, ?)",
+                        [(keys[position], first_row + offset) for offset, position in enumerate(new_rows)]
+                    )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and the number of stored vectors."""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM vectors").fetchone()[0]
+        return {"hits": self.hits, "misses": self.misses, "entries": entries}
+
+    def close(self) -> None:
+        """Release the memory map and close the key index."""
+        with self._lock:
+            self._matrix = None
+            self._conn.close()
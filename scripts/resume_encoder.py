@@ -0,0 +1,304 @@
+"""
+ONNX Runtime sentence encoder for ResumeSelector.
+
+SentenceTransformer on PyTorch CPU is the most expensive CPU step of
+indexing. OnnxSentenceEncoder runs the same transformer through ONNX Runtime,
+optionally with dynamic int8 quantization of its weights, and exposes the
+SentenceTransformer surface the selector uses (encode and
+get_sentence_embedding_dimension).
+
+The model is exported once per model name into an export directory:
+
+    model.onnx         the transformer, returning last_hidden_state
+    model.int8.onnx    dynamically quantized copy (quantize=True only)
+    encoder.json       pooling mode, normalization, dimension and input names
+    tokenizer files    saved with tokenizer.save_pretrained
+
+encode() tokenizes with truncation at the model window, sorts texts by token
+length and pads each batch only to its own longest text, so short resumes do
+not pay for long ones. truncate() returns the part of each text that fits the
+window, which keeps embedding cache keys stable when only ignored text changes.
+Requires onnxruntime; exporting also needs onnx.
+
+encode_parallel() shards a bulk encode over forked processes that share an
+already loaded model, each capped at a fixed number of compute threads; a
+single torch process scales poorly past a few intra-op threads.
+"""
+import os
+import sys
+import json
+import multiprocessing
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+ENCODER_BACKENDS = ("torch", "onnx", "onnx_int8")
+
+DEFAULT_EXPORT_DIR = os.path.join(os.path.expanduser("~"), ".cache", "resume_selector", "onnx")
+
+# Texts are cut to this many characters per window token before tokenizing;
+# no realistic WordPiece/BPE tokenization packs more characters into a token
+MAX_CHARS_PER_TOKEN = 16
+
+ONNX_OPSET = 14
+
+# Model shared with encode_parallel's forked workers
+_pool_model = None
+
+
+def length_sorted_batches(lengths: np.ndarray, batch_size: int) -> List[np.ndarray]:
+    """Positions grouped into batches of similar length, longest first."""
+    order = np.argsort(-np.asarray(lengths), kind="stable")
+    return [order[start:start + batch_size] for start in range(0, len(order), max(1, batch_size))]
+
+
+def pool(hidden: np.ndarray, mask: np.ndarray, mode: str) -> np.ndarray:
+    """
+    Sentence embeddings from token embeddings, as sentence_transformers.models.Pooling does.
+
+    Args:
+        hidden (np.ndarray): (batch, tokens, dim) last hidden state
+        mask (np.ndarray): (batch, tokens) attention mask
+        mode (str): "cls", "mean" or "max"
+
+    Returns:
+        np.ndarray: (batch, dim) float32 embeddings
+    """
+    if mode == "cls":
+        return hidden[:, 0].astype(np.float32)
+    weights = mask[..., None].astype(np.float32)
+    if mode == "mean":
+        return ((hidden * weights).sum(axis=1) / np.maximum(weights.sum(axis=1), 1e-9)).astype(np.float32)
+    if mode == "max":
+        return np.where(weights > 0, hidden, -1e9).max(axis=1).astype(np.float32)
+    raise ValueError(f"Unsupported pooling mode: {mode}")
+
+
+def limit_threads(threads: int) -> None:
+    """
+    Cap the compute threads of this process.
+
+    torch and FAISS are limited directly when already imported; the
+    environment variables cover OpenMP/BLAS pools and anything imported later.
+    """
+    for variable in ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS"):
+        os.environ[variable] = str(threads)
+    if "torch" in sys.modules:
+        sys.modules["torch"].set_num_threads(threads)
+    if "faiss" in sys.modules:
+        sys.modules["faiss"].omp_set_num_threads(threads)
+
+
+def _init_pool_worker(model, threads: int) -> None:
+    global _pool_model
+    _pool_model = model
+    limit_threads(threads)
+
+
+def _encode_shard(task) -> np.ndarray:
+    texts, batch_size = task
+    return np.asarray(_pool_model.encode(texts, show_progress_bar=False, batch_size=batch_size), dtype=np.float32)
+
+
+def encode_parallel(model, texts: List[str], workers: int, threads: Optional[int] = None,
+                    batch_size: int = 32) -> np.ndarray:
+    """
+    Encode texts in a pool of processes forked from this one.
+
+    The children inherit `model` copy-on-write instead of loading their own
+    copy. Texts are cut into contiguous shards, a few per worker so a slow
+    shard does not hold up the others, and the shard embeddings are
+    concatenated in input order.
+
+    Args:
+        model: Loaded encoder with a SentenceTransformer-style encode(); not an
+            OnnxSentenceEncoder, whose ONNX Runtime session does not survive fork
+        texts (List[str]): Texts to embed
+        workers (int): Encoder processes
+        threads (Optional[int]): Compute threads per process; cores / workers if None
+        batch_size (int): Texts per model batch within a shard
+
+    Returns:
+        np.ndarray: (len(texts), dim) float32 embeddings, in input order
+    """
+    threads = threads or max(1, (os.cpu_count() or 1) // workers)
+    shard_size = max(batch_size, -(-len(texts) // (workers * 4)))
+    shards = [(texts[start:start + shard_size], batch_size) for start in range(0, len(texts), shard_size)]
+    if not shards:
+        return np.zeros((0, model.get_sentence_embedding_dimension()), dtype=np.float32)
+
+    ctx = multiprocessing.get_context("fork")
+    with ctx.Pool(min(workers, len(shards)), initializer=_init_pool_worker, initargs=(model, threads)) as pool:
+        return np.concatenate(pool.map(_encode_shard, shards))
+
+
+def export_model(model_name: str, export_dir: str, quantize: bool = False) -> Dict[str, Any]:
+    """
+    Export a SentenceTransformer model to ONNX, unless export_dir already holds it.
+
+    Args:
+        model_name (str): HuggingFace model name
+        export_dir (str): Directory for the exported files
+        quantize (bool): Also write a dynamically int8-quantized copy
+
+    Returns:
+        Dict[str, Any]: The encoder.json configuration
+    """
+    config_path = os.path.join(export_dir, "encoder.json")
+    fp32_path = os.path.join(export_dir, "model.onnx")
+    int8_path = os.path.join(export_dir, "model.int8.onnx")
+
+    if os.path.exists(config_path) and os.path.exists(fp32_path):
+        with open(config_path, "r", encoding="utf-8") as f:
+            config = json.load(f)
+    else:
+        config = _export_fp32(model_name, export_dir, fp32_path)
+        with open(config_path, "w", encoding="utf-8") as f:
+            json.dump(config, f)
+
+    if quantize and not os.path.exists(int8_path):
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+        quantize_dynamic(fp32_path, int8_path, weight_type=QuantType.QInt8)
+    return config
+
+
+def _export_fp32(model_name: str, export_dir: str, fp32_path: str) -> Dict[str, Any]:
+    """Trace the transformer of a SentenceTransformer into ONNX and describe its pooling."""
+    import torch
+    from sentence_transformers import SentenceTransformer
+
+    os.makedirs(export_dir, exist_ok=True)
+    sentence_model = SentenceTransformer(model_name, device="cpu")
+    transformer, pooling = sentence_model[0], sentence_model[1]
+    tokenizer = transformer.tokenizer
+    model = transformer.auto_model.eval()
+
+    sample = tokenizer(["Resume of a software engineer"], return_tensors="pt")
+    input_names = [name for name in ("input_ids", "attention_mask", "token_type_ids") if name in sample]
+
+    class HiddenState(torch.nn.Module):
+        def __init__(self, inner):
+            super().__init__()
+            self.inner = inner
+
+        def forward(self, *inputs):
+            return self.inner(**dict(zip(input_names, inputs))).last_hidden_state
+
+    dynamic_axes = {name: {0: "batch", 1: "tokens"} for name in input_names + ["last_hidden_state"]}
+    with torch.no_grad():
+        torch.onnx.export(
+            HiddenState(model), tuple(sample[name] for name in input_names), fp32_path,
+            input_names=input_names, output_names=["last_hidden_state"],
+            dynamic_axes=dynamic_axes, opset_version=ONNX_OPSET
+        )
+    tokenizer.save_pretrained(export_dir)
+
+    return {
+        "model": model_name,
+        "pooling": pooling.get_pooling_mode_str(),
+        "normalize": any(type(module).__name__ == "Normalize" for module in sentence_model),
+        "dim": sentence_model.get_sentence_embedding_dimension(),
+        "max_seq_length": sentence_model.max_seq_length,
+        "inputs": input_names,
+    }
+
+
+class OnnxSentenceEncoder:
+    """SentenceTransformer-compatible encoder running an exported model on ONNX Runtime."""
+
+    def __init__(self, model_name: str, export_dir: Optional[str] = None, quantize: bool = False,
+                 batch_size: int = 32, max_tokens: Optional[int] = None, threads: Optional[int] = None):
+        """
+        Load (exporting first if needed) the ONNX version of a model.
+
+        Args:
+            model_name (str): HuggingFace model name
+            export_dir (Optional[str]): Root of exported models; DEFAULT_EXPORT_DIR if None
+            quantize (bool): Run the dynamically int8-quantized model
+            batch_size (int): Default texts per inference batch
+            max_tokens (Optional[int]): Token window; the model's max_seq_length if None
+            threads (Optional[int]): ONNX Runtime intra-op threads; all cores if None
+        """
+        import onnxruntime
+        from transformers import AutoTokenizer
+
+        model_dir = os.path.join(export_dir or DEFAULT_EXPORT_DIR, model_name.replace("/", "--"))
+        config = export_model(model_name, model_dir, quantize)
+
+        options = onnxruntime.SessionOptions()
+        options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if threads:
+            options.intra_op_num_threads = threads
+        model_file = "model.int8.onnx" if quantize else "model.onnx"
+        self.session = onnxruntime.InferenceSession(
+            os.path.join(model_dir, model_file), options, providers=["CPUExecutionProvider"]
+        )
+        self.tokenizer = AutoTokenizer.from_pretrained(model_dir)
+
+        self.model_name = model_name
+        self.quantize = quantize
+        self.batch_size = batch_size
+        self.max_tokens = max_tokens or config["max_seq_length"]
+        self.pooling = config["pooling"]
+        self.normalize = config["normalize"]
+        self.dim = config["dim"]
+        self.input_names = config["inputs"]
+
+    def get_sentence_embedding_dimension(self) -> int:
+        return self.dim
+
+    def truncate(self, texts: List[str]) -> List[str]:
+        """The leading part of each text that fits the token window; the rest never reaches the model."""
+        encoded = self.tokenizer(
+            [text[:self.max_tokens * MAX_CHARS_PER_TOKEN] for text in texts],
+            truncation=True, max_length=self.max_tokens, return_offsets_mapping=True
+        )
+        truncated = []
+        for text, offsets in zip(texts, encoded["offset_mapping"]):
+            end = max((stop for _, stop in offsets), default=0)
+            truncated.append(text if end >= len(text) else text[:end])
+        return truncated
+
+    def encode(self, texts: List[str], show_progress_bar: bool = False, batch_size: Optional[int] = None,
+               **kwargs) -> np.ndarray:
+        """
+        Embed texts in length-sorted, dynamically padded batches.
+
+        Args:
+            texts (List[str]): Texts to embed
+            show_progress_bar (bool): Accepted for SentenceTransformer compatibility; ignored
+            batch_size (Optional[int]): Texts per inference batch; the encoder default if None
+
+        Returns:
+            np.ndarray: (len(texts), dim) float32 embeddings, in input order
+        """
+        if isinstance(texts, str):
+            texts = [texts]
+        embeddings = np.zeros((len(texts), self.dim), dtype=np.float32)
+        if not len(texts):
+            return embeddings
+
+        encoded = self.tokenizer(
+            [text[:self.max_tokens * MAX_CHARS_PER_TOKEN] for text in texts],
+            truncation=True, max_length=self.max_tokens
+        )
+        lengths = np.fromiter((len(ids) for ids in encoded["input_ids"]), dtype=np.int64, count=len(texts))
+
+        for batch in length_sorted_batches(lengths, batch_size or self.batch_size):
+            width = int(lengths[batch].max())
+            feeds = {name: np.zeros((len(batch), width), dtype=np.int64) for name in self.input_names}
+            for row, position in enumerate(batch):
+                length = lengths[position]
+                feeds["input_ids"][row, :length] = encoded["input_ids"][position]
+                feeds["attention_mask"][row, :length] = 1
+                if "token_type_ids" in feeds:
+                    feeds["token_type_ids"][row, :length] = encoded["token_type_ids"][position]
+            if self.tokenizer.pad_token_id:
+                feeds["input_ids"][feeds["attention_mask"] == 0] = self.tokenizer.pad_token_id
+
+            hidden = self.session.run(["last_hidden_state"], feeds)[0]
+            embeddings[batch] = pool(hidden, feeds["attention_mask"], self.pooling)
+
+        if self.normalize:
+            embeddings /= np.maximum(np.linalg.norm(embeddings, axis=1, keepdims=True), 1e-12)
+        return embeddings
@@ -0,0 +1,73 @@
+"""
+Progress events for the shortlisting pipeline.
+
+ResumeSelector reports progress by calling its on_event handler with small
+JSON-serializable dicts, each with an "event" name:
+
+    extracted     one PDF's text extraction finished    {file_name, chars, error}
+    metadata      one resume's LLM metadata is ready     {file_name, name}
+    index_ready   the index can be searched              {resume_count}
+    candidates    the ranked shortlist, without texts    {candidates}
+    summary       one candidate's summary is ready       {position, id, summary}
+    done          the pipeline finished                  {result}
+    error         the pipeline failed                    {error}
+
+stream_events turns callback-driven work into a generator of those events, and
+write_ndjson writes any event iterator as one JSON object per line.
+"""
+import sys
+import json
+import time
+import queue
+import threading
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, TextIO
+
+EventHandler = Callable[[Dict[str, Any]], None]
+
+_END = object()
+
+
+def stream_events(run: Callable[[EventHandler], Any]) -> Iterator[Dict[str, Any]]:
+    """
+    Run `run(emit)` in a background thread and yield its events as they happen.
+
+    Every event is stamped with "elapsed" seconds since the start. The stream
+    ends with a "done" event carrying run's return value, or an "error" event
+    if it raised. Closing the generator early does not stop the work.
+
+    Args:
+        run (Callable[[EventHandler], Any]): Work to run; calls emit(event) to report progress
+
+    Returns:
+        Iterator[Dict[str, Any]]: Events in the order they were emitted
+    """
+    events: "queue.Queue[Any]" = queue.Queue()
+    started = time.monotonic()
+
+    def emit(event: Dict[str, Any]) -> None:
+        events.put({**event, "elapsed": round(time.monotonic() - started, 3)})
+
+    def target() -> None:
+        try:
+            emit({"event": "done", "result": run(emit)})
+        except Exception as e:
+            emit({"event": "error", "error": str(e)})
+        finally:
+            events.put(_END)
+
+    thread = threading.Thread(target=target, name="resume-events", daemon=True)
+    thread.start()
+    while True:
+        event = events.get()
+        if event is _END:
+            break
+        yield event
+    thread.join()
+
+
+def write_ndjson(events: Iterable[Dict[str, Any]], stream: Optional[TextIO] = None) -> None:
+    """Write events as newline-delimited JSON, flushing after each so readers see them immediately."""
+    stream = stream or sys.stdout
+    for event in events:
+        stream.write(json.dumps(event, default=str) + "\n")
+        stream.flush()
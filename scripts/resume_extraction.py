@@ -0,0 +1,295 @@
+"""
+PDF text extraction helpers shared by the serial and multi-process paths.
+
+extract_pdf_text is the single place that parses PDFs. It reads pages one at
+a time from a backend, a function that yields the text of each page in
+order:
+
+    pdfplumber   layout-aware words and lines; the reference extractor
+    pdfminer     pdfminer.six layout analysis without pdfplumber's object model
+    pdfium       PDFium's native text layer via pypdfium2, several times faster
+
+"auto" reads with pdfium and falls back to pdfplumber when the result looks
+empty or garbled (scanned pages, fonts without a Unicode map). Further
+backends can be added with register_backend().
+
+An extraction budget (max_chars, max_pages) stops parsing as soon as enough
+text has been collected, so only the leading pages of a long document are
+ever laid out.
+
+The parallel path runs extract_pdf_text in a small supervised pool of worker
+processes: each worker handles one file at a time, a worker that exceeds the
+per-file timeout or dies is killed and replaced, and results are returned in
+input order.
+"""
+import re
+import time
+import logging
+import multiprocessing
+from multiprocessing.connection import wait
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from resume_lazy import LazyModule
+
+pdfplumber = LazyModule("pdfplumber")
+pdfium = LazyModule("pypdfium2")
+pdfminer_high_level = LazyModule("pdfminer.high_level")
+pdfminer_layout = LazyModule("pdfminer.layout")
+
+# "auto" falls back to pdfplumber when the fast backend yields fewer visible characters
+# per page read than this, or when more than AUTO_MAX_GARBLED_RATIO of them are unmapped glyphs
+AUTO_MIN_CHARS_PER_PAGE = 20
+AUTO_MAX_GARBLED_RATIO = 0.05
+
+# Replacement, control and private-use characters: what glyphs without a Unicode mapping come out as
+_GARBLED_RE = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\x7f\ue000-\uf8ff\ufffd]")
+
+# A backend yields the text of each page in order, given the PDF and the pdfplumber settings
+PageReader = Callable[[Any, Dict[str, Any]], Iterator[str]]
+
+
+def _pdfplumber_pages(source, settings: Dict[str, Any]) -> Iterator[str]:
+    with pdfplumber.open(source) as pdf:
+        for page in pdf.pages:
+            yield page.extract_text(**settings) or ""
+
+
+def _pdfminer_pages(source, settings: Dict[str, Any]) -> Iterator[str]:
+    for page in pdfminer_high_level.extract_pages(source, laparams=pdfminer_layout.LAParams()):
+        yield "".join(
+            element.get_text() for element in page if isinstance(element, pdfminer_layout.LTTextContainer)
+        ).strip()
+
+
+def _pdfium_pages(source, settings: Dict[str, Any]) -> Iterator[str]:
+    pdf = pdfium.PdfDocument(source)
+    try:
+        for index in range(len(pdf)):
+            page = pdf[index]
+            textpage = page.get_textpage()
+            try:
+                text = textpage.get_text_range()
+            finally:
+                textpage.close()
+                page.close()
+            yield text.replace("\r\n", "\n").replace("\r", "\n").strip()
+    finally:
+        pdf.close()
+
+
+_BACKENDS: Dict[str, PageReader] = {
+    "pdfplumber": _pdfplumber_pages,
+    "pdfminer": _pdfminer_pages,
+    "pdfium": _pdfium_pages,
+}
+
+
+def register_backend(name: str, pages: PageReader) -> None:
+    """
+    Make a page reader available to extract_pdf_text under a backend name.
+
+    Parallel extraction workers inherit registrations made before the pool
+    starts only when processes are forked.
+    """
+    if name == "auto":
+        raise ValueError("'auto' is reserved for the pdfium/pdfplumber fallback")
+    _BACKENDS[name] = pages
+
+
+def extraction_backends() -> List[str]:
+    """Names accepted as the backend of extract_pdf_text."""
+    return [*_BACKENDS, "auto"]
+
+
+def _read_pages(pages: Iterator[str], max_chars: Optional[int], max_pages: Optional[int]) -> Tuple[str, int]:
+    """Join page texts until the budget is spent; returns (text, pages read)."""
+    parts = []
+    chars = 0
+    read = 0
+    try:
+        for page_text in pages:
+            read += 1
+            if page_text:
+                parts.append(page_text)
+                chars += len(page_text) + 2
+            if (max_pages is not None and read >= max_pages) or (max_chars is not None and chars >= max_chars):
+                break
+    finally:
+        # Lets the backend close the document without parsing the remaining pages
+        pages.close()
+
+    text = "\n\n".join(parts).strip()
+    if max_chars is not None:
+        text = text[:max_chars]
+    return text, read
+
+
+def _looks_unreadable(text: str, pages_read: int) -> bool:
+    """Whether a fast backend's text is too sparse or garbled to trust."""
+    visible = len(text) - text.count(" ") - text.count("\n") - text.count("\t")
+    if visible < AUTO_MIN_CHARS_PER_PAGE * max(pages_read, 1):
+        return True
+    return len(_GARBLED_RE.findall(text)) > AUTO_MAX_GARBLED_RATIO * visible
+
+
+def extract_pdf_text(source, settings: Dict[str, Any], backend: str = "pdfplumber",
+                     max_chars: Optional[int] = None, max_pages: Optional[int] = None) -> str:
+    """
+    Extract the text of a PDF page by page, stopping once the budget is spent.
+
+    Args:
+        source: Path or binary file object of the PDF
+        settings (Dict[str, Any]): Keyword arguments for pdfplumber's page.extract_text
+        backend (str): One of extraction_backends()
+        max_chars (Optional[int]): Stop after this many characters and truncate to them; unlimited if None
+        max_pages (Optional[int]): Read at most this many leading pages; all pages if None
+
+    Returns:
+        str: Page texts separated by blank lines
+
+    Raises:
+        ValueError: If the backend is unknown
+        Exception: Whatever the backend raises for unreadable files
+    """
+    if backend == "auto":
+        try:
+            text, pages_read = _read_pages(_pdfium_pages(source, settings), max_chars, max_pages)
+            if not _looks_unreadable(text, pages_read):
+                return text
+        except Exception:
+            # Anything PDFium cannot open gets a second chance with pdfminer's parser
+            pass
+        if hasattr(source, "seek"):
+            source.seek(0)
+        backend = "pdfplumber"
+
+    pages = _BACKENDS.get(backend)
+    if pages is None:
+        raise ValueError(f"Unknown extraction backend {backend!r}; expected one of {', '.join(extraction_backends())}")
+    return _read_pages(pages(source, settings), max_chars, max_pages)[0]
+
+
+def _worker_main(conn, settings: Dict[str, Any], options: Dict[str, Any]) -> None:
+    """Worker process loop: receive (position, path), send back (position, text, error)."""
+    logging.getLogger("pdfminer").setLevel(logging.ERROR)
+    while True:
+        task = conn.recv()
+        if task is None:
+            return
+        position, path = task
+        try:
+            conn.send((position, extract_pdf_text(path, settings, **options), None))
+        except Exception as e:
+            conn.send((position, None, str(e)))
+
+
+class _Worker:
+    """A worker process, the parent end of its pipe and the task it is running."""
+
+    def __init__(self, ctx, settings: Dict[str, Any], options: Dict[str, Any]):
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(target=_worker_main, args=(child_conn, settings, options), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.position: Optional[int] = None
+        self.started = 0.0
+
+    def stop(self, force: bool = False) -> None:
+        if force:
+            self.process.kill()
+        else:
+            try:
+                self.conn.send(None)
+            except (OSError, ValueError):
+                self.process.kill()
+        self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+
+def extract_texts_parallel(paths: List[str], settings: Dict[str, Any], workers: int, timeout: float,
+                           on_result: Optional[Callable[[int, Optional[str], Optional[str]], None]] = None,
+                           **options) -> List[Tuple[Optional[str], Optional[str]]]:
+    """
+    Extract many PDFs in a pool of worker processes.
+
+    Args:
+        paths (List[str]): PDF paths
+        settings (Dict[str, Any]): Keyword arguments for page.extract_text
+        workers (int): Number of worker processes
+        timeout (float): Seconds a single file may take before its worker is killed
+        on_result (Optional[Callable]): Called with (position, text, error) as each file finishes
+        **options: backend, max_chars and max_pages for extract_pdf_text
+
+    Returns:
+        List[Tuple[Optional[str], Optional[str]]]: (text, error) per path, in input
+        order; text is None when extraction failed, crashed or timed out
+    """
+    results: List[Optional[Tuple[Optional[str], Optional[str]]]] = [None] * len(paths)
+    if not paths:
+        return []
+
+    ctx = multiprocessing.get_context()
+    pool = [_Worker(ctx, settings, options) for _ in range(max(1, min(workers, len(paths))))]
+    next_position = 0
+    remaining = len(paths)
+
+    try:
+        while remaining:
+            # Hand the next files to idle workers
+            for i, worker in enumerate(pool):
+                if worker.position is None and next_position < len(paths):
+                    if not worker.process.is_alive():
+                        worker.stop(force=True)
+                        worker = pool[i] = _Worker(ctx, settings, options)
+                    worker.position = next_position
+                    worker.started = time.monotonic()
+                    worker.conn.send((next_position, paths[next_position]))
+                    next_position += 1
+
+            busy = [worker for worker in pool if worker.position is not None]
+            deadline = min(worker.started for worker in busy) + timeout
+            ready = wait(
+                [worker.conn for worker in busy] + [worker.process.sentinel for worker in busy],
+                timeout=max(0.0, deadline - time.monotonic())
+            )
+
+            now = time.monotonic()
+            for i, worker in enumerate(pool):
+                if worker.position is None:
+                    continue
+
+                failure = None
+                if worker.conn in ready:
+                    try:
+                        position, text, error = worker.conn.recv()
+                        results[position] = (text, error)
+                        if on_result is not None:
+                            on_result(position, text, error)
+                    except (EOFError, OSError):
+                        failure = "worker process crashed"
+                elif not worker.process.is_alive():
+                    failure = "worker process crashed"
+                elif now - worker.started > timeout:
+                    failure = f"timed out after {timeout:g}s"
+                else:
+                    continue
+
+                remaining -= 1
+                if failure is None:
+                    worker.position = None
+                    continue
+
+                # Isolate the bad file: kill its worker and start a fresh one
+                results[worker.position] = (None, failure)
+                if on_result is not None:
+                    on_result(worker.position, None, failure)
+                worker.stop(force=True)
+                pool[i] = _Worker(ctx, settings, options)
+    finally:
+        for worker in pool:
+            worker.stop(force=worker.position is not None)
+
+    return results
@@ -0,0 +1,217 @@
+"""
+FAISS index factory for ResumeSelector.
+
+Every index stores normalized embeddings under explicit int64 ids and scores
+them by inner product (cosine similarity). Supported types:
+
+    flat      exact search (IndexFlatIP); the default and the only choice for small corpora
+    sqfp16    exhaustive search over float16 vectors; half the memory, near-identical ranking
+    sq8       exhaustive search over 8-bit scalar-quantized vectors; a quarter of the memory, needs training
+    ivf_flat  inverted file over exact vectors; needs training
+    hnsw      graph search (IndexHNSWFlat); no training, but vectors cannot be removed
+    ivf_pq    inverted file over product-quantized vectors; needs training, smallest memory
+
+Types that need training fall back to a flat index until the corpus has
+enough vectors to train on (MIN_POINTS_PER_CENTROID per centroid), and
+upgrade_index converts a growing flat index once it crosses that size.
+"""
+import math
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from resume_lazy import LazyModule
+
+faiss = LazyModule("faiss")
+
+INDEX_TYPES = ("flat", "sqfp16", "sq8", "ivf_flat", "hnsw", "ivf_pq")
+
+# FAISS warns below 39 training points per centroid
+MIN_POINTS_PER_CENTROID = 39
+
+# SQ8 learns a value range per dimension; vectors added later are clipped to it,
+# so it is trained only once the corpus gives a representative sample
+SQ8_MIN_TRAINING_POINTS = 1000
+
+# Scalar quantizer per type, as index_factory names
+_SQ_FACTORY = {"sqfp16": "SQfp16", "sq8": "SQ8"}
+
+DEFAULT_INDEX_PARAMS: Dict[str, Any] = {
+    "nlist": None,           # IVF lists; sqrt(corpus size) when None
+    "nprobe": 16,            # IVF lists visited per query
+    "pq_m": None,            # PQ sub-quantizers (bytes per vector at 8 bits); dim / 8 when None
+    "pq_nbits": 8,           # bits per PQ code
+    "hnsw_m": 32,            # HNSW neighbours per node
+    "ef_construction": 80,
+    "ef_search": 128,
+}
+
+
+def index_params(overrides: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """DEFAULT_INDEX_PARAMS with overrides applied, rejecting unknown keys."""
+    params = dict(DEFAULT_INDEX_PARAMS)
+    for key, value in (overrides or {}).items():
+        if key not in params:
+            raise ValueError(f"Unknown index parameter: {key}")
+        params[key] = value
+    return params
+
+
+def min_training_points(index_type: str, ntotal: int, params: Dict[str, Any]) -> int:
+    """Number of vectors needed before an index of this type can be trained; 0 if it needs no training."""
+    if index_type == "sq8":
+        return SQ8_MIN_TRAINING_POINTS
+    if index_type == "ivf_flat":
+        return MIN_POINTS_PER_CENTROID * _nlist(ntotal, params)
+    if index_type == "ivf_pq":
+        return MIN_POINTS_PER_CENTROID * max(_nlist(ntotal, params), 2 ** params["pq_nbits"])
+    return 0
+
+
+def make_index(index_type: str, dim: int, vectors: np.ndarray, ids: np.ndarray,
+               params: Optional[Dict[str, Any]] = None):
+    """
+    Build an index of the requested type holding the given vectors.
+
+    Types that need training are built flat when there are too few vectors.
+
+    Args:
+        index_type (str): One of INDEX_TYPES
+        dim (int): Embedding dimension
+        vectors (np.ndarray): Normalized float32 vectors, one row per id
+        ids (np.ndarray): int64 ids of the vectors
+        params (Optional[Dict[str, Any]]): Overrides for DEFAULT_INDEX_PARAMS
+
+    Returns:
+        faiss.Index: The populated index
+    """
+    if index_type not in INDEX_TYPES:
+        raise ValueError(f"Unknown index type {index_type!r}; expected one of {', '.join(INDEX_TYPES)}")
+    params = index_params(params)
+
+    ntotal = len(vectors)
+    if ntotal < min_training_points(index_type, ntotal, params):
+        index_type = "flat"
+
+    if index_type == "flat":
+        index = faiss.IndexIDMap2(faiss.IndexFlatIP(dim))
+    elif index_type in _SQ_FACTORY:
+        quantized = faiss.index_factory(dim, _SQ_FACTORY[index_type], faiss.METRIC_INNER_PRODUCT)
+        if not quantized.is_trained:
+            quantized.train(vectors)
+        index = faiss.IndexIDMap2(quantized)
+    elif index_type == "hnsw":
+        hnsw = faiss.IndexHNSWFlat(dim, params["hnsw_m"], faiss.METRIC_INNER_PRODUCT)
+        hnsw.hnsw.efConstruction = params["ef_construction"]
+        hnsw.hnsw.efSearch = params["ef_search"]
+        index = faiss.IndexIDMap2(hnsw)
+    else:
+        # IVF indexes store ids natively, which keeps ID selectors working on them
+        nlist = _nlist(ntotal, params)
+        if index_type == "ivf_flat":
+            description = f"IVF{nlist},Flat"
+        else:
+            # "np" skips polysemous training, which multiplies build time for no gain here
+            description = f"IVF{nlist},PQ{_pq_m(dim, params)}x{params['pq_nbits']}np"
+        index = faiss.index_factory(dim, description, faiss.METRIC_INNER_PRODUCT)
+        index.train(vectors)
+        index.nprobe = params["nprobe"]
+
+    if ntotal:
+        index.add_with_ids(vectors, ids)
+    return index
+
+
+def index_type_of(index) -> str:
+    """The INDEX_TYPES name of an index built by make_index."""
+    inner = faiss.downcast_index(index.index) if isinstance(index, faiss.IndexIDMap) else faiss.downcast_index(index)
+    if isinstance(inner, faiss.IndexScalarQuantizer):
+        return "sqfp16" if inner.sq.qtype == faiss.ScalarQuantizer.QT_fp16 else "sq8"
+    if isinstance(inner, faiss.IndexHNSW):
+        return "hnsw"
+    if isinstance(inner, faiss.IndexIVFPQ):
+        return "ivf_pq"
+    if isinstance(inner, faiss.IndexIVF):
+        return "ivf_flat"
+    return "flat"
+
+
+def upgrade_index(index, index_type: str, dim: int, params: Optional[Dict[str, Any]] = None):
+    """
+    Rebuild a flat index as `index_type` once it holds enough vectors to train on.
+
+    Args:
+        index: Current index
+        index_type (str): Configured index type
+        dim (int): Embedding dimension
+        params (Optional[Dict[str, Any]]): Overrides for DEFAULT_INDEX_PARAMS
+
+    Returns:
+        faiss.Index: A new index, or the same one if no upgrade is due
+    """
+    if index_type == "flat" or index_type_of(index) != "flat":
+        return index
+    ntotal = index.ntotal
+    if ntotal < min_training_points(index_type, ntotal, index_params(params)):
+        return index
+
+    vectors = index.index.reconstruct_n(0, ntotal)
+    ids = faiss.vector_to_array(index.id_map).astype("int64")
+    return make_index(index_type, dim, vectors, ids, params)
+
+
+def remove_ids(index, ids: np.ndarray) -> bool:
+    """
+    Remove vectors by id.
+
+    Returns:
+        bool: False if the index type cannot remove vectors (HNSW); the caller
+        must then ignore those ids in search results
+    """
+    if index_type_of(index) == "hnsw":
+        return False
+    index.remove_ids(ids)
+    return True
+
+
+def search_parameters(index, selector: "faiss.IDSelector"):
+    """
+    Search parameters restricting a search on this index to the ids accepted by `selector`.
+
+    IVF indexes probe every inverted list: the accepted ids (a project's
+    members) can sit in any list, and probing only the nprobe closest ones
+    would silently drop them from the results.
+    """
+    inner = faiss.downcast_index(index)
+    if isinstance(inner, faiss.IndexIVF):
+        return faiss.SearchParametersIVF(sel=selector, nprobe=inner.nlist)
+    return faiss.SearchParameters(sel=selector)
+
+
+def supports_mmap(index_type: str) -> bool:
+    """Whether a saved index of this type can be memory-mapped and still accept new vectors."""
+    return index_type in ("flat", "sqfp16", "sq8", "hnsw")
+
+
+def vector_bytes(index) -> int:
+    """Bytes the index spends on stored vectors (codes), excluding ids and graph or list overhead."""
+    inner = faiss.downcast_index(index.index) if isinstance(index, faiss.IndexIDMap) else faiss.downcast_index(index)
+    if isinstance(inner, faiss.IndexHNSW):
+        inner = faiss.downcast_index(inner.storage)
+    return int(inner.code_size) * int(index.ntotal)
+
+
+def _nlist(ntotal: int, params: Dict[str, Any]) -> int:
+    if params["nlist"]:
+        return int(params["nlist"])
+    return max(1, int(math.sqrt(max(ntotal, 1))))
+
+
+def _pq_m(dim: int, params: Dict[str, Any]) -> int:
+    """Number of PQ sub-quantizers: the configured value, or the largest divisor of dim up to dim / 8."""
+    if params["pq_m"]:
+        return int(params["pq_m"])
+    m = max(1, dim // 8)
+    while dim % m:
+        m -= 1
+    return m
@@ -0,0 +1,53 @@
+"""
+Deferred imports for the resume selector modules.
+
+sentence_transformers (which pulls in torch and transformers), mistralai,
+scipy, faiss and pdfplumber take from a tenth of a second to several seconds
+to import. The selector modules bind them to a LazyModule or LazyAttribute
+instead, which performs the real import on first use. A caller that only
+extracts text or reads metadata never pays for the embedding stack.
+
+Both stand-ins are ordinary module attributes, so tests can still replace
+them with monkeypatch.setattr.
+"""
+import importlib
+from typing import Any
+
+
+class LazyModule:
+    """Stand-in for a module that imports it on first attribute access."""
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr: str) -> Any:
+        # Only called for attributes not set in __init__
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module {self._name!r} ({state})>"
+
+
+class LazyAttribute:
+    """Callable stand-in for a class or function that imports its module on first call."""
+
+    def __init__(self, module: str, attr: str):
+        self._module = module
+        self._attr = attr
+        self._target = None
+
+    def resolve(self) -> Any:
+        """Import and return the real object."""
+        if self._target is None:
+            self._target = getattr(importlib.import_module(self._module), self._attr)
+        return self._target
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return self.resolve()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"<lazy {self._module}.{self._attr}>"
@@ -0,0 +1,166 @@
+"""
+BM25 keyword index for ResumeSelector.
+
+Dense retrieval finds resumes that are about the right thing, but an exact
+keyword such as "Verilog" or "ROS" only counts as much as the embedding lets
+it. BM25Index scores every resume against the query terms directly, so
+hybrid search (see ResumeSelector) can fuse both rankings.
+
+Documents are the resume text plus its normalized skills, the latter
+counted SKILL_WEIGHT times so a listed skill outweighs a passing mention.
+Like MetadataReranker, rows follow ResumeRecordStore rows and are kept up to
+date one at a time; each row holds only two small arrays (term ids and term
+frequencies). On the first search after a change the rows are merged into
+array-backed postings, term-sorted CSR style:
+
+    offsets[t] : offsets[t + 1]   slice of term t's postings
+    rows                          int32 record store row per posting
+    impacts                       float32 precomputed BM25 weight per posting
+
+A query then costs one scatter-add per query term over that term's
+postings, independent of corpus size for rare terms.
+"""
+import re
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+# BM25 parameters (Robertson/Zaragoza defaults)
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Times each token of a normalized skill is counted on top of the resume text
+SKILL_WEIGHT = 3
+
+# Keeps "c++", "c#", ".net" and "node.js" as single tokens
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*|\.[a-z0-9]+")
+
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or that the to was were will with".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased keyword tokens of a text, without stopwords."""
+    return [token for token in _TOKEN_RE.findall(text.lower()) if token not in STOPWORDS]
+
+
+class BM25Index:
+    """
+    BM25 scores over record store rows.
+
+    Cleared rows never match. The postings are rebuilt lazily on the first
+    search() after a change.
+    """
+
+    def __init__(self, k1: float = BM25_K1, b: float = BM25_B):
+        self.k1 = k1
+        self.b = b
+        self._vocab: Dict[str, int] = {}
+        self._terms: List[Optional[np.ndarray]] = []
+        self._freqs: List[Optional[np.ndarray]] = []
+        self._postings = None
+
+    def set_row(self, row: int, text: str, skills: Iterable[str] = ()) -> None:
+        """Index the text and normalized skills of the resume held in a record store row."""
+        while len(self._terms) <= row:
+            self._terms.append(None)
+            self._freqs.append(None)
+
+        counts = Counter(tokenize(text))
+        for skill in skills:
+            for token in tokenize(skill):
+                counts[token] += SKILL_WEIGHT
+        self._terms[row] = np.fromiter(
+            (self._vocab.setdefault(token, len(self._vocab)) for token in counts), dtype=np.int32, count=len(counts)
+        )
+        self._freqs[row] = np.fromiter(counts.values(), dtype=np.float32, count=len(counts))
+        self._postings = None
+
+    def clear_row(self, row: int) -> None:
+        """Forget a removed resume."""
+        if row < len(self._terms):
+            self._terms[row] = None
+            self._freqs[row] = None
+            self._postings = None
+
+    def clear(self) -> None:
+        self.__init__(self.k1, self.b)
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def scores(self, query: str) -> np.ndarray:
+        """
+        BM25 score of every row for a query.
+
+        Args:
+            query (str): Free-text query; repeated terms count once
+
+        Returns:
+            np.ndarray: float32 scores, one per row; 0 for rows without any query term
+        """
+        offsets, rows, impacts = self._build()
+        scores = np.zeros(len(self._terms), dtype=np.float32)
+        for token in set(tokenize(query)):
+            term = self._vocab.get(token)
+            if term is None:
+                continue
+            start, end = offsets[term], offsets[term + 1]
+            # A row holds each term once, so plain fancy-index addition is safe
+            scores[rows[start:end]] += impacts[start:end]
+        return scores
+
+    def search(self, query: str, top_k: int, rows: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Best matching rows for a query.
+
+        Args:
+            query (str): Free-text query
+            top_k (int): Maximum number of rows to return
+            rows (Optional[np.ndarray]): Only consider these record store rows
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (rows, scores), best first; only rows with a positive score
+        """
+        scores = self.scores(query)
+        if rows is not None:
+            allowed = np.zeros(len(scores), dtype=bool)
+            allowed[rows[(rows >= 0) & (rows < len(scores))]] = True
+            scores = np.where(allowed, scores, 0.0)
+
+        matched = np.flatnonzero(scores > 0)
+        if len(matched) > top_k:
+            matched = matched[np.argpartition(-scores[matched], top_k - 1)[:top_k]]
+        order = matched[np.lexsort((matched, -scores[matched]))]
+        return order, scores[order]
+
+    def _build(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Merge the rows into term-sorted postings with precomputed BM25 impacts."""
+        if self._postings is not None:
+            return self._postings
+
+        active = [row for row, terms in enumerate(self._terms) if terms is not None]
+        vocab_size = len(self._vocab)
+        if not active:
+            self._postings = (np.zeros(vocab_size + 1, dtype=np.int64), np.zeros(0, dtype=np.int32),
+                              np.zeros(0, dtype=np.float32))
+            return self._postings
+
+        terms = np.concatenate([self._terms[row] for row in active])
+        freqs = np.concatenate([self._freqs[row] for row in active])
+        lengths = np.array([self._freqs[row].sum() for row in active], dtype=np.float32)
+        rows = np.repeat(np.array(active, dtype=np.int32), [len(self._terms[row]) for row in active])
+        row_lengths = np.repeat(lengths, [len(self._terms[row]) for row in active])
+
+        document_freq = np.bincount(terms, minlength=vocab_size)
+        idf = np.log1p((len(active) - document_freq + 0.5) / (document_freq + 0.5)).astype(np.float32)
+        norm = self.k1 * (1 - self.b + self.b * row_lengths / max(float(lengths.mean()), 1e-9))
+        impacts = idf[terms] * freqs * (self.k1 + 1) / (freqs + norm)
+
+        order = np.argsort(terms, kind="stable")
+        offsets = np.zeros(vocab_size + 1, dtype=np.int64)
+        np.cumsum(document_freq, out=offsets[1:])
+        self._postings = (offsets, rows[order], impacts[order].astype(np.float32))
+        return self._postings
@@ -0,0 +1,144 @@
+"""
+Concurrency helpers for Mistral chat completions.
+
+ResumeSelector makes one LLM call per resume. These helpers let those calls
+run concurrently through the async client while staying polite to the API:
+a semaphore bounds in-flight requests, a token bucket bounds the request
+rate, and 429 responses are retried after the server's Retry-After delay.
+
+Tokens are taken by complete_with_retries, once per request actually sent,
+so cache hits resolved before it never wait on the rate limit and retries
+count against it like any other request.
+"""
+import time
+import asyncio
+import random
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, List, Optional, Sequence, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class TokenBucket:
+    """
+    Async token bucket: at most `rate` acquisitions per second on average,
+    with bursts of up to `capacity`.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Args:
+            rate (float): Tokens added per second
+            capacity (Optional[float]): Maximum burst size; defaults to max(1, rate)
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+def is_rate_limited(error: Exception) -> bool:
+    """Whether an exception raised by the Mistral client is a 429 response."""
+    raw_response = getattr(error, "raw_response", None)
+    status_code = getattr(error, "status_code", None) or getattr(raw_response, "status_code", None)
+    return status_code == 429
+
+
+def retry_after_seconds(error: Exception) -> Optional[float]:
+    """
+    Return the delay requested by a 429 response's Retry-After header.
+
+    Args:
+        error (Exception): Exception raised by the Mistral client
+
+    Returns:
+        Optional[float]: Seconds to wait, or None if the header is missing or unparseable
+    """
+    headers = getattr(getattr(error, "raw_response", None), "headers", None) or {}
+    value = headers.get("retry-after") or headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+async def complete_with_retries(client, max_retries: int = 5, base_delay: float = 1.0,
+                                rate_limiter: Optional[TokenBucket] = None, first_token_taken: bool = False,
+                                **kwargs) -> Any:
+    """
+    Call client.chat.complete_async, retrying 429 responses.
+
+    The Retry-After header is honored when present; otherwise the delay grows
+    exponentially with jitter.
+
+    Args:
+        client: Mistral client
+        max_retries (int): Number of retries after the first attempt
+        base_delay (float): Initial backoff when the server gives no Retry-After
+        rate_limiter (Optional[TokenBucket]): Limiter acquired before every attempt, retries included
+        first_token_taken (bool): The caller already acquired the first attempt's token
+        **kwargs: Arguments for chat.complete_async
+
+    Returns:
+        Any: The chat completion response
+    """
+    for attempt in range(max_retries + 1):
+        if rate_limiter is not None and (attempt or not first_token_taken):
+            await rate_limiter.acquire()
+        try:
+            return await client.chat.complete_async(**kwargs)
+        except Exception as e:
+            if not is_rate_limited(e) or attempt == max_retries:
+                raise
+            delay = retry_after_seconds(e)
+            if delay is None:
+                delay = base_delay * (2 ** attempt) * (0.5 + random.random())
+            await asyncio.sleep(delay)
+
+
+async def gather_bounded(items: Sequence[T], worker: Callable[[T], Awaitable[R]], concurrency: int,
+                         on_result: Optional[Callable[[int, R], None]] = None) -> List[R]:
+    """
+    Run worker over items with at most `concurrency` calls in flight.
+
+    Args:
+        items (Sequence[T]): Inputs
+        worker (Callable[[T], Awaitable[R]]): Async function applied to each input
+        concurrency (int): Maximum number of concurrent calls
+        on_result (Optional[Callable[[int, R], None]]): Called with (position, result) as each call completes
+
+    Returns:
+        List[R]: Results in input order
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def run(position: int, item: T) -> R:
+        async with semaphore:
+            result = await worker(item)
+        if on_result is not None:
+            on_result(position, result)
+        return result
+
+    return await asyncio.gather(*(run(position, item) for position, item in enumerate(items)))
@@ -0,0 +1,95 @@
+"""
+Multi-pattern substring matching for metadata reranking.
+
+MetadataReranker needs, for every project description, the set of known
+skills and job titles that occur in it. Testing `term in description` for
+each term costs O(terms x description length) per query. TermMatcher
+compiles all terms into one Aho-Corasick automaton instead, so a single
+scan of the description reports every matching term id, whatever the size
+of the vocabulary.
+
+Matches are plain substring matches, exactly like the `in` checks they
+replace. Terms can be added at any time: each one extends the trie in
+O(len(term)), and the failure links are recomputed on the next match().
+"""
+from typing import Dict, List, Set
+
+
+class TermMatcher:
+    """Aho-Corasick automaton over a growing set of terms, each with a dense integer id."""
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        # Trie: transitions per node, and the ids of the terms ending exactly at each node
+        self._goto: List[Dict[str, int]] = [{}]
+        self._ends: List[List[int]] = [[]]
+        # Derived by _link(): failure link and every term id recognized at each node
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+        self._linked = True
+
+    def add(self, term: str) -> int:
+        """Id of a term, adding it to the automaton if it is new."""
+        term_id = self._ids.get(term)
+        if term_id is not None:
+            return term_id
+
+        term_id = self._ids[term] = len(self._ids)
+        node = 0
+        for char in term:
+            child = self._goto[node].get(char)
+            if child is None:
+                child = self._goto[node][char] = len(self._goto)
+                self._goto.append({})
+                self._ends.append([])
+            node = child
+        self._ends[node].append(term_id)
+        self._linked = False
+        return term_id
+
+    def get(self, term: str, default=None):
+        return self._ids.get(term, default)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, term) -> bool:
+        return term in self._ids
+
+    def __iter__(self):
+        return iter(self._ids)
+
+    def match(self, text: str) -> Set[int]:
+        """Ids of all terms that occur in text as substrings."""
+        if not self._linked:
+            self._link()
+        goto, fail, out = self._goto, self._fail, self._out
+        # The empty term, if present, ends at the root and is in every text
+        found = set(out[0])
+        node = 0
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if out[node]:
+                found.update(out[node])
+        return found
+
+    def _link(self) -> None:
+        """Compute failure links and output sets breadth-first over the trie."""
+        goto = self._goto
+        fail = [0] * len(goto)
+        out = [list(ends) for ends in self._ends]
+        queue = list(goto[0].values())
+        for node in queue:
+            for char, child in goto[node].items():
+                state = fail[node]
+                while state and char not in goto[state]:
+                    state = fail[state]
+                link = goto[state].get(char, 0)
+                fail[child] = link if link != child else 0
+                if fail[child]:
+                    out[child].extend(out[fail[child]])
+                queue.append(child)
+        self._fail, self._out = fail, out
+        self._linked = True
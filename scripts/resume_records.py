@@ -0,0 +1,229 @@
+"""
+Normalized per-resume records for ResumeSelector.
+
+The LLM returns metadata in loosely structured JSON: skills may be a list of
+strings, a list of dicts or one delimited string, and experience_years may be
+missing or not a number. ResumeRecord normalizes those fields once, when a
+resume is ingested, so indexing, reranking and summaries never have to parse
+the raw JSON again.
+
+ResumeRecordStore keeps the records in integer rows with O(1) lookups by
+file id and by file path. Rows of a bundle that has not been read yet are
+registered without a record and built on first access.
+"""
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+MAX_SKILLS = 10
+
+
+def normalize_skills(skills_raw) -> List[str]:
+    """Safely extract skills from various formats."""
+    clean_skills = []
+
+    if isinstance(skills_raw, list):
+        for skill in skills_raw:
+            try:
+                if isinstance(skill, str):
+                    clean_skills.append(skill)
+                elif isinstance(skill, dict):
+                    if 'skill' in skill:
+                        clean_skills.append(str(skill['skill']))
+                    elif 'name' in skill:
+                        clean_skills.append(str(skill['name']))
+                    else:
+                        # Take first string value from dict
+                        for value in skill.values():
+                            if isinstance(value, str):
+                                clean_skills.append(value)
+                                break
+                else:
+                    clean_skills.append(str(skill))
+            except Exception as e:
+                print(f"Warning: Could not process skill {skill}: {e}")
+                continue
+    elif isinstance(skills_raw, str):
+        # Split by common delimiters
+        delimiters = [',', ';', '|', '\n']
+        skills_text = skills_raw
+        for delimiter in delimiters:
+            skills_text = skills_text.replace(delimiter, '|')
+        clean_skills = [skill.strip() for skill in skills_text.split('|') if skill.strip()]
+
+    return clean_skills[:MAX_SKILLS]
+
+
+def normalize_list_items(items_raw) -> List[str]:
+    """Safely extract items from various list formats."""
+    clean_items = []
+
+    if isinstance(items_raw, list):
+        for item in items_raw:
+            try:
+                if isinstance(item, str):
+                    clean_items.append(item)
+                elif isinstance(item, dict):
+                    if 'name' in item:
+                        clean_items.append(str(item['name']))
+                    elif 'title' in item:
+                        clean_items.append(str(item['title']))
+                    elif 'degree' in item:
+                        clean_items.append(str(item['degree']))
+                    else:
+                        clean_items.append(str(item))
+                else:
+                    clean_items.append(str(item))
+            except Exception as e:
+                print(f"Warning: Could not process item {item}: {e}")
+                continue
+
+    return clean_items
+
+
+def normalize_experience(value) -> float:
+    """experience_years as a number; anything else counts as 0."""
+    if not isinstance(value, (int, float)):
+        return 0
+    return value
+
+
+class ResumeRecord:
+    """Normalized view of one resume's metadata, built once at ingest."""
+
+    __slots__ = (
+        "file_id", "file_name", "file_path", "name", "summary", "experience_years",
+        "skills", "skills_lower", "job_titles", "job_titles_lower", "education", "education_lower",
+    )
+
+    def __init__(self, file_id: str, file_name: str, file_path: str, metadata: Dict[str, Any]):
+        """
+        Args:
+            file_id (str): Resume id
+            file_name (str): Display file name
+            file_path (str): Path the resume was read from
+            metadata (Dict[str, Any]): Raw metadata returned by the LLM
+        """
+        self.file_id = file_id
+        self.file_name = file_name
+        self.file_path = file_path
+        self.name = str(metadata.get("name", "Unknown"))
+        self.summary = str(metadata.get("summary", ""))
+        self.experience_years = normalize_experience(metadata.get("experience_years", 0))
+        self.skills: Tuple[str, ...] = tuple(normalize_skills(metadata.get("skills", [])))
+        self.job_titles: Tuple[str, ...] = tuple(normalize_list_items(metadata.get("job_titles", [])))
+        self.education: Tuple[str, ...] = tuple(normalize_list_items(metadata.get("education", [])))
+        self.skills_lower = tuple(skill.lower() for skill in self.skills)
+        self.job_titles_lower = tuple(title.lower() for title in self.job_titles)
+        self.education_lower = tuple(degree.lower() for degree in self.education)
+
+    @classmethod
+    def from_entry(cls, file_id: str, entry: Dict[str, Any]) -> "ResumeRecord":
+        """Build a record from a selector metadata entry ({file_name, file_path, text, metadata})."""
+        return cls(file_id, entry["file_name"], entry["file_path"], entry.get("metadata") or {})
+
+
+class ResumeRecordStore:
+    """
+    ResumeRecords in integer rows, with O(1) lookup by file id and file path.
+
+    Removed rows are reused by later additions, so row numbers stay dense.
+    """
+
+    def __init__(self, loader: Optional[Callable[[str], ResumeRecord]] = None):
+        """
+        Args:
+            loader (Optional[Callable[[str], ResumeRecord]]): Builds the record of a
+                row registered with reserve() the first time it is needed
+        """
+        self._loader = loader
+        self._rows: List[Optional[ResumeRecord]] = []
+        self._file_ids: List[Optional[str]] = []
+        self._file_paths: List[Optional[str]] = []
+        self._row_by_id: Dict[str, int] = {}
+        self._row_by_path: Dict[str, int] = {}
+        self._free_rows: List[int] = []
+
+    def add(self, record: ResumeRecord) -> int:
+        """Insert or replace the record for record.file_id; returns its row."""
+        row = self.reserve(record.file_id, record.file_path)
+        self._rows[row] = record
+        return row
+
+    def reserve(self, file_id: str, file_path: str) -> int:
+        """Register a row whose record is built lazily by the loader; returns the row."""
+        row = self._row_by_id.get(file_id)
+        if row is not None:
+            self._drop_path(row)
+        elif self._free_rows:
+            row = self._free_rows.pop()
+        else:
+            row = len(self._rows)
+            self._rows.append(None)
+            self._file_ids.append(None)
+            self._file_paths.append(None)
+
+        self._rows[row] = None
+        self._file_ids[row] = file_id
+        self._file_paths[row] = file_path
+        self._row_by_id[file_id] = row
+        self._row_by_path[file_path] = row
+        return row
+
+    def remove(self, file_id: str) -> bool:
+        """Remove the record of a resume; returns False if it was not stored."""
+        row = self._row_by_id.pop(file_id, None)
+        if row is None:
+            return False
+        self._drop_path(row)
+        self._rows[row] = None
+        self._file_ids[row] = None
+        self._file_paths[row] = None
+        self._free_rows.append(row)
+        return True
+
+    def get(self, file_id: str) -> Optional[ResumeRecord]:
+        """Record of a resume, or None if it is not stored."""
+        row = self._row_by_id.get(file_id)
+        return None if row is None else self.at(row)
+
+    def at(self, row: int) -> ResumeRecord:
+        """Record stored in a row."""
+        record = self._rows[row]
+        if record is None:
+            file_id = self._file_ids[row]
+            if file_id is None:
+                raise KeyError(row)
+            record = self._rows[row] = self._loader(file_id)
+        return record
+
+    def row(self, file_id: str) -> Optional[int]:
+        """Row of a resume, or None if it is not stored."""
+        return self._row_by_id.get(file_id)
+
+    def file_id_at(self, row: int) -> Optional[str]:
+        """Id of the resume stored in a row, or None for a free row."""
+        return self._file_ids[row]
+
+    def file_id_for_path(self, file_path: str) -> Optional[str]:
+        """Id of the resume read from a path, or None."""
+        row = self._row_by_path.get(file_path)
+        return None if row is None else self._file_ids[row]
+
+    def clear(self) -> None:
+        self._rows.clear()
+        self._file_ids.clear()
+        self._file_paths.clear()
+        self._row_by_id.clear()
+        self._row_by_path.clear()
+        self._free_rows.clear()
+
+    def __contains__(self, file_id) -> bool:
+        return file_id in self._row_by_id
+
+    def __len__(self) -> int:
+        return len(self._row_by_id)
+
+    def _drop_path(self, row: int) -> None:
+        """Forget the path mapping that points at a row."""
+        path = self._file_paths[row]
+        if self._row_by_path.get(path) == row:
+            del self._row_by_path[path]
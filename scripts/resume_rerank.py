@@ -0,0 +1,174 @@
+"""
+Vectorized metadata reranking for ResumeSelector.
+
+calculate_metadata_similarity scores one candidate at a time with substring
+checks per skill, degree and job title. MetadataReranker computes the same
+score for every indexed resume at once: candidate features are kept as sparse
+matrices (one row per ResumeRecordStore row), the project description is
+turned into a feature vector once, and the score is a few sparse
+matrix-vector products. The skills and titles a description mentions are
+found in one scan by a TermMatcher automaton over the whole vocabulary (see
+resume_matcher), so each candidate's score is the intersection of its terms
+with that set.
+
+Scoring rules (identical to calculate_metadata_similarity):
+
+    skills      0.05 per skill mentioned in the description, capped at 0.4
+    experience  0.2 if "senior" is asked for and experience >= 5 years,
+                else 0.2 if "junior" is asked for and experience < 5 years
+    education   0.1 per degree matching a requested "phd" or "master"
+    job titles  0.05 per title mentioned in the description
+    total       capped at 1.0
+"""
+from typing import List, Optional
+
+import numpy as np
+
+from resume_lazy import LazyModule
+from resume_matcher import TermMatcher
+from resume_records import ResumeRecord
+
+sparse = LazyModule("scipy.sparse")
+
+# Education feature columns: a degree naming only a PhD, only a Master's, or both
+_EDU_PHD, _EDU_MASTER, _EDU_BOTH = range(3)
+
+
+class MetadataReranker:
+    """
+    Sparse candidate features, kept up to date row by row.
+
+    Rows follow ResumeRecordStore rows; cleared rows score 0. The CSR matrices
+    are rebuilt lazily on the first score() after a change.
+    """
+
+    def __init__(self):
+        self._skill_vocab = TermMatcher()
+        self._title_vocab = TermMatcher()
+        self._skill_cols: List[List[int]] = []
+        self._title_cols: List[List[int]] = []
+        self._edu_cols: List[List[int]] = []
+        self._experience: List[float] = []
+        self._active: List[bool] = []
+        self._matrices = None
+
+    def set_row(self, row: int, record: ResumeRecord) -> None:
+        """Store the features of the resume held in a record store row."""
+        while len(self._skill_cols) <= row:
+            self._skill_cols.append([])
+            self._title_cols.append([])
+            self._edu_cols.append([])
+            self._experience.append(0.0)
+            self._active.append(False)
+
+        self._skill_cols[row] = [self._skill_vocab.add(s) for s in record.skills_lower]
+        self._title_cols[row] = [self._title_vocab.add(t) for t in record.job_titles_lower]
+        education = (self._education_column(degree) for degree in record.education_lower)
+        self._edu_cols[row] = [col for col in education if col is not None]
+        self._experience[row] = float(record.experience_years)
+        self._active[row] = True
+        self._matrices = None
+
+    def clear_row(self, row: int) -> None:
+        """Forget the features of a removed resume."""
+        if row < len(self._skill_cols):
+            self._skill_cols[row] = []
+            self._title_cols[row] = []
+            self._edu_cols[row] = []
+            self._experience[row] = 0.0
+            self._active[row] = False
+            self._matrices = None
+
+    def clear(self) -> None:
+        self.__init__()
+
+    def __len__(self) -> int:
+        return len(self._skill_cols)
+
+    def score(self, project_description: str, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Metadata similarity of resumes to a project description.
+
+        Args:
+            project_description (str): Project description
+            rows (Optional[np.ndarray]): Record store rows to score; all rows if None
+
+        Returns:
+            np.ndarray: Scores between 0 and 1, one per requested row
+        """
+        scores = self.score_many([project_description])[:, 0]
+        return scores if rows is None else scores[rows]
+
+    def score_many(self, project_descriptions: List[str]) -> np.ndarray:
+        """
+        Metadata similarity of every row to several project descriptions at once.
+
+        The descriptions become the columns of dense query matrices, so each
+        feature family costs one sparse matrix product for the whole batch.
+
+        Args:
+            project_descriptions (List[str]): Project descriptions
+
+        Returns:
+            np.ndarray: Scores between 0 and 1, shape (rows, descriptions)
+        """
+        skills, titles, education, experience, active = self._features()
+        descs = [description.lower() for description in project_descriptions]
+
+        skill_queries = self._query_matrix(self._skill_vocab, descs)
+        title_queries = self._query_matrix(self._title_vocab, descs)
+        wants_phd = np.array(["phd" in desc for desc in descs])
+        wants_master = np.array(["master" in desc for desc in descs])
+        edu_queries = np.vstack([wants_phd, wants_master, wants_phd | wants_master]).astype(np.float64)
+
+        score = np.minimum(0.4, np.asarray(skills @ skill_queries) * 0.05)
+        for column, desc in enumerate(descs):
+            if "senior" in desc:
+                score[:, column] += np.where(experience >= 5, 0.2, 0.0)
+            elif "junior" in desc:
+                score[:, column] += np.where(experience < 5, 0.2, 0.0)
+        score += np.asarray(education @ edu_queries) * 0.1
+        score += np.asarray(titles @ title_queries) * 0.05
+        return np.where(active[:, None], np.minimum(1.0, score), 0.0)
+
+    @staticmethod
+    def _query_matrix(vocab: TermMatcher, descs: List[str]) -> np.ndarray:
+        """(terms, descriptions) matrix: 1 where the term is mentioned in the description."""
+        queries = np.zeros((len(vocab), len(descs)), dtype=np.float64)
+        for column, desc in enumerate(descs):
+            queries[list(vocab.match(desc)), column] = 1.0
+        return queries
+
+    def _features(self):
+        """CSR matrices of the current rows: (skills, titles, education, experience, active)."""
+        if self._matrices is None:
+            self._matrices = (
+                self._csr(self._skill_cols, len(self._skill_vocab)),
+                self._csr(self._title_cols, len(self._title_vocab)),
+                self._csr(self._edu_cols, 3),
+                np.asarray(self._experience, dtype=np.float64),
+                np.asarray(self._active, dtype=bool),
+            )
+        return self._matrices
+
+    @staticmethod
+    def _csr(columns: List[List[int]], width: int) -> "sparse.csr_matrix":
+        """One CSR row per list of column indices; repeated columns add up."""
+        indptr = np.zeros(len(columns) + 1, dtype=np.int64)
+        np.cumsum([len(cols) for cols in columns], out=indptr[1:])
+        indices = np.fromiter((col for cols in columns for col in cols), dtype=np.int32, count=int(indptr[-1]))
+        data = np.ones(len(indices), dtype=np.float64)
+        matrix = sparse.csr_matrix((data, indices, indptr), shape=(len(columns), width))
+        matrix.sum_duplicates()
+        return matrix
+
+    @staticmethod
+    def _education_column(degree: str) -> Optional[int]:
+        has_phd, has_master = "phd" in degree, "master" in degree
+        if has_phd and has_master:
+            return _EDU_BOTH
+        if has_phd:
+            return _EDU_PHD
+        if has_master:
+            return _EDU_MASTER
+        return None
@@ -1,16 +1,127 @@
 
+import gc
 import os
 import sys
 import json
 import uuid
+import asyncio
+import itertools
+import threading
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Callable, Iterable, Iterator, List, Dict, Any, Optional, Tuple, Union
 import logging
 import numpy as np
-import faiss
-import pdfplumber
-from sentence_transformers import SentenceTransformer
-from mistralai import Mistral
+from resume_lazy import LazyAttribute, LazyModule
+from resume_cache import TextCache, JsonCache, EmbeddingStore, hash_bytes, hash_file, settings_fingerprint
+from resume_extraction import extract_pdf_text, extract_texts_parallel, extraction_backends
+from resume_llm import TokenBucket, complete_with_retries, gather_bounded
+from resume_records import ResumeRecord, ResumeRecordStore, normalize_list_items, normalize_skills
+from resume_rerank import MetadataReranker
+from resume_lexical import BM25Index
+from resume_index import (
+    INDEX_TYPES, index_params, index_type_of, make_index, remove_ids, search_parameters, upgrade_index, vector_bytes
+)
+from resume_bundle import BUNDLE_FORMAT_VERSION, folder_fingerprint, open_bundle, read_manifest, write_bundle
+from resume_texts import DiskTextList
+from resume_events import EventHandler, stream_events
+from resume_encoder import ENCODER_BACKENDS, OnnxSentenceEncoder, encode_parallel
+from resume_sources import BufferReader, PdfSource, iter_cursor_rows, pdf_buffer
+
+# Heavy dependencies are imported on first use; see resume_lazy
+faiss = LazyModule("faiss")
+SentenceTransformer = LazyAttribute("sentence_transformers", "SentenceTransformer")
+Mistral = LazyAttribute("mistralai", "Mistral")
+
+# pdfplumber settings used for every page; part of the text cache key
+PDF_EXTRACT_SETTINGS = {
+    "x_tolerance": 1,
+    "y_tolerance": 1,
+    "keep_blank_chars": False,
+    "use_text_flow": True,
+}
+
+LLM_MODEL = "mistral-small-latest"
+
+# Only the first METADATA_TEXT_LIMIT characters of a resume are sent to the LLM
+METADATA_TEXT_LIMIT = 4000
+
+# Leading characters of a resume embedded after its metadata profile
+PROFILE_TEXT_CHARS = 3000
+
+# Leading characters of a resume shown to the LLM in a candidate summary
+SUMMARY_EXCERPT_CHARS = 1500
+
+# Leading characters of a resume returned with each search result in low-memory mode
+RESULT_EXCERPT_CHARS = 500
+
+# Nearest neighbours reranked per query on approximate indexes; flat indexes rerank the whole corpus
+ANN_RERANK_POOL = 1000
+
+# Retrieval modes: dense FAISS search with metadata reranking, or that ranking fused with BM25
+SEARCH_MODES = ("dense", "hybrid")
+
+# Reciprocal rank fusion: each ranking contributes 1 / (RRF_K + rank) for its best RRF_DEPTH hits
+RRF_K = 60
+RRF_DEPTH = 100
+
+# Rows read, extracted, analysed and indexed together by ingest_resumes/ingest_cursor
+INGEST_BATCH_SIZE = 64
+
+# With encode_workers > 1, encodes of at least this many texts are sharded over processes;
+# smaller ones do not amortize starting the pool
+BULK_ENCODE_MIN_TEXTS = 256
+
+METADATA_PROMPT_TEMPLATE = """
+Analyze the following resume text and extract structured metadata in JSON format:
+{text}
+
+Return JSON with keys:
+- name
+- email
+- phone
+- skills
+- experience_years
+- education
+- job_titles
+- summary
+Important: Only return valid JSON, no additional text.
+"""
+
+# Derived from the template itself, so editing the prompt invalidates cached metadata
+METADATA_PROMPT_VERSION = settings_fingerprint({"template": METADATA_PROMPT_TEMPLATE, "temperature": 0.1})
+
+SUMMARY_PROMPT_TEMPLATE = """
+## PROJECT DESCRIPTION:
+{project_description}
+
+## CANDIDATE METADATA:
+Name: {name}
+Skills: {skills}
+Experience: {experience_years} years
+Previous Roles: {job_titles}
+Education: {education}
+
+## RESUME EXCERPT:
+{excerpt}
+
+---
+This candidate has been SELECTED as a top match for the project. Analyze why this candidate is SUITABLE and provide positive reasons for selection in EXACTLY this JSON format:
+{{
+  "name": "{name}",
+  "skills": {skills_json},
+  "reasons": [
+    "Positive reason why this candidate is selected for this project",
+    "Another positive reason highlighting their strengths", 
+    "Third positive reason showing their fit for the role"
+  ],
+  "score": {score:.2f}
+}}
+Focus on strengths, relevant experience, matching skills, and why they would be successful in this project.
+"""
+
+SUMMARY_PROMPT_VERSION = settings_fingerprint({"template": SUMMARY_PROMPT_TEMPLATE, "temperature": 0.3})
+
+
 class ResumeSelector:
     """
     A class for processing resumes and finding the best candidates for projects.
@@ -20,9 +131,28 @@ class ResumeSelector:
     - Resume metadata extraction using LLM
     - Vector embedding and similarity search
     - Candidate ranking and summary generation
+    - Incremental add/remove/update of single resumes
+    - Saving and memory-mapping per-project index bundles
+    - A global index shared by many projects, searched per project
+    - Ingesting PDFs from memory and database cursors (see resume_sources)
+    - A low-memory mode that keeps resume texts on disk
+    - Progress events for every pipeline stage (see resume_events)
+
+    The Mistral client and the embedding model are created on first use, so
+    constructing a selector to extract text or read metadata is cheap; call
+    warm_up() to load them ahead of the first request.
     """
 
-    def __init__(self, api_key: str, embedding_model: str = "BAAI/bge-base-en-v1.5", quiet: bool = False):
+    def __init__(self, api_key: str, embedding_model: str = "BAAI/bge-base-en-v1.5", quiet: bool = False,
+                 cache_dir: Optional[str] = None, text_cache_max_bytes: int = 256 * 1024 * 1024,
+                 extraction_workers: int = 1, extraction_timeout: float = 60.0,
+                 llm_concurrency: int = 1, llm_requests_per_second: Optional[float] = None,
+                 index_type: str = "flat", index_options: Optional[Dict[str, Any]] = None,
+                 rerank_pool: Optional[int] = None, low_memory: bool = False,
+                 embedding_backend: str = "torch", encode_batch_size: int = 32,
+                 encode_workers: int = 1, encode_threads: Optional[int] = None, search_mode: str = "dense",
+                 extraction_backend: str = "pdfplumber", extraction_max_chars: Optional[int] = None,
+                 extraction_max_pages: Optional[int] = None):
         """
         Initialize the resume selector with a Mistral API key.
 
@@ -30,103 +160,504 @@ class ResumeSelector:
             api_key (str): Mistral API key for LLM operations
             embedding_model (str): HuggingFace embedding model name
             quiet (bool): If True, suppress all console output
+            cache_dir (Optional[str]): Root directory for persistent caches; caching is disabled if None
+            text_cache_max_bytes (int): Size bound of the extracted PDF text cache
+            extraction_workers (int): Processes used to extract PDFs in process_resumes; 1 extracts serially
+            extraction_timeout (float): Seconds a single PDF may take in parallel extraction before it is skipped
+            llm_concurrency (int): Concurrent metadata requests in process_resumes; 1 calls the LLM serially
+            llm_requests_per_second (Optional[float]): Rate limit for concurrent LLM requests; unlimited if None
+            index_type (str): FAISS index type, one of resume_index.INDEX_TYPES; trained types stay
+                flat until the corpus is large enough to train them
+            index_options (Optional[Dict[str, Any]]): Overrides for resume_index.DEFAULT_INDEX_PARAMS
+            rerank_pool (Optional[int]): Nearest neighbours reranked per query; defaults to the whole
+                corpus for flat indexes and ANN_RERANK_POOL otherwise
+            low_memory (bool): Keep resume texts in an on-disk DiskTextList instead of RAM; search
+                results then carry a short "excerpt" instead of the full "text"
+            embedding_backend (str): "torch" runs SentenceTransformer; "onnx" and "onnx_int8" run the
+                model exported to ONNX Runtime (see resume_encoder), the latter with int8 weights
+            encode_batch_size (int): Texts per embedding batch
+            encode_workers (int): Processes sharing the model for bulk encodes of at least
+                BULK_ENCODE_MIN_TEXTS texts (see resume_encoder.encode_parallel); torch backend only
+            encode_threads (Optional[int]): Compute threads per encode process; cores / encode_workers if None
+            search_mode (str): Default retrieval mode, one of SEARCH_MODES; "hybrid" fuses the dense
+                ranking with a BM25 keyword ranking of the whole corpus (see resume_lexical)
+            extraction_backend (str): PDF text backend, one of resume_extraction.extraction_backends();
+                "auto" uses PDFium and falls back to pdfplumber for documents it cannot read
+            extraction_max_chars (Optional[int]): Stop parsing a PDF once this many characters are
+                collected and keep only those; the whole document if None
+            extraction_max_pages (Optional[int]): Parse at most this many leading pages of a PDF
         """
+        if index_type not in INDEX_TYPES:
+            raise ValueError(f"Unknown index type {index_type!r}; expected one of {', '.join(INDEX_TYPES)}")
+        index_params(index_options)
+        if embedding_backend not in ENCODER_BACKENDS:
+            raise ValueError(f"Unknown embedding backend {embedding_backend!r}; "
+                             f"expected one of {', '.join(ENCODER_BACKENDS)}")
+        if search_mode not in SEARCH_MODES:
+            raise ValueError(f"Unknown search mode {search_mode!r}; expected one of {', '.join(SEARCH_MODES)}")
+        if encode_workers > 1 and embedding_backend != "torch":
+            raise ValueError("encode_workers > 1 requires the torch backend; ONNX Runtime sessions do not survive fork")
+        if extraction_backend not in extraction_backends():
+            raise ValueError(f"Unknown extraction backend {extraction_backend!r}; "
+                             f"expected one of {', '.join(extraction_backends())}")
+
         # Suppress PDF extraction warnings
         logging.getLogger("pdfminer").setLevel(logging.ERROR)
 
         self.quiet = quiet
-
-        # Initialize Mistral client
-        self.mistral_client = Mistral(api_key=api_key)
-
-        # Initialize embedding model
-        if not self.quiet:
-            print("Loading embedding model...")
-        self.embedding_model = SentenceTransformer(embedding_model)
-        self.embedding_dim = self.embedding_model.get_sentence_embedding_dimension()
+        self.extraction_workers = extraction_workers
+        self.extraction_timeout = extraction_timeout
+        # Passed to extract_pdf_text; only non-defaults, so default cache keys stay those of older caches
+        self.extraction_options: Dict[str, Any] = {}
+        if extraction_backend != "pdfplumber":
+            self.extraction_options["backend"] = extraction_backend
+        if extraction_max_chars is not None:
+            self.extraction_options["max_chars"] = extraction_max_chars
+        if extraction_max_pages is not None:
+            self.extraction_options["max_pages"] = extraction_max_pages
+        self.llm_concurrency = llm_concurrency
+        self.llm_requests_per_second = llm_requests_per_second
+        self.index_type = index_type
+        self.index_options = dict(index_options or {})
+        self.rerank_pool = rerank_pool
+        self.low_memory = low_memory
+
+        # Mistral client and embedding model, created by their properties on first use
+        self._api_key = api_key
+        self._mistral_client = None
+        # Event loop of the async LLM calls; see _run_async
+        self._llm_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._llm_loop_lock = threading.Lock()
+        self._embedding_model = None
+        self._embedding_store = None
+        self.embedding_model_name = embedding_model
+        self.embedding_backend = embedding_backend
+        self.encode_batch_size = encode_batch_size
+        self.encode_workers = encode_workers
+        self.encode_threads = encode_threads
+        # Backends produce slightly different vectors, so stores and bundles are kept apart
+        self.embedding_model_id = (
+            embedding_model if embedding_backend == "torch" else f"{embedding_model}@{embedding_backend}"
+        )
 
         # Initialize storage
         self.index = None
-        self.resumes: List[str] = []
+        self._text_spill_dir = os.path.join(cache_dir, "texts") if cache_dir else None
+        self.resumes: List[str] = DiskTextList(self._text_spill_dir) if low_memory else []
         self.file_paths: List[str] = []
+        self.file_ids: List[str] = []
         self.resume_metadata: Dict[str, Any] = {}
 
+        # file_id -> position in resumes/file_paths/file_ids, and file_id <-> FAISS id
+        self._positions: Dict[str, int] = {}
+        self._index_ids: Dict[str, int] = {}
+        self._file_ids_by_index_id: Dict[int, str] = {}
+        self._next_index_id = 0
+
+        # Normalized skills/titles/education per resume, with O(1) id and path lookups
+        self.records = ResumeRecordStore(loader=self._load_record)
+
+        # Sparse metadata features per record row, filled on the first search
+        self.reranker = MetadataReranker()
+        self._reranker_ready = False
+
+        # BM25 over resume texts and skills per record row, built on the first hybrid search
+        self.search_mode = search_mode
+        self.lexical = BM25Index()
+        self._lexical_ready = False
+        self._rows_by_index_id: Optional[np.ndarray] = None
+
+        # Global mode: project id -> {file_id: (file_name, file_path)}, with file ids derived from content hashes
+        self.projects: Dict[str, Dict[str, tuple]] = {}
+        self._project_fingerprints: Dict[str, Dict[str, List[int]]] = {}
+        self.last_sync_stats: Dict[str, int] = {"added": 0, "removed": 0, "shared": 0, "rescanned": 0}
+
+        # Initialize persistent caches
+        self.cache_dir = cache_dir
+        self._text_cache_max_bytes = text_cache_max_bytes
+        self._open_caches()
+        self.last_index_stats: Dict[str, int] = {"reused": 0, "computed": 0}
+
+        # Receives progress events (see resume_events) while set
+        self.on_event: Optional[EventHandler] = None
+
         if not self.quiet:
             print("✅ Resume Selector initialized!")
 
+    @property
+    def mistral_client(self):
+        """Mistral client, created on first use."""
+        if self._mistral_client is None:
+            self._mistral_client = Mistral(api_key=self._api_key)
+        return self._mistral_client
+
+    @property
+    def embedding_model(self):
+        """Embedding model (SentenceTransformer or OnnxSentenceEncoder), loaded on first use."""
+        if self._embedding_model is None:
+            if not self.quiet:
+                print("Loading embedding model...")
+            if self.embedding_backend == "torch":
+                self._embedding_model = SentenceTransformer(self.embedding_model_name)
+            else:
+                self._embedding_model = OnnxSentenceEncoder(
+                    self.embedding_model_name,
+                    export_dir=os.path.join(self.cache_dir, "onnx") if self.cache_dir else None,
+                    quantize=self.embedding_backend == "onnx_int8",
+                    batch_size=self.encode_batch_size
+                )
+        return self._embedding_model
+
+    @property
+    def embedding_dim(self) -> int:
+        return self.embedding_model.get_sentence_embedding_dimension()
+
+    @property
+    def embedding_store(self) -> Optional[EmbeddingStore]:
+        """Persistent embedding store of this model, opened on first use; None without a cache directory."""
+        if self._embedding_store is None and self.cache_dir:
+            self._embedding_store = EmbeddingStore(self.cache_dir, self.embedding_model_id, self.embedding_dim)
+        return self._embedding_store
+
+    def warm_up(self) -> None:
+        """Load the embedding model, its store and the Mistral client now instead of on first use."""
+        self.embedding_store
+        self.mistral_client
+        faiss.IndexFlatIP
+
+    def prepare_fork(self) -> None:
+        """
+        Get a warm selector ready to be shared by forked worker processes.
+
+        Loads the model, switches a torch model to inference (eval, no
+        gradients) and closes the cache databases and the Mistral client,
+        whose connections must not cross a fork. Surviving objects are moved
+        to the permanent GC generation so collections in the children do not
+        write to, and thereby copy, the pages holding them. Each child then
+        calls after_fork().
+        """
+        self.warm_up()
+        if hasattr(self.embedding_model, "parameters"):
+            self.embedding_model.eval()
+            for parameter in self.embedding_model.parameters():
+                parameter.requires_grad_(False)
+        self._close_caches()
+        self._mistral_client = None
+        self._stop_llm_loop()
+        gc.collect()
+        gc.freeze()
+
+    def _run_async(self, coroutine):
+        """
+        Run a coroutine to completion on the selector's LLM event loop.
+
+        The Mistral client creates its async HTTP client once and binds its
+        pooled connections to the loop of the first request, so every async
+        call must run on the same loop: a fresh asyncio.run() per batch would
+        fail with "Event loop is closed". The loop runs in a daemon thread,
+        started on first use, for the life of the selector.
+        """
+        with self._llm_loop_lock:
+            if self._llm_loop is None:
+                loop = asyncio.new_event_loop()
+
+                def serve() -> None:
+                    loop.run_forever()
+                    loop.close()
+
+                threading.Thread(target=serve, name="resume-selector-llm", daemon=True).start()
+                self._llm_loop = loop
+        return asyncio.run_coroutine_threadsafe(coroutine, self._llm_loop).result()
+
+    def _stop_llm_loop(self) -> None:
+        """Stop the LLM event loop thread; the next async call starts a new one."""
+        with self._llm_loop_lock:
+            loop, self._llm_loop = self._llm_loop, None
+        if loop is not None:
+            loop.call_soon_threadsafe(loop.stop)
+
+    def after_fork(self) -> None:
+        """Reopen per-process resources in a worker forked after prepare_fork()."""
+        self._open_caches()
+        if isinstance(self.resumes, DiskTextList):
+            self.resumes.detach()
+
+    def _open_caches(self) -> None:
+        cache_dir = self.cache_dir
+        self.text_cache = TextCache(cache_dir, max_bytes=self._text_cache_max_bytes) if cache_dir else None
+        self.metadata_cache = JsonCache(cache_dir, "resume_metadata") if cache_dir else None
+        self.summary_cache = JsonCache(cache_dir, "candidate_summaries") if cache_dir else None
+
+    def _close_caches(self) -> None:
+        for cache in (self.text_cache, self.metadata_cache, self.summary_cache, self._embedding_store):
+            if cache is not None:
+                cache.close()
+        self.text_cache = self.metadata_cache = self.summary_cache = self._embedding_store = None
+
     def extract_text_from_pdf(self, pdf_path: str) -> str:
         """
         Extract text content from a PDF file.
 
+        When a cache directory is configured, unchanged files are served from
+        the text cache without being parsed again.
+
         Args:
             pdf_path (str): Path to the PDF file
 
         Returns:
             str: Extracted text content
         """
-        text = ""
         try:
-            with pdfplumber.open(pdf_path) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text(
-                        x_tolerance=1,
-                        y_tolerance=1,
-                        keep_blank_chars=False,
-                        use_text_flow=True
-                    )
-                    if page_text:
-                        text += page_text + "\n\n"
+            cache_key = self._text_cache_key(pdf_path)
+        except OSError as e:
+            print(f"❌ Error reading {pdf_path}: {e}", file=sys.stderr)
+            return ""
+
+        return self._extract_text(pdf_path, cache_key, pdf_path)
+
+    def extract_text_from_bytes(self, data: PdfSource, name: str = "<bytes>") -> str:
+        """
+        Extract text content from an in-memory PDF.
+
+        Args:
+            data (PdfSource): PDF contents as bytes, bytearray, memoryview, BytesIO or a
+                binary file object; buffers are parsed in place, without a copy
+            name (str): Label used in error messages
+
+        Returns:
+            str: Extracted text content
+        """
+        buffer = pdf_buffer(data)
+        return self._extract_buffer(buffer, hash_bytes(buffer), name)
+
+    def _extract_buffer(self, buffer: memoryview, digest: str, name: str) -> str:
+        """Extract an in-memory PDF whose contents hash to digest."""
+        cache_key = None
+        if self.text_cache is not None:
+            cache_key = TextCache.make_key(digest, self._extraction_key_settings())
+        return self._extract_text(BufferReader(buffer), cache_key, name)
+
+    def extract_texts_from_pdfs(self, pdf_paths: List[str]) -> List[str]:
+        """
+        Extract text from many PDF files, in parallel when extraction_workers > 1.
+
+        Cached files are served from the text cache; only misses are sent to
+        the worker processes. A file that fails, crashes its worker or exceeds
+        extraction_timeout yields an empty string without affecting the others.
+
+        Args:
+            pdf_paths (List[str]): Paths to PDF files
+
+        Returns:
+            List[str]: Extracted text per path, in input order
+        """
+        if self.extraction_workers <= 1 or len(pdf_paths) < 2:
+            texts = []
+            for path in pdf_paths:
+                texts.append(self.extract_text_from_pdf(path))
+                self._emit_extracted(path, texts[-1])
+            return texts
+
+        texts = [""] * len(pdf_paths)
+        cache_keys: List[Optional[str]] = [None] * len(pdf_paths)
+        pending = []
+        for position, path in enumerate(pdf_paths):
+            try:
+                cache_keys[position] = self._text_cache_key(path)
+            except OSError as e:
+                print(f"❌ Error reading {path}: {e}", file=sys.stderr)
+                continue
+            cached = self.text_cache.get(cache_keys[position]) if cache_keys[position] else None
+            if cached is not None:
+                texts[position] = cached
+                self._emit_extracted(path, cached)
+            else:
+                pending.append(position)
+
+        outcomes = extract_texts_parallel(
+            [pdf_paths[position] for position in pending],
+            PDF_EXTRACT_SETTINGS,
+            workers=self.extraction_workers,
+            timeout=self.extraction_timeout,
+            on_result=lambda i, text, error: self._emit_extracted(pdf_paths[pending[i]], text or "", error),
+            **self.extraction_options
+        )
+        for position, (text, error) in zip(pending, outcomes):
+            if text is None:
+                print(f"❌ Error extracting text from {pdf_paths[position]}: {error}", file=sys.stderr)
+                continue
+            texts[position] = text
+            if cache_keys[position] is not None:
+                self.text_cache.put(cache_keys[position], text)
+
+        return texts
+
+    def _emit_extracted(self, pdf_path: str, text: str, error: Optional[str] = None) -> None:
+        self._emit("extracted", file_name=Path(pdf_path).name, chars=len(text),
+                   error=error or (None if text else "no text extracted"))
+
+    def _text_cache_key(self, pdf_path: str) -> Optional[str]:
+        """Text cache key for a PDF file, or None when caching is disabled."""
+        if self.text_cache is None:
+            return None
+        return TextCache.make_key(hash_file(pdf_path), self._extraction_key_settings())
+
+    def _extraction_key_settings(self) -> Dict[str, Any]:
+        """Everything that changes the extracted text, for the text cache key."""
+        options = dict(self.extraction_options)
+        return {"extractor": options.pop("backend", "pdfplumber"), **PDF_EXTRACT_SETTINGS, **options}
+
+    def _extract_text(self, source, cache_key: Optional[str], label: str) -> str:
+        """Extract a path or file object, going through the text cache when enabled."""
+        if cache_key is not None:
+            cached = self.text_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        try:
+            text = extract_pdf_text(source, PDF_EXTRACT_SETTINGS, **self.extraction_options)
         except Exception as e:
-            print(f"❌ Error extracting text from {pdf_path}: {e}", file=sys.stderr)
+            print(f"❌ Error extracting text from {label}: {e}", file=sys.stderr)
+            return ""
 
-        return text.strip()
+        if cache_key is not None:
+            self.text_cache.put(cache_key, text)
+        return text
 
     def extract_metadata(self, text: str) -> Dict[str, Any]:
         """
         Extract structured metadata from resume text using LLM.
 
+        When a cache directory is configured, results are memoized by the hash
+        of the text sent to the LLM, the prompt version and the model name.
+        Fallback results from failed calls are never cached.
+
         Args:
             text (str): Resume text content
 
         Returns:
             Dict[str, Any]: Extracted metadata including name, skills, experience, etc.
         """
-        prompt = f"""
-Analyze the following resume text and extract structured metadata in JSON format:
-{text[:4000]}
+        cache_key, cached = self._cached_metadata(text)
+        if cached is not None:
+            return cached
 
-Return JSON with keys:
-- name
-- email
-- phone
-- skills
-- experience_years
-- education
-- job_titles
-- summary
-Important: Only return valid JSON, no additional text.
-"""
+        prompt = METADATA_PROMPT_TEMPLATE.format(text=text[:METADATA_TEXT_LIMIT])
         try:
             response = self.mistral_client.chat.complete(
-                model="mistral-small-latest",
+                model=LLM_MODEL,
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0.1,
                 response_format={"type": "json_object"}
             )
-            return json.loads(response.choices[0].message.content)
+            metadata = json.loads(response.choices[0].message.content)
         except Exception as e:
             if not self.quiet:
                 print(f"Metadata extraction error: {e}", file=sys.stderr)
-            return {
-                "name": "Unknown",
-                "email": "",
-                "phone": "",
-                "skills": [],
-                "experience_years": 0.0,
-                "education": [],
-                "job_titles": [],
-                "summary": ""
-            }
+            return self._fallback_metadata()
+
+        return self._store_metadata(cache_key, metadata)
+
+    def extract_metadata_many(self, texts: List[str], concurrency: Optional[int] = None,
+                              requests_per_second: Optional[float] = None,
+                              on_result: Optional[Callable[[int, Dict[str, Any]], None]] = None) -> List[Dict[str, Any]]:
+        """
+        Extract metadata for many resumes with concurrent LLM requests.
+
+        Synchronous wrapper around extract_metadata_many_async; call the async
+        variant directly from code that already runs an event loop.
+
+        Args:
+            texts (List[str]): Resume text contents
+            concurrency (Optional[int]): Maximum requests in flight; defaults to llm_concurrency
+            requests_per_second (Optional[float]): Rate limit; defaults to llm_requests_per_second
+            on_result (Optional[Callable[[int, Dict[str, Any]], None]]): Called with (position, metadata)
+                as each resume completes
+
+        Returns:
+            List[Dict[str, Any]]: Metadata per text, in input order
+        """
+        return self._run_async(self.extract_metadata_many_async(texts, concurrency, requests_per_second, on_result))
+
+    async def extract_metadata_many_async(self, texts: List[str], concurrency: Optional[int] = None,
+                                          requests_per_second: Optional[float] = None,
+                                          on_result: Optional[Callable[[int, Dict[str, Any]], None]] = None
+                                          ) -> List[Dict[str, Any]]:
+        """
+        Async variant of extract_metadata for a batch of resumes.
+
+        Requests go through the Mistral async client with at most `concurrency`
+        in flight and an optional token-bucket rate limit. 429 responses are
+        retried after their Retry-After delay, each retry taking a token.
+        Cached results are returned without a request or a token, and failed
+        requests yield the fallback metadata.
+
+        Args:
+            texts (List[str]): Resume text contents
+            concurrency (Optional[int]): Maximum requests in flight; defaults to llm_concurrency
+            requests_per_second (Optional[float]): Rate limit; defaults to llm_requests_per_second
+            on_result (Optional[Callable[[int, Dict[str, Any]], None]]): Called with (position, metadata)
+                as each resume completes
+
+        Returns:
+            List[Dict[str, Any]]: Metadata per text, in input order
+        """
+        concurrency = concurrency or self.llm_concurrency
+        requests_per_second = requests_per_second or self.llm_requests_per_second
+        rate_limiter = TokenBucket(requests_per_second) if requests_per_second else None
+
+        async def extract(text: str) -> Dict[str, Any]:
+            cache_key, cached = self._cached_metadata(text)
+            if cached is not None:
+                return cached
+
+            prompt = METADATA_PROMPT_TEMPLATE.format(text=text[:METADATA_TEXT_LIMIT])
+            try:
+                response = await complete_with_retries(
+                    self.mistral_client,
+                    rate_limiter=rate_limiter,
+                    model=LLM_MODEL,
+                    messages=[{"role": "user", "content": prompt}],
+                    temperature=0.1,
+                    response_format={"type": "json_object"}
+                )
+                metadata = json.loads(response.choices[0].message.content)
+            except Exception as e:
+                if not self.quiet:
+                    print(f"Metadata extraction error: {e}", file=sys.stderr)
+                return self._fallback_metadata()
+
+            return self._store_metadata(cache_key, metadata)
+
+        return await gather_bounded(texts, extract, concurrency, on_result=on_result)
+
+    def _cached_metadata(self, text: str):
+        """Return (cache_key, cached metadata or None); the key is None when caching is disabled."""
+        if self.metadata_cache is None:
+            return None, None
+        prompt_text = text[:METADATA_TEXT_LIMIT]
+        cache_key = JsonCache.make_key(hash_bytes(prompt_text.encode("utf-8")), METADATA_PROMPT_VERSION, LLM_MODEL)
+        return cache_key, self.metadata_cache.get(cache_key)
+
+    def _store_metadata(self, cache_key: Optional[str], metadata: Any) -> Any:
+        """Cache a successful metadata response and return it."""
+        if cache_key is not None and isinstance(metadata, dict):
+            self.metadata_cache.put(cache_key, metadata)
+        return metadata
+
+    @staticmethod
+    def _fallback_metadata() -> Dict[str, Any]:
+        """Metadata used when the LLM call fails; never cached."""
+        return {
+            "name": "Unknown",
+            "email": "",
+            "phone": "",
+            "skills": [],
+            "experience_years": 0.0,
+            "education": [],
+            "job_titles": [],
+            "summary": ""
+        }
 
     def process_resumes(self, folder_path: str) -> bool:
         """
@@ -139,9 +670,7 @@ Important: Only return valid JSON, no additional text.
             bool: True if processing was successful, False otherwise
         """
         # Clear existing data
-        self.resumes.clear()
-        self.file_paths.clear()
-        self.resume_metadata.clear()
+        self._reset()
 
         # Find PDF files
         folder = Path(folder_path)
@@ -149,38 +678,18 @@ Important: Only return valid JSON, no additional text.
             print(f"❌ Folder {folder_path} does not exist!")
             return False
 
-        pdf_files = list(folder.glob("*.pdf"))
+        # Sorted so serial and parallel extraction visit files in the same order
+        pdf_files = sorted(folder.glob("*.pdf"))
         if not pdf_files:
             print("❌ No PDF files found!")
             return False
 
-        # Process each PDF
-        for pdf_file in pdf_files:
+        # Extract text and metadata, then store data
+        for pdf_file, text, metadata in self._analyse_pdfs(pdf_files):
             file_id = uuid.uuid4().hex[:8]
             if not self.quiet:
                 print(f"Processing: {pdf_file.name} (ID: {file_id})", file=sys.stderr)
-
-            # Extract text
-            text = self.extract_text_from_pdf(str(pdf_file))
-            if not text:
-                print(f"⚠️ No text extracted from {pdf_file.name}")
-                continue
-
-            # Extract metadata
-            metadata = self.extract_metadata(text)
-
-            # Store data
-            self.resumes.append(text)
-            self.file_paths.append(str(pdf_file))
-
-            # Store metadata with truncated text for memory efficiency
-            short_text = text[:2000] + "..." if len(text) > 2000 else text
-            self.resume_metadata[file_id] = {
-                "file_name": pdf_file.name,
-                "file_path": str(pdf_file),
-                "text": short_text,
-                "metadata": metadata
-            }
+            self._ingest(file_id, text, pdf_file.name, str(pdf_file), metadata)
 
         if not self.quiet:
             print(f"✅ Processed {len(self.resumes)} resumes", file=sys.stderr)
@@ -190,50 +699,221 @@ Important: Only return valid JSON, no additional text.
             return self.build_index()
         return False
 
-    def build_index(self) -> bool:
+    def _analyse_pdfs(self, pdf_files: List[Path]) -> List[tuple]:
+        """Extract text and LLM metadata for PDFs; returns (pdf_file, text, metadata) for files with text."""
+        texts = self.extract_texts_from_pdfs([str(pdf_file) for pdf_file in pdf_files])
+
+        extracted = []
+        for pdf_file, text in zip(pdf_files, texts):
+            if not text:
+                print(f"⚠️ No text extracted from {pdf_file.name}")
+                continue
+            extracted.append((pdf_file, text))
+
+        metadata_list = self._analyse_texts([pdf_file.name for pdf_file, _ in extracted], [text for _, text in extracted])
+        return [(pdf_file, text, metadata) for (pdf_file, text), metadata in zip(extracted, metadata_list)]
+
+    def _analyse_texts(self, file_names: List[str], texts: List[str]) -> List[Dict[str, Any]]:
+        """LLM metadata for extracted texts, concurrently when llm_concurrency > 1."""
+        def emit_metadata(position: int, metadata: Dict[str, Any]) -> None:
+            name = metadata.get("name", "Unknown") if isinstance(metadata, dict) else "Unknown"
+            self._emit("metadata", file_name=file_names[position], name=str(name))
+
+        if self.llm_concurrency > 1:
+            return self.extract_metadata_many(texts, on_result=emit_metadata)
+
+        metadata_list = []
+        for position, text in enumerate(texts):
+            metadata_list.append(self.extract_metadata(text))
+            emit_metadata(position, metadata_list[-1])
+        return metadata_list
+
+    def sync_project(self, project_id: str, folder_path: str) -> bool:
         """
-        Build FAISS vector index for semantic search.
+        Bring one project's applicants into the global index.
+
+        Resumes are identified by a hash of their PDF contents, so a student who
+        applies to several projects is extracted, analysed and embedded once per
+        version of their resume. Resumes that no project references any more
+        are dropped from the index. Unchanged folders are skipped.
+
+        Args:
+            project_id (str): Project the folder belongs to
+            folder_path (str): Folder containing the project's PDF resumes
 
         Returns:
-            bool: True if index was built successfully, False otherwise
+            bool: True if the project has at least one searchable resume
         """
-        enhanced_texts: List[str] = []
+        folder = Path(folder_path)
+        if not folder.exists():
+            print(f"❌ Folder {folder_path} does not exist!")
+            return False
 
-        for resume, path in zip(self.resumes, self.file_paths):
-            # Find file ID
-            file_id = None
-            for fid, metadata in self.resume_metadata.items():
-                if metadata["file_path"] == path:
-                    file_id = fid
-                    break
+        fingerprint = folder_fingerprint(folder_path)
+        if self._project_fingerprints.get(project_id) == fingerprint and project_id in self.projects:
+            self.last_sync_stats = {"added": 0, "removed": 0, "shared": 0, "rescanned": 0}
+            return bool(self.projects[project_id])
+
+        files = {}
+        for name in fingerprint:
+            pdf_file = folder / name
+            files[hash_file(str(pdf_file))[:16]] = pdf_file
+
+        new_ids = [file_id for file_id in files if file_id not in self.resume_metadata]
+        analysed = self._analyse_pdfs([files[file_id] for file_id in new_ids])
+        path_ids = {files[file_id]: file_id for file_id in new_ids}
+        for pdf_file, text, metadata in analysed:
+            self._ingest(path_ids[pdf_file], text, pdf_file.name, str(pdf_file), metadata)
+        self._index_resumes([path_ids[pdf_file] for pdf_file, _, _ in analysed])
+
+        removed = self._replace_project(project_id, {
+            file_id: (pdf_file.name, str(pdf_file))
+            for file_id, pdf_file in files.items() if file_id in self.resume_metadata
+        })
+        self._project_fingerprints[project_id] = fingerprint
+
+        self.last_sync_stats = {
+            "added": len(analysed),
+            "removed": removed,
+            "shared": len(self.projects[project_id]) - len(analysed),
+            "rescanned": 1,
+        }
+        if not self.quiet:
+            print(f"✅ Synced project {project_id}: {len(analysed)} resumes added, "
+                  f"{self.last_sync_stats['shared']} already indexed, {removed} removed", file=sys.stderr)
+        return bool(self.projects[project_id])
+
+    def _replace_project(self, project_id: str, members: Dict[str, Tuple[str, str]]) -> int:
+        """Set a project's members, dropping former members no project references; returns how many were dropped."""
+        previous = self.projects.get(project_id, {})
+        self.projects[project_id] = members
+
+        removed = 0
+        for file_id in previous.keys() - members.keys():
+            if not any(file_id in other for other in self.projects.values()):
+                self.remove_resume(file_id)
+                removed += 1
+        return removed
+
+    def ingest_resumes(self, rows: Iterable[Tuple[str, PdfSource]], project_id: Optional[str] = None,
+                       batch_size: int = INGEST_BATCH_SIZE) -> List[str]:
+        """
+        Add PDFs held in memory to the index, a batch at a time.
 
-            if file_id is None:
-                print(f"Warning: Could not find metadata for {path}")
-                continue
+        Resumes are identified by a hash of their contents, as in sync_project,
+        so a blob that is already indexed is neither extracted nor analysed
+        again. Each batch is extracted in this process straight from the
+        caller's buffers (extraction_workers only applies to files), analysed
+        and embedded before the next batch is read, so only batch_size PDFs
+        are held at a time. last_sync_stats reports what changed.
+
+        Args:
+            rows (Iterable[Tuple[str, PdfSource]]): (file name, PDF contents) pairs; contents may
+                be bytes, bytearray, memoryview, BytesIO or a binary file object
+            project_id (Optional[str]): Project whose applicants are exactly these rows; former
+                members that no project references any more are removed from the index
+            batch_size (int): Rows extracted, analysed and indexed together
 
-            meta = self.resume_metadata[file_id]["metadata"]
+        Returns:
+            List[str]: IDs of the resumes in rows that have text, in row order, without repeats
+        """
+        file_ids: Dict[str, Tuple[str, str]] = {}
+        added = 0
+        rows = iter(rows)
+        while True:
+            batch = list(itertools.islice(rows, batch_size))
+            if not batch:
+                break
+
+            extracted = []
+            pending = set()
+            for file_name, data in batch:
+                file_name = str(file_name)
+                buffer = pdf_buffer(data)
+                digest = hash_bytes(buffer)
+                file_id = digest[:16]
+                if file_id in self.resume_metadata:
+                    file_ids.setdefault(file_id, (file_name, file_name))
+                    continue
+                if file_id in pending:
+                    continue
+                pending.add(file_id)
 
-            # Process skills safely
-            clean_skills = self._extract_skills(meta.get('skills', []))
+                text = self._extract_buffer(buffer, digest, file_name)
+                self._emit_extracted(file_name, text)
+                if not text:
+                    print(f"⚠️ No text extracted from {file_name}")
+                    continue
+                extracted.append((file_id, file_name, text))
+
+            metadata_list = self._analyse_texts([name for _, name, _ in extracted], [text for _, _, text in extracted])
+            for (file_id, file_name, text), metadata in zip(extracted, metadata_list):
+                self._ingest(file_id, text, file_name, file_name, metadata)
+                file_ids[file_id] = (file_name, file_name)
+            self._index_resumes([file_id for file_id, _, _ in extracted])
+            added += len(extracted)
+
+        removed = 0
+        if project_id is not None:
+            removed = self._replace_project(project_id, file_ids)
+            self._project_fingerprints.pop(project_id, None)
+        self.last_sync_stats = {"added": added, "removed": removed, "shared": len(file_ids) - added, "rescanned": 1}
+        if not self.quiet:
+            print(f"✅ Ingested {len(file_ids)} resumes: {added} added, "
+                  f"{len(file_ids) - added} already indexed, {removed} removed", file=sys.stderr)
+        return list(file_ids)
 
-            # Get other metadata safely
-            name = str(meta.get('name', 'Unknown'))
-            experience_years = meta.get('experience_years', 0)
-            if not isinstance(experience_years, (int, float)):
-                experience_years = 0
+    def ingest_cursor(self, cursor, project_id: Optional[str] = None, batch_size: int = INGEST_BATCH_SIZE) -> List[str]:
+        """
+        Add the PDF blobs of an executed database query to the index, streaming its rows.
 
-            summary = str(meta.get('summary', ''))
+        The query selects a file name and the PDF contents, for example
+        SELECT id, "resumeData" FROM "OpportunityApplication"
+        WHERE "opportunityId" = %s AND "resumeData" IS NOT NULL.
+        Rows are fetched batch_size at a time (see resume_sources.iter_cursor_rows)
+        and handed to ingest_resumes.
 
-            # Create enhanced text for better search
-            enhanced_text = (
-                f"Candidate Profile:\n"
-                f"Name: {name}\n"
-                f"Skills: {', '.join(clean_skills)}\n"
-                f"Experience: {experience_years} years\n"
-                f"Summary: {summary}\n\n"
-                f"Resume Content:\n{resume[:3000]}"
-            )
-            enhanced_texts.append(enhanced_text)
+        Args:
+            cursor: DB-API cursor (sqlite3, psycopg2, ...) on which the query has been executed
+            project_id (Optional[str]): Project whose applicants are exactly these rows
+            batch_size (int): Rows fetched, extracted, analysed and indexed together
+
+        Returns:
+            List[str]: IDs of the resumes that have text, in row order, without repeats
+        """
+        rows = ((row[0], row[1]) for row in iter_cursor_rows(cursor, batch_size))
+        return self.ingest_resumes(rows, project_id=project_id, batch_size=batch_size)
+
+    def remove_project(self, project_id: str) -> bool:
+        """
+        Forget a project, dropping resumes no other project references.
+
+        Args:
+            project_id (str): Project to remove
+
+        Returns:
+            bool: True if the project was known
+        """
+        members = self.projects.pop(project_id, None)
+        self._project_fingerprints.pop(project_id, None)
+        if members is None:
+            return False
+        for file_id in members:
+            if not any(file_id in other for other in self.projects.values()):
+                self.remove_resume(file_id)
+        return True
+
+    def build_index(self) -> bool:
+        """
+        Build FAISS vector index for semantic search.
+
+        Returns:
+            bool: True if index was built successfully, False otherwise
+        """
+        enhanced_texts = [
+            self._enhanced_text(self._resume_excerpt(file_id, PROFILE_TEXT_CHARS), self.records.get(file_id))
+            for file_id in self.file_ids
+        ]
 
         if not enhanced_texts:
             print("❌ No valid resume texts to index")
@@ -241,111 +921,725 @@ Important: Only return valid JSON, no additional text.
 
         try:
             # Create embeddings
-            embeddings = self.embedding_model.encode(
-                enhanced_texts,
-                show_progress_bar=True
-            ).astype('float32')
+            embeddings = self._encode_with_store(enhanced_texts)
 
             # Normalize embeddings
             faiss.normalize_L2(embeddings)
 
-            # Build FAISS index
-            self.index = faiss.IndexFlatIP(self.embedding_dim)
-            self.index.add(embeddings)
+            # Build FAISS index; explicit ids let single resumes be added or removed later
+            index_ids = np.arange(len(self.file_ids), dtype='int64')
+            self.index = make_index(self.index_type, self.embedding_dim, embeddings, index_ids, self.index_options)
+
+            self._index_ids = {file_id: int(i) for file_id, i in zip(self.file_ids, index_ids)}
+            self._rows_by_index_id = None
+            self._file_ids_by_index_id = {int(i): file_id for file_id, i in zip(self.file_ids, index_ids)}
+            self._next_index_id = len(self.file_ids)
 
             if not self.quiet:
-                print(f"✅ Indexed {len(enhanced_texts)} resumes", file=sys.stderr)
+                print(f"✅ Indexed {len(enhanced_texts)} resumes "
+                      f"({self.last_index_stats['reused']} embeddings reused, "
+                      f"{self.last_index_stats['computed']} computed)", file=sys.stderr)
             return True
 
         except Exception as e:
             print(f"❌ Error building index: {e}")
             return False
 
-    def search_resumes(self, project_description: str, top_k: int = 5) -> List[Dict[str, Any]]:
+    def _enhanced_text(self, resume: str, record: ResumeRecord) -> str:
+        """Build the text that is embedded for a resume: a metadata profile followed by the resume itself."""
+        return (
+            f"Candidate Profile:\n"
+            f"Name: {record.name}\n"
+            f"Skills: {', '.join(record.skills)}\n"
+            f"Experience: {record.experience_years} years\n"
+            f"Summary: {record.summary}\n\n"
+            f"Resume Content:\n{resume[:PROFILE_TEXT_CHARS]}"
+        )
+
+    def add_resume(self, source: Union[str, Path, PdfSource], file_name: Optional[str] = None) -> Optional[str]:
         """
-        Search for resumes matching a project description.
+        Add a single resume to the in-memory index without rebuilding it.
 
         Args:
-            project_description (str): Description of the project requirements
-            top_k (int): Number of top candidates to return
+            source (Union[str, Path, PdfSource]): Path to a PDF file or the PDF contents
+            file_name (Optional[str]): Display name; defaults to the file name of the path
 
         Returns:
-            List[Dict[str, Any]]: List of matching candidates with scores and metadata
+            Optional[str]: ID of the new resume, or None if no text could be extracted
         """
-        if not self.index:
-            if not self.quiet:
-                print("❌ Index not built. Please process resumes first.", file=sys.stderr)
-            return []
+        file_path, file_name, text = self._read_source(source, file_name)
+        if not text:
+            print(f"⚠️ No text extracted from {file_name}")
+            return None
+
+        file_id = uuid.uuid4().hex[:8]
+        self._ingest(file_id, text, file_name, file_path)
+        self._index_resume(file_id)
+        return file_id
 
-        # Create search query
-        query = f"Project Requirements:\n{project_description}\nLooking for relevant candidates."
+    def remove_resume(self, resume_id: str) -> bool:
+        """
+        Remove a single resume from the in-memory index.
 
-        # Get query embedding
-        query_embedding = self.embedding_model.encode([query]).astype('float32')
-        faiss.normalize_L2(query_embedding)
+        Args:
+            resume_id (str): ID of the resume to remove
 
-        # Search index
-        scores, indices = self.index.search(query_embedding, top_k * 2)
+        Returns:
+            bool: True if the resume existed and was removed
+        """
+        if resume_id not in self.resume_metadata:
+            return False
 
-        # Re-rank results using metadata
-        candidates_to_rerank = []
-        for score, idx in zip(scores[0], indices[0]):
-            if idx < 0:
-                continue
+        self._unindex_resume(resume_id)
+        for members in self.projects.values():
+            members.pop(resume_id, None)
+
+        position = self._positions.pop(resume_id)
+        del self.resumes[position]
+        del self.file_paths[position]
+        del self.file_ids[position]
+        for file_id in self.file_ids[position:]:
+            self._positions[file_id] -= 1
+
+        del self.resume_metadata[resume_id]
+        if self._reranker_ready:
+            self.reranker.clear_row(self.records.row(resume_id))
+        if self._lexical_ready:
+            self.lexical.clear_row(self.records.row(resume_id))
+        self.records.remove(resume_id)
+        return True
+
+    def update_resume(self, resume_id: str, source: Union[str, Path, PdfSource, None] = None,
+                      metadata: Optional[Dict[str, Any]] = None, file_name: Optional[str] = None) -> bool:
+        """
+        Replace the content and/or metadata of a resume and re-index it in place.
+
+        Args:
+            resume_id (str): ID of the resume to update
+            source (Union[str, Path, PdfSource, None]): New PDF path or contents; text and
+                metadata are re-extracted when given
+            metadata (Optional[Dict[str, Any]]): Metadata fields to override
+            file_name (Optional[str]): New display name
+
+        Returns:
+            bool: True if the resume exists and was updated
+        """
+        if resume_id not in self.resume_metadata:
+            return False
+
+        position = self._positions[resume_id]
+        entry = self.resume_metadata[resume_id]
+
+        if source is not None:
+            file_path, file_name, text = self._read_source(source, file_name or entry["file_name"])
+            if not text:
+                print(f"⚠️ No text extracted from {file_name}")
+                return False
+            new_metadata = self.extract_metadata(text)
+        else:
+            file_path, text = entry["file_path"], self.resumes[position]
+            file_name = file_name or entry["file_name"]
+            new_metadata = dict(entry["metadata"])
+
+        if metadata:
+            new_metadata.update(metadata)
+
+        if source is not None:
+            self.resumes[position] = text
+        self.file_paths[position] = file_path
+        self.resume_metadata[resume_id] = self._metadata_entry(text, file_name, file_path, new_metadata)
+        self._add_record(ResumeRecord(resume_id, file_name, file_path, new_metadata))
+
+        self._unindex_resume(resume_id)
+        self._index_resume(resume_id)
+        return True
+
+    def _read_source(self, source: Union[str, Path, PdfSource], file_name: Optional[str]):
+        """Extract text from a path or an in-memory PDF; returns (file_path, file_name, text)."""
+        if not isinstance(source, (str, Path)):
+            file_name = file_name or f"{uuid.uuid4().hex[:8]}.pdf"
+            return file_name, file_name, self.extract_text_from_bytes(source, file_name)
+
+        file_path = str(source)
+        file_name = file_name or Path(file_path).name
+        return file_path, file_name, self.extract_text_from_pdf(file_path)
+
+    def _ingest(self, file_id: str, text: str, file_name: str, file_path: str,
+                metadata: Optional[Dict[str, Any]] = None) -> None:
+        """Append a resume to the in-memory stores, extracting its metadata unless given."""
+        if metadata is None:
+            metadata = self.extract_metadata(text)
+
+        self._positions[file_id] = len(self.file_ids)
+        self.resumes.append(text)
+        self.file_paths.append(file_path)
+        self.file_ids.append(file_id)
+        self.resume_metadata[file_id] = self._metadata_entry(text, file_name, file_path, metadata)
+        self._add_record(ResumeRecord(file_id, file_name, file_path, metadata))
+
+    def _add_record(self, record: ResumeRecord) -> None:
+        """Store a normalized record and keep the reranker features in step."""
+        row = self.records.add(record)
+        if self._reranker_ready:
+            self.reranker.set_row(row, record)
+        if self._lexical_ready:
+            self.lexical.set_row(row, self.resumes[self._positions[record.file_id]], record.skills_lower)
+
+    def _load_record(self, file_id: str) -> ResumeRecord:
+        """Normalize the stored metadata of a resume loaded from a bundle."""
+        return ResumeRecord.from_entry(file_id, self.resume_metadata[file_id])
+
+    def _metadata_entry(self, text: str, file_name: str, file_path: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """Metadata record for a resume, with truncated text (none in low-memory mode) for memory efficiency."""
+        if self.low_memory:
+            return {"file_name": file_name, "file_path": file_path, "metadata": metadata}
+
+        short_text = text[:2000] + "..." if len(text) > 2000 else text
+        return {
+            "file_name": file_name,
+            "file_path": file_path,
+            "text": short_text,
+            "metadata": metadata
+        }
+
+    def _resume_excerpt(self, file_id: str, chars: int) -> str:
+        """Leading characters of a resume's text; low-memory mode decodes only those."""
+        position = self._positions[file_id]
+        if isinstance(self.resumes, DiskTextList):
+            return self.resumes.excerpt(position, chars)
+        return self.resumes[position][:chars]
+
+    def _index_resume(self, file_id: str) -> None:
+        """Embed one resume and add it to the FAISS index under a new id."""
+        self._index_resumes([file_id])
+
+    def _index_resumes(self, file_ids: List[str]) -> None:
+        """Embed resumes in one batch and add them to the FAISS index under new ids."""
+        if not file_ids:
+            return
+
+        enhanced_texts = [
+            self._enhanced_text(self._resume_excerpt(file_id, PROFILE_TEXT_CHARS), self.records.get(file_id))
+            for file_id in file_ids
+        ]
+        embeddings = self._encode_with_store(enhanced_texts)
+        faiss.normalize_L2(embeddings)
+
+        index_ids = np.arange(self._next_index_id, self._next_index_id + len(file_ids), dtype='int64')
+        self._next_index_id += len(file_ids)
+        if self.index is None:
+            self.index = make_index(self.index_type, self.embedding_dim, embeddings, index_ids, self.index_options)
+        else:
+            self.index.add_with_ids(embeddings, index_ids)
+            # A corpus that has grown large enough gets the configured (trained) index type
+            self.index = upgrade_index(self.index, self.index_type, self.embedding_dim, self.index_options)
+        for file_id, index_id in zip(file_ids, index_ids):
+            self._index_ids[file_id] = int(index_id)
+            self._file_ids_by_index_id[int(index_id)] = file_id
+        self._rows_by_index_id = None
+
+    def _unindex_resume(self, file_id: str) -> None:
+        """Remove one resume's vector from the FAISS index."""
+        index_id = self._index_ids.pop(file_id, None)
+        if index_id is None:
+            return
+        self._file_ids_by_index_id.pop(index_id, None)
+        self._rows_by_index_id = None
+        if self.index is not None:
+            # HNSW cannot remove vectors; its stale ids are skipped at search time
+            remove_ids(self.index, np.array([index_id], dtype='int64'))
+
+    def _reset(self) -> None:
+        """Drop all resumes and the index."""
+        self.index = None
+        self.resumes.clear()
+        self.file_paths.clear()
+        self.file_ids.clear()
+        self.resume_metadata.clear()
+        self.records.clear()
+        self.reranker.clear()
+        self._reranker_ready = False
+        self.lexical.clear()
+        self._lexical_ready = False
+        self._rows_by_index_id = None
+        self.projects.clear()
+        self._project_fingerprints.clear()
+        self._positions.clear()
+        self._index_ids.clear()
+        self._file_ids_by_index_id.clear()
+        self._next_index_id = 0
+
+    def clear(self) -> None:
+        """Drop all resumes, projects and the index."""
+        self._reset()
+
+    def save_bundle(self, bundle_dir: str, source_folder: Optional[str] = None) -> bool:
+        """
+        Persist the index, records and texts so a later process can warm-start.
+
+        Args:
+            bundle_dir (str): Directory to write the bundle to
+            source_folder (Optional[str]): Resume folder the bundle was built from;
+                its fingerprint is stored so stale bundles can be detected
+
+        Returns:
+            bool: True if the bundle was written, False if there is nothing to save
+        """
+        if self.index is None or not self.file_ids:
+            return False
+
+        source_files = folder_fingerprint(source_folder) if source_folder else {}
+        write_bundle(
+            bundle_dir,
+            self.index,
+            file_ids=list(self.file_ids),
+            index_ids=[self._index_ids[file_id] for file_id in self.file_ids],
+            texts=self.resumes,
+            records=[self.resume_metadata[file_id] for file_id in self.file_ids],
+            manifest_extra={
+                "embedding_model": self.embedding_model_id,
+                "embedding_dim": self.embedding_dim,
+                "index_type": self.index_type,
+                "index_layout": index_type_of(self.index),
+                "metadata_prompt_version": METADATA_PROMPT_VERSION,
+                "file_paths": list(self.file_paths),
+                "next_index_id": self._next_index_id,
+                "source_folder": str(source_folder) if source_folder else None,
+                "source_files": source_files,
+                "projects": {project_id: {file_id: list(entry) for file_id, entry in members.items()}
+                             for project_id, members in self.projects.items()},
+                "project_fingerprints": self._project_fingerprints,
+            }
+        )
+        if not self.quiet:
+            print(f"✅ Saved bundle with {len(self.file_ids)} resumes to {bundle_dir}", file=sys.stderr)
+        return True
+
+    def load_bundle(self, bundle_dir: str, source_folder: Optional[str] = None) -> bool:
+        """
+        Load a bundle written by save_bundle, memory-mapping the index.
+
+        Records and full texts are decoded lazily on first access.
+
+        Args:
+            bundle_dir (str): Bundle directory
+            source_folder (Optional[str]): If given, the bundle is rejected when the
+                folder's PDFs no longer match the ones it was built from
+
+        Returns:
+            bool: True if the bundle was loaded, False if it is missing, incompatible or stale
+        """
+        manifest = read_manifest(bundle_dir)
+        if not self._bundle_compatible(bundle_dir, manifest):
+            return False
+        if source_folder is not None and folder_fingerprint(source_folder) != manifest["source_files"]:
+            return False
+
+        self._open_bundle(bundle_dir, manifest)
+        return True
+
+    def load_or_process(self, folder_path: str, bundle_dir: str) -> bool:
+        """
+        Warm-start from a bundle, bringing it up to date with the folder if needed.
 
-            path = self.file_paths[idx]
-            file_id = self._get_file_id_by_path(path)
+        A compatible bundle is loaded and only PDFs that were added, changed or
+        removed since it was written are processed; the refreshed bundle is then
+        saved again. Without a usable bundle the folder is processed from scratch.
+
+        Args:
+            folder_path (str): Folder containing PDF resumes
+            bundle_dir (str): Bundle directory for this folder
+
+        Returns:
+            bool: True if the selector is ready for searching
+        """
+        manifest = read_manifest(bundle_dir)
+        if not self._bundle_compatible(bundle_dir, manifest) or not Path(folder_path).exists():
+            if not self.process_resumes(folder_path):
+                return False
+            self.save_bundle(bundle_dir, folder_path)
+            return True
 
-            if file_id is None:
+        self._open_bundle(bundle_dir, manifest)
+
+        old_files = manifest["source_files"]
+        new_files = folder_fingerprint(folder_path)
+        if old_files == new_files:
+            return True
+
+        ids_by_name = {Path(path).name: file_id for path, file_id in zip(self.file_paths, self.file_ids)}
+        for name in old_files.keys() - new_files.keys():
+            if name in ids_by_name:
+                self.remove_resume(ids_by_name[name])
+
+        for name, stat in new_files.items():
+            if old_files.get(name) == stat:
                 continue
+            path = str(Path(folder_path) / name)
+            if name in ids_by_name:
+                self.update_resume(ids_by_name[name], path)
+            else:
+                self.add_resume(path)
 
-            metadata = self.resume_metadata[file_id]["metadata"]
-            metadata_score = self.calculate_metadata_similarity(project_description, metadata)
+        if not self.quiet:
+            print(f"✅ Refreshed bundle for {folder_path}", file=sys.stderr)
 
-            # Combined score: 60% semantic similarity + 40% metadata similarity
-            combined_score = (score * 0.6) + (metadata_score * 0.4)
-            candidates_to_rerank.append((combined_score, idx, file_id))
+        if not self.is_ready():
+            return False
+        self.save_bundle(bundle_dir, folder_path)
+        return True
+
+    def _bundle_compatible(self, bundle_dir: str, manifest: Optional[Dict[str, Any]]) -> bool:
+        """Whether a bundle manifest was written by a compatible format, model, index type and prompt."""
+        return (
+            manifest is not None
+            and manifest.get("format_version") == BUNDLE_FORMAT_VERSION
+            and manifest.get("embedding_model") == self.embedding_model_id
+            and manifest.get("embedding_dim") == self.embedding_dim
+            and manifest.get("index_type", "flat") == self.index_type
+            and manifest.get("metadata_prompt_version") == METADATA_PROMPT_VERSION
+            and (Path(bundle_dir) / str(manifest.get("generation"))).is_dir()
+        )
+
+    def _open_bundle(self, bundle_dir: str, manifest: Dict[str, Any]) -> None:
+        """Replace the selector state with the contents of a bundle."""
+        self._reset()
+        self.index, self.resumes, self.resume_metadata = open_bundle(
+            bundle_dir, manifest, low_memory=self.low_memory, spill_dir=self._text_spill_dir
+        )
+
+        self.file_ids.extend(manifest["file_ids"])
+        self.file_paths.extend(manifest["file_paths"])
+        self._positions = {file_id: i for i, file_id in enumerate(self.file_ids)}
+        for file_id, file_path in zip(self.file_ids, self.file_paths):
+            self.records.reserve(file_id, file_path)
+        self._index_ids = dict(zip(self.file_ids, manifest["index_ids"]))
+        self._file_ids_by_index_id = {index_id: file_id for file_id, index_id in self._index_ids.items()}
+        self._next_index_id = manifest["next_index_id"]
+        self.projects = {
+            project_id: {file_id: tuple(entry) for file_id, entry in members.items()}
+            for project_id, members in manifest.get("projects", {}).items()
+        }
+        self._project_fingerprints = dict(manifest.get("project_fingerprints", {}))
 
-        # Sort by combined score
-        candidates_to_rerank.sort(key=lambda x: x[0], reverse=True)
+        if not self.quiet:
+            print(f"✅ Loaded bundle with {len(self.file_ids)} resumes from {bundle_dir}", file=sys.stderr)
 
-        # Return top candidates
-        results = []
-        for score, idx, file_id in candidates_to_rerank[:top_k]:
-            results.append({
-                "id": file_id,
-                "score": float(score),
-                "file_name": self.resume_metadata[file_id]["file_name"],
-                "file_path": self.resume_metadata[file_id]["file_path"],
-                "text": self.resumes[idx],
-                "metadata": self.resume_metadata[file_id]["metadata"]
-            })
+    def _encode_with_store(self, texts: List[str]) -> np.ndarray:
+        """
+        Encode texts, reusing vectors from the embedding store when available.
+
+        Only texts missing from the store are sent to the encoder, in a single
+        batch. Counts are recorded in self.last_index_stats.
+
+        Args:
+            texts (List[str]): Texts to embed
+
+        Returns:
+            np.ndarray: Float32 embeddings, one row per text
+        """
+        # The ONNX encoder drops text beyond its token window up front, so it never affects cache keys
+        truncate = getattr(self.embedding_model, "truncate", None)
+        if truncate is not None:
+            texts = truncate(texts)
+
+        if self.embedding_store is None:
+            self.last_index_stats = {"reused": 0, "computed": len(texts)}
+            return self._encode_bulk(texts)
+
+        keys = [EmbeddingStore.make_key(text) for text in texts]
+        embeddings, missing = self.embedding_store.get_many(keys)
+
+        if missing:
+            computed = self._encode_bulk([texts[i] for i in missing])
+            embeddings[missing] = computed
+            self.embedding_store.put_many([keys[i] for i in missing], computed)
+
+        self.last_index_stats = {"reused": len(texts) - len(missing), "computed": len(missing)}
+        return embeddings
+
+    def _encode_bulk(self, texts: List[str]) -> np.ndarray:
+        """Encode index texts, sharded over encode_workers processes when there are enough of them."""
+        if self.encode_workers > 1 and len(texts) >= BULK_ENCODE_MIN_TEXTS:
+            if not self.quiet:
+                print(f"Encoding {len(texts)} resumes in {self.encode_workers} processes...", file=sys.stderr)
+            return encode_parallel(self.embedding_model, texts, self.encode_workers,
+                                   threads=self.encode_threads, batch_size=self.encode_batch_size)
+        return self.embedding_model.encode(
+            texts, show_progress_bar=True, batch_size=self.encode_batch_size
+        ).astype('float32')
+
+    def search_resumes(self, project_description: str, top_k: int = 5,
+                       project_id: Optional[str] = None, mode: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Search for resumes matching a project description.
+
+        Args:
+            project_description (str): Description of the project requirements
+            top_k (int): Number of top candidates to return
+            project_id (Optional[str]): Restrict the search to a project synced with sync_project
+            mode (Optional[str]): Retrieval mode, one of SEARCH_MODES; defaults to search_mode
+
+        Returns:
+            List[Dict[str, Any]]: List of matching candidates with scores and metadata
+        """
+        return self.search_resumes_many([project_description], top_k=top_k, project_id=project_id, mode=mode)[0]
+
+    def search_resumes_many(self, project_descriptions: List[str], top_k: int = 5,
+                            project_id: Optional[str] = None, mode: Optional[str] = None) -> List[List[Dict[str, Any]]]:
+        """
+        Search for resumes matching several project descriptions in one pass.
 
+        All queries are encoded in one batch, looked up with a single multi-row
+        FAISS search and reranked together; each project's results are the same
+        as search_resumes would return for it.
+
+        Args:
+            project_descriptions (List[str]): Descriptions of the project requirements
+            top_k (int): Number of top candidates to return per project
+            project_id (Optional[str]): Restrict the search to a project synced with sync_project;
+                candidates then carry that project's file name and path
+            mode (Optional[str]): Retrieval mode, one of SEARCH_MODES; defaults to search_mode.
+                In "hybrid" mode candidates are ordered by the reciprocal rank fusion of the dense
+                ranking and the BM25 ranking; "score" is then the fused score scaled to [0, 1], and
+                "semantic_score" and "keyword_score" hold the two inputs
+
+        Returns:
+            List[List[Dict[str, Any]]]: Matching candidates per project, in input order
+        """
+        mode = mode or self.search_mode
+        if mode not in SEARCH_MODES:
+            raise ValueError(f"Unknown search mode {mode!r}; expected one of {', '.join(SEARCH_MODES)}")
+        if self.index is None:
+            if not self.quiet:
+                print("❌ Index not built. Please process resumes first.", file=sys.stderr)
+            return [[] for _ in project_descriptions]
+        if not project_descriptions:
+            return []
+
+        # Only the project's applicants are scored: FAISS skips every other id
+        members, params, k = None, None, self.index.ntotal
+        if project_id is not None:
+            members = self.projects.get(project_id, {})
+            index_ids = np.array([self._index_ids[file_id] for file_id in members], dtype='int64')
+            if not len(index_ids):
+                return [[] for _ in project_descriptions]
+            params = search_parameters(self.index, faiss.IDSelectorBatch(index_ids))
+            k = len(index_ids)
+
+        pool = self.rerank_pool or (None if index_type_of(self.index) == "flat" else ANN_RERANK_POOL)
+        if pool:
+            k = min(k, max(pool, top_k))
+        if k < 1:
+            # Every resume has been removed; FAISS rejects searches for zero neighbours
+            return [[] for _ in project_descriptions]
+
+        # Create search queries
+        queries = [
+            f"Project Requirements:\n{project_description}\nLooking for relevant candidates."
+            for project_description in project_descriptions
+        ]
+
+        # Get query embeddings
+        query_embeddings = self.embedding_model.encode(queries, batch_size=self.encode_batch_size).astype('float32')
+        faiss.normalize_L2(query_embeddings)
+
+        # Score every indexed resume (or the nearest rerank_pool on approximate indexes); the
+        # metadata blend is cheap enough to run over the whole corpus
+        all_scores, all_indices = self.index.search(query_embeddings, k, params=params)
+
+        # Re-rank results using metadata
+        metadata_scores = self._metadata_scores(project_descriptions)
+
+        if mode == "hybrid":
+            member_rows = None
+            if members is not None:
+                member_rows = np.array([self.records.row(file_id) for file_id in members], dtype=np.int64)
+            return [
+                self._fuse_candidates(description, scores, indices, metadata_scores[:, column], top_k,
+                                      members, member_rows)
+                for column, (description, scores, indices)
+                in enumerate(zip(project_descriptions, all_scores, all_indices))
+            ]
+
+        return [
+            self._rank_candidates(scores, indices, metadata_scores[:, column], top_k, members)
+            for column, (scores, indices) in enumerate(zip(all_scores, all_indices))
+        ]
+
+    def _dense_ranking(self, scores: np.ndarray, indices: np.ndarray, metadata_scores: np.ndarray,
+                       depth: Optional[int] = None) -> tuple:
+        """
+        Blend one query's FAISS hits with per-row metadata scores.
+
+        Returns:
+            tuple: (file ids, scores) of the best `depth` hits (all if None), best first
+        """
+        indices, _, combined_scores = self._blend_dense(scores, indices, metadata_scores)
+        return self._top_dense(indices, combined_scores, depth)
+
+    def _blend_dense(self, scores: np.ndarray, indices: np.ndarray, metadata_scores: np.ndarray) -> tuple:
+        """(index ids, record rows, combined scores) of one query's live FAISS hits, in FAISS order."""
+        rows = self._rows_for_index_ids(indices)
+        hits = rows >= 0
+        indices, rows = indices[hits], rows[hits]
+
+        # Combined score: 60% semantic similarity + 40% metadata similarity
+        return indices, rows, (scores[hits] * 0.6) + (metadata_scores[rows] * 0.4)
+
+    def _top_dense(self, indices: np.ndarray, combined_scores: np.ndarray, depth: Optional[int]) -> tuple:
+        """(file ids, scores) of the best `depth` blended hits, best first."""
+        # Only the best `depth` hits are sorted; ties keep FAISS order, as a stable sort would
+        candidates = np.arange(len(combined_scores))
+        if depth is not None and 0 < depth < len(combined_scores):
+            cutoff = np.partition(-combined_scores, depth - 1)[depth - 1]
+            candidates = np.flatnonzero(-combined_scores <= cutoff)
+        order = candidates[np.lexsort((candidates, -combined_scores[candidates]))][:depth]
+        return [self._file_ids_by_index_id[int(i)] for i in indices[order]], combined_scores[order]
+
+    def _rank_candidates(self, scores: np.ndarray, indices: np.ndarray, metadata_scores: np.ndarray,
+                         top_k: int, members: Optional[Dict[str, tuple]] = None) -> List[Dict[str, Any]]:
+        """Rank one query's FAISS hits by the dense/metadata blend and build the result dicts."""
+        file_ids, combined_scores = self._dense_ranking(scores, indices, metadata_scores, top_k)
+        return [
+            self._candidate(file_id, float(score), members)
+            for file_id, score in zip(file_ids, combined_scores)
+        ]
+
+    def _fuse_candidates(self, project_description: str, scores: np.ndarray, indices: np.ndarray,
+                         metadata_scores: np.ndarray, top_k: int, members: Optional[Dict[str, tuple]] = None,
+                         member_rows: Optional[np.ndarray] = None) -> List[Dict[str, Any]]:
+        """Fuse one query's dense ranking with its BM25 ranking and build the result dicts."""
+        hit_indices, hit_rows, combined_scores = self._blend_dense(scores, indices, metadata_scores)
+        dense_ids, dense_scores = self._top_dense(hit_indices, combined_scores, RRF_DEPTH)
+        lexical_rows, lexical_scores = self._lexical_index().search(project_description, RRF_DEPTH, member_rows)
+        lexical_ids = [self.records.file_id_at(int(row)) for row in lexical_rows]
+
+        fused: Dict[str, float] = {}
+        for ranking in (dense_ids, lexical_ids):
+            for rank, file_id in enumerate(ranking, 1):
+                fused[file_id] = fused.get(file_id, 0.0) + 1.0 / (RRF_K + rank)
+
+        semantic = dict(zip(dense_ids, dense_scores.tolist()))
+        keyword = dict(zip(lexical_ids, lexical_scores.tolist()))
+        dense_rank = {file_id: rank for rank, file_id in enumerate(dense_ids)}
+
+        # Keyword-only candidates below the dense cut-off still report their dense score, found by row
+        missing = [row for row, file_id in zip(lexical_rows, lexical_ids) if file_id not in semantic]
+        if missing:
+            for position in np.flatnonzero(np.isin(hit_rows, missing)):
+                semantic[self.records.file_id_at(int(hit_rows[position]))] = float(combined_scores[position])
+
+        # Ties (e.g. only one ranking found them, at the same rank) go to the better dense rank, then score
+        order = sorted(fused, key=lambda file_id: (
+            -fused[file_id], dense_rank.get(file_id, len(dense_ids)), -semantic.get(file_id, float("-inf"))
+        ))
+
+        best = 2.0 / (RRF_K + 1)
+        results = []
+        for file_id in order[:top_k]:
+            result = self._candidate(file_id, fused[file_id] / best, members)
+            result["semantic_score"] = semantic.get(file_id)
+            result["keyword_score"] = keyword.get(file_id, 0.0)
+            results.append(result)
         return results
 
-    def calculate_metadata_similarity(self, project_description: str, metadata: Dict[str, Any]) -> float:
+    def _candidate(self, file_id: str, score: float, members: Optional[Dict[str, tuple]] = None) -> Dict[str, Any]:
+        """Result dict of one ranked resume."""
+        entry = self.resume_metadata[file_id]
+        # A shared resume is reported under the file name it has in this project
+        file_name, file_path = members[file_id] if members else (entry["file_name"], entry["file_path"])
+        result = {
+            "id": file_id,
+            "score": score,
+            "file_name": file_name,
+            "file_path": file_path,
+        }
+        # Low-memory results reference the text by id; get_resume_text loads it on demand
+        if self.low_memory:
+            result["excerpt"] = self._resume_excerpt(file_id, RESULT_EXCERPT_CHARS)
+        else:
+            result["text"] = self.resumes[self._positions[file_id]]
+        result["metadata"] = entry["metadata"]
+        return result
+
+    def keyword_search(self, query: str, top_k: int = 5, project_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        BM25 keyword search over the whole corpus, without the embedding model.
+
+        Args:
+            query (str): Keywords, e.g. "Verilog FPGA"
+            top_k (int): Number of candidates to return
+            project_id (Optional[str]): Restrict the search to a project synced with sync_project
+
+        Returns:
+            List[Dict[str, Any]]: Candidates containing at least one query term, best first;
+            "score" is the BM25 score
+        """
+        members, member_rows = None, None
+        if project_id is not None:
+            members = self.projects.get(project_id, {})
+            member_rows = np.array([self.records.row(file_id) for file_id in members], dtype=np.int64)
+        rows, scores = self._lexical_index().search(query, top_k, member_rows)
+        return [
+            self._candidate(self.records.file_id_at(int(row)), float(score), members)
+            for row, score in zip(rows, scores)
+        ]
+
+    def _lexical_index(self) -> BM25Index:
+        """The BM25 index, built over every resume on first use and kept in step afterwards."""
+        if not self._lexical_ready:
+            self.lexical.clear()
+            for position, file_id in enumerate(self.file_ids):
+                self.lexical.set_row(self.records.row(file_id), self.resumes[position],
+                                     self.records.get(file_id).skills_lower)
+            self._lexical_ready = True
+        return self.lexical
+
+    def _metadata_scores(self, project_descriptions: List[str]) -> np.ndarray:
+        """Vectorized calculate_metadata_similarity: (record store rows, descriptions) scores."""
+        if not self._reranker_ready:
+            self.reranker.clear()
+            for file_id in self.file_ids:
+                self.reranker.set_row(self.records.row(file_id), self.records.get(file_id))
+            self._reranker_ready = True
+        return self.reranker.score_many(project_descriptions)
+
+    def _rows_for_index_ids(self, index_ids: np.ndarray) -> np.ndarray:
+        """Map FAISS ids to record store rows; -1 for ids that are not (or no longer) indexed."""
+        if self._rows_by_index_id is None:
+            lookup = np.full(self._next_index_id + 1, -1, dtype=np.int64)
+            for file_id, index_id in self._index_ids.items():
+                lookup[index_id] = self.records.row(file_id)
+            self._rows_by_index_id = lookup
+
+        rows = np.full(len(index_ids), -1, dtype=np.int64)
+        known = (index_ids >= 0) & (index_ids < len(self._rows_by_index_id))
+        rows[known] = self._rows_by_index_id[index_ids[known]]
+        return rows
+
+    def calculate_metadata_similarity(self, project_description: str,
+                                      metadata: Union[Dict[str, Any], ResumeRecord]) -> float:
         """
         Calculate similarity score based on metadata matching.
 
         Args:
             project_description (str): Project description
-            metadata (Dict[str, Any]): Candidate metadata
+            metadata (Union[Dict[str, Any], ResumeRecord]): Candidate metadata, raw or already normalized
 
         Returns:
             float: Similarity score between 0 and 1
         """
+        record = metadata if isinstance(metadata, ResumeRecord) else ResumeRecord("", "", "", metadata)
         score = 0.0
         project_desc_lower = project_description.lower()
 
         # Skills matching
-        skills = self._extract_skills(metadata.get("skills", []))
-        skill_matches = sum(1 for skill in skills if skill.lower() in project_desc_lower)
+        skill_matches = sum(1 for skill in record.skills_lower if skill in project_desc_lower)
         score += min(0.4, skill_matches * 0.05)
 
         # Experience level matching
-        experience_years = metadata.get("experience_years", 0)
-        if not isinstance(experience_years, (int, float)):
-            experience_years = 0
+        experience_years = record.experience_years
 
         if "senior" in project_desc_lower and experience_years >= 5:
             score += 0.2
@@ -353,18 +1647,15 @@ Important: Only return valid JSON, no additional text.
             score += 0.2
 
         # Education matching
-        education = self._extract_list_items(metadata.get("education", []))
-        for degree in education:
-            degree_lower = degree.lower()
+        for degree_lower in record.education_lower:
             if "phd" in project_desc_lower and "phd" in degree_lower:
                 score += 0.1
             elif "master" in project_desc_lower and "master" in degree_lower:
                 score += 0.1
 
         # Job title matching
-        job_titles = self._extract_list_items(metadata.get("job_titles", []))
-        for title in job_titles:
-            if title.lower() in project_desc_lower:
+        for title in record.job_titles_lower:
+            if title in project_desc_lower:
                 score += 0.05
 
         return min(1.0, score)
@@ -380,57 +1671,15 @@ Important: Only return valid JSON, no additional text.
         Returns:
             Dict[str, Any]: Summary with name, skills, reasons, and score
         """
-        metadata = candidate_info.get("metadata", {})
-        name = metadata.get("name", Path(candidate_info['file_name']).stem)
-
-        # Extract information safely
-        skills = self._extract_skills(metadata.get('skills', []))[:5]
-        job_titles = self._extract_list_items(metadata.get('job_titles', []))
-        education = self._extract_list_items(metadata.get('education', []))
-
-        experience_years = metadata.get("experience_years", 0)
-        if not isinstance(experience_years, (int, float)):
-            experience_years = 0
-
-        # Get resume excerpt
-        excerpt = candidate_info.get('text', '')
-        if isinstance(excerpt, str) and len(excerpt) > 1500:
-            excerpt = excerpt[:1500] + "..."
-
-        # Generate summary using LLM
-        prompt = f"""
-## PROJECT DESCRIPTION:
-{project_description}
-
-## CANDIDATE METADATA:
-Name: {name}
-Skills: {', '.join(skills)}
-Experience: {experience_years} years
-Previous Roles: {', '.join(job_titles)}
-Education: {', '.join(education)}
+        prompt, name, skills = self._summary_prompt(project_description, candidate_info)
 
-## RESUME EXCERPT:
-{excerpt}
-
----
-This candidate has been SELECTED as a top match for the project. Analyze why this candidate is SUITABLE and provide positive reasons for selection in EXACTLY this JSON format:
-{{
-  "name": "{name}",
-  "skills": {json.dumps(skills)},
-  "reasons": [
-    "Positive reason why this candidate is selected for this project",
-    "Another positive reason highlighting their strengths", 
-    "Third positive reason showing their fit for the role"
-  ],
-  "score": {candidate_info['score']:.2f}
-}}
-
-Focus on strengths, relevant experience, matching skills, and why they would be successful in this project.
-"""
+        cache_key, cached = self._cached_summary(project_description, candidate_info)
+        if cached is not None:
+            return cached
 
         try:
             response = self.mistral_client.chat.complete(
-                model="mistral-small-latest",
+                model=LLM_MODEL,
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0.3,
                 response_format={"type": "json_object"}
@@ -439,17 +1688,221 @@ Focus on strengths, relevant experience, matching skills, and why they would be
             result = json.loads(response.choices[0].message.content)
             result.setdefault("reasons", [])
             result.setdefault("skills", [])
-            return result
+            return self._store_summary(cache_key, result)
 
         except Exception as e:
             print(f"Error generating summary: {e}")
-            return {
-                "name": name,
-                "skills": skills,
-                "reasons": [f"Error generating summary: {str(e)}"],
-                "score": candidate_info.get('score', 0),
-                "error": str(e)
-            }
+            return self._fallback_summary(name, skills, candidate_info, str(e))
+
+    def summarize_candidates(self, project_description: str, candidates: List[Dict[str, Any]],
+                             concurrency: Optional[int] = None, timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Generate summaries for a shortlist concurrently.
+
+        Synchronous wrapper around summarize_candidates_async; call the async
+        variant directly from code that already runs an event loop.
+
+        Args:
+            project_description (str): Project description
+            candidates (List[Dict[str, Any]]): Candidates as returned by search_resumes
+            concurrency (Optional[int]): Maximum requests in flight; defaults to all candidates at once
+            timeout (Optional[float]): Seconds allowed per candidate; no limit if None
+
+        Returns:
+            List[Dict[str, Any]]: Summary per candidate, in input order
+        """
+        return self._run_async(self.summarize_candidates_async(project_description, candidates, concurrency, timeout))
+
+    async def summarize_candidates_async(self, project_description: str, candidates: List[Dict[str, Any]],
+                                         concurrency: Optional[int] = None,
+                                         timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Async variant of generate_candidate_summary for a whole shortlist.
+
+        Summaries are cached by project description, resume content and prompt
+        version, so re-opening a shortlist returns instantly: cache hits never
+        wait on llm_requests_per_second. A candidate whose
+        completion exceeds `timeout` gets an error summary instead of holding up
+        the others; error summaries are never cached.
+
+        Args:
+            project_description (str): Project description
+            candidates (List[Dict[str, Any]]): Candidates as returned by search_resumes
+            concurrency (Optional[int]): Maximum requests in flight; defaults to all candidates at once
+            timeout (Optional[float]): Seconds allowed per candidate; no limit if None
+
+        Returns:
+            List[Dict[str, Any]]: Summary per candidate, in input order
+        """
+        rate_limiter = TokenBucket(self.llm_requests_per_second) if self.llm_requests_per_second else None
+
+        async def summarize(candidate_info: Dict[str, Any]) -> Dict[str, Any]:
+            prompt, name, skills = self._summary_prompt(project_description, candidate_info)
+            cache_key, cached = self._cached_summary(project_description, candidate_info)
+            if cached is not None:
+                return cached
+
+            try:
+                # Waiting for the first token does not count against the candidate's timeout
+                if rate_limiter is not None:
+                    await rate_limiter.acquire()
+                response = await asyncio.wait_for(
+                    complete_with_retries(
+                        self.mistral_client,
+                        rate_limiter=rate_limiter,
+                        first_token_taken=True,
+                        model=LLM_MODEL,
+                        messages=[{"role": "user", "content": prompt}],
+                        temperature=0.3,
+                        response_format={"type": "json_object"}
+                    ),
+                    timeout
+                )
+                result = json.loads(response.choices[0].message.content)
+                result.setdefault("reasons", [])
+                result.setdefault("skills", [])
+                return self._store_summary(cache_key, result)
+            except asyncio.TimeoutError:
+                print(f"Summary for {name} timed out after {timeout:g}s", file=sys.stderr)
+                return self._fallback_summary(name, skills, candidate_info, f"Timed out after {timeout:g}s")
+            except Exception as e:
+                print(f"Error generating summary: {e}", file=sys.stderr)
+                return self._fallback_summary(name, skills, candidate_info, str(e))
+
+        def emit_summary(position: int, summary: Dict[str, Any]) -> None:
+            self._emit("summary", position=position, id=candidates[position].get("id"), summary=summary)
+
+        return await gather_bounded(candidates, summarize, concurrency or len(candidates), on_result=emit_summary)
+
+    def shortlist_events(self, folder_path: str, project_description: str, top_k: int = 5,
+                         project_id: Optional[str] = None, bundle_dir: Optional[str] = None,
+                         concurrency: Optional[int] = None, timeout: Optional[float] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Run the whole shortlisting pipeline as a stream of progress events.
+
+        Processes the folder (synced into the global index when project_id is
+        given, warm-started from bundle_dir when given), searches, and then
+        summarizes the candidates concurrently. Events arrive as each stage
+        makes progress, so the ranked "candidates" event comes before the
+        first LLM summary and every "summary" is emitted as soon as it is
+        ready. See resume_events for the event types; write_ndjson writes the
+        stream as NDJSON.
+
+        Args:
+            folder_path (str): Folder containing PDF resumes
+            project_description (str): Description of the project requirements
+            top_k (int): Number of candidates to shortlist
+            project_id (Optional[str]): Sync the folder as this project and search only its applicants
+            bundle_dir (Optional[str]): Bundle to warm-start from and refresh
+            concurrency (Optional[int]): Maximum summary requests in flight
+            timeout (Optional[float]): Seconds allowed per summary
+
+        Returns:
+            Iterator[Dict[str, Any]]: Events, ending with "done" ({candidates, summaries}) or "error"
+        """
+        def run(emit: EventHandler) -> Dict[str, Any]:
+            previous, self.on_event = self.on_event, emit
+            try:
+                if project_id is not None:
+                    ready = self.sync_project(project_id, folder_path)
+                elif bundle_dir is not None:
+                    ready = self.load_or_process(folder_path, bundle_dir)
+                else:
+                    ready = self.process_resumes(folder_path)
+                if not ready:
+                    raise RuntimeError("Failed to process resumes")
+                self._emit("index_ready", resume_count=self.get_resume_count())
+
+                candidates = self.search_resumes(project_description, top_k=top_k, project_id=project_id)
+                ranking = [{key: value for key, value in c.items() if key != "text"} for c in candidates]
+                self._emit("candidates", candidates=ranking)
+
+                summaries = self.summarize_candidates(project_description, candidates, concurrency, timeout)
+                return {"candidates": ranking, "summaries": summaries}
+            finally:
+                self.on_event = previous
+
+        return stream_events(run)
+
+    def _emit(self, event: str, **fields) -> None:
+        """Send a progress event to on_event, if set."""
+        if self.on_event is not None:
+            self.on_event({"event": event, **fields})
+
+    def _summary_prompt(self, project_description: str, candidate_info: Dict[str, Any]):
+        """Build the summary prompt for a candidate; returns (prompt, name, skills)."""
+        metadata = candidate_info.get("metadata", {})
+        name = metadata.get("name", Path(candidate_info['file_name']).stem)
+
+        # Indexed candidates were normalized at ingest; others are normalized here
+        record = self.records.get(candidate_info.get("id"))
+        if record is None:
+            record = ResumeRecord("", candidate_info['file_name'], "", metadata)
+        skills = list(record.skills[:5])
+
+        # Get resume excerpt
+        excerpt = self._candidate_text(candidate_info)
+        if isinstance(excerpt, str) and len(excerpt) > SUMMARY_EXCERPT_CHARS:
+            excerpt = excerpt[:SUMMARY_EXCERPT_CHARS] + "..."
+
+        prompt = SUMMARY_PROMPT_TEMPLATE.format(
+            project_description=project_description,
+            name=name,
+            skills=', '.join(skills),
+            experience_years=record.experience_years,
+            job_titles=', '.join(record.job_titles),
+            education=', '.join(record.education),
+            excerpt=excerpt,
+            skills_json=json.dumps(skills),
+            score=candidate_info['score']
+        )
+        return prompt, name, skills
+
+    def _candidate_text(self, candidate_info: Dict[str, Any]) -> str:
+        """Text a summary is based on: the candidate's own "text", else the indexed resume's opening."""
+        text = candidate_info.get("text")
+        if text is None and candidate_info.get("id") in self._positions:
+            # One character more than the prompt shows, so a cut excerpt still gets its "..."
+            text = self._resume_excerpt(candidate_info["id"], SUMMARY_EXCERPT_CHARS + 1)
+        return text or ""
+
+    def _cached_summary(self, project_description: str, candidate_info: Dict[str, Any]):
+        """Return (cache_key, cached summary or None); the key is None when caching is disabled."""
+        if self.summary_cache is None:
+            return None, None
+
+        resume_content = json.dumps(
+            [self._candidate_text(candidate_info)[:SUMMARY_EXCERPT_CHARS], candidate_info.get("metadata", {})],
+            sort_keys=True, default=str
+        )
+        cache_key = JsonCache.make_key(
+            hash_bytes(project_description.encode("utf-8")),
+            hash_bytes(resume_content.encode("utf-8")),
+            SUMMARY_PROMPT_VERSION,
+            LLM_MODEL
+        )
+        cached = self.summary_cache.get(cache_key)
+        if cached is not None:
+            # The ranking score can move as the applicant pool changes; the reasons do not
+            cached["score"] = candidate_info.get("score", cached.get("score", 0))
+        return cache_key, cached
+
+    def _store_summary(self, cache_key: Optional[str], summary: Dict[str, Any]) -> Dict[str, Any]:
+        """Cache a successful summary and return it."""
+        if cache_key is not None and isinstance(summary, dict):
+            self.summary_cache.put(cache_key, summary)
+        return summary
+
+    @staticmethod
+    def _fallback_summary(name: str, skills: List[str], candidate_info: Dict[str, Any], error: str) -> Dict[str, Any]:
+        """Summary used when the LLM call fails or times out; never cached."""
+        return {
+            "name": name,
+            "skills": skills,
+            "reasons": [f"Error generating summary: {error}"],
+            "score": candidate_info.get('score', 0),
+            "error": error
+        }
 
     def get_resume_count(self) -> int:
         """Get the number of processed resumes."""
@@ -459,77 +1912,56 @@ Focus on strengths, relevant experience, matching skills, and why they would be
         """Check if the system is ready for searching."""
         return self.index is not None and len(self.resumes) > 0
 
+    def is_model_loaded(self) -> bool:
+        """Check if the embedding model has been loaded (see warm_up)."""
+        return self._embedding_model is not None
+
     def get_resume_metadata(self, resume_id: str) -> Dict[str, Any]:
         """Get metadata for a specific resume by ID."""
         return self.resume_metadata.get(resume_id, {})
 
+    def get_resume_text(self, resume_id: str) -> Optional[str]:
+        """Get the full extracted text of a resume by ID, or None if it is unknown."""
+        position = self._positions.get(resume_id)
+        return None if position is None else self.resumes[position]
+
+    def get_index_stats(self) -> Dict[str, Any]:
+        """Get the index layout and the memory its vectors take compared with float32 storage."""
+        if self.index is None:
+            return {"type": self.index_type, "layout": None, "vectors": 0, "vector_bytes": 0, "float32_bytes": 0}
+        return {
+            "type": self.index_type,
+            "layout": index_type_of(self.index),
+            "vectors": int(self.index.ntotal),
+            "vector_bytes": vector_bytes(self.index),
+            "float32_bytes": int(self.index.ntotal) * self.index.d * 4,
+        }
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters and sizes of the persistent caches."""
+        stats = {}
+        if self.text_cache is not None:
+            stats["text"] = self.text_cache.stats()
+        if self.metadata_cache is not None:
+            stats["metadata"] = self.metadata_cache.stats()
+        if self.summary_cache is not None:
+            stats["summaries"] = self.summary_cache.stats()
+        if self._embedding_store is not None:
+            stats["embeddings"] = self._embedding_store.stats()
+        stats["last_index"] = dict(self.last_index_stats)
+        return stats
+
     def _extract_skills(self, skills_raw) -> List[str]:
         """Safely extract skills from various formats."""
-        clean_skills = []
-
-        if isinstance(skills_raw, list):
-            for skill in skills_raw:
-                try:
-                    if isinstance(skill, str):
-                        clean_skills.append(skill)
-                    elif isinstance(skill, dict):
-                        if 'skill' in skill:
-                            clean_skills.append(str(skill['skill']))
-                        elif 'name' in skill:
-                            clean_skills.append(str(skill['name']))
-                        else:
-                            # Take first string value from dict
-                            for value in skill.values():
-                                if isinstance(value, str):
-                                    clean_skills.append(value)
-                                    break
-                    else:
-                        clean_skills.append(str(skill))
-                except Exception as e:
-                    print(f"Warning: Could not process skill {skill}: {e}")
-                    continue
-        elif isinstance(skills_raw, str):
-            # Split by common delimiters
-            delimiters = [',', ';', '|', '\n']
-            skills_text = skills_raw
-            for delimiter in delimiters:
-                skills_text = skills_text.replace(delimiter, '|')
-            clean_skills = [skill.strip() for skill in skills_text.split('|') if skill.strip()]
-
-        return clean_skills[:10]  # Limit to 10 skills
+        return normalize_skills(skills_raw)
 
     def _extract_list_items(self, items_raw) -> List[str]:
         """Safely extract items from various list formats."""
-        clean_items = []
-
-        if isinstance(items_raw, list):
-            for item in items_raw:
-                try:
-                    if isinstance(item, str):
-                        clean_items.append(item)
-                    elif isinstance(item, dict):
-                        if 'name' in item:
-                            clean_items.append(str(item['name']))
-                        elif 'title' in item:
-                            clean_items.append(str(item['title']))
-                        elif 'degree' in item:
-                            clean_items.append(str(item['degree']))
-                        else:
-                            clean_items.append(str(item))
-                    else:
-                        clean_items.append(str(item))
-                except Exception as e:
-                    print(f"Warning: Could not process item {item}: {e}")
-                    continue
-
-        return clean_items
+        return normalize_list_items(items_raw)
 
     def _get_file_id_by_path(self, file_path: str) -> str:
         """Get file ID by file path."""
-        for file_id, metadata in self.resume_metadata.items():
-            if metadata["file_path"] == file_path:
-                return file_id
-        return None
+        return self.records.file_id_for_path(file_path)
 
 
 # Example usage:
@@ -0,0 +1,588 @@
+#!/usr/bin/env python3
+"""
+Long-lived shortlisting worker around ResumeSelector.
+
+The worker loads the embedding model and the Mistral client once and keeps a
+single warm ResumeSelector for the lifetime of the process, so a shortlist
+request only pays for search and LLM time. With --fast-start they are loaded
+by the first request that needs them instead, and the worker answers
+"health" right away.
+
+It speaks a JSON-lines protocol, either over stdin/stdout (default) or over a
+Unix socket (--socket PATH). Every request is one JSON object per line:
+
+    {"id": 1, "cmd": "process", "folder": "/path/to/project-applications/<id>"}
+    {"id": 1, "cmd": "process", "folder": "/path/to/project-applications/<id>", "project_id": "<id>"}
+    {"id": 2, "cmd": "search", "description": "...", "top_k": 3}
+    {"id": 2, "cmd": "search", "description": "...", "top_k": 3, "mode": "hybrid"}
+    {"id": 3, "cmd": "search_many", "descriptions": ["...", "..."], "top_k": 3}
+    {"id": 3, "cmd": "keyword_search", "query": "Verilog FPGA", "top_k": 3}
+    {"id": 4, "cmd": "summarize", "description": "...", "candidates": [{"id": "ab12cd34", "score": 0.71}]}
+    {"id": 5, "cmd": "shortlist", "folder": "...", "description": "...", "top_k": 3, "timeout": 30}
+    {"id": 6, "cmd": "health"}
+
+A "project_id" on process/search/search_many switches the worker to one global
+index shared by every project: resumes are keyed by content hash, so a student
+applying to several projects is processed once, and searches only consider the
+given project's applicants.
+
+Every response is one JSON object per line echoing the request id:
+
+    {"id": 1, "ok": true, "result": {...}}
+    {"id": 2, "ok": false, "error": "..."}
+
+"shortlist" runs process, search and summarize in one request and streams
+progress events (see resume_events) before its response, each on its own line
+with the request id and no "ok" key:
+
+    {"id": 5, "event": "extracted", "file_name": "STU001.pdf", "chars": 1834, "error": null}
+    {"id": 5, "event": "candidates", "candidates": [...]}
+    {"id": 5, "event": "summary", "position": 0, "candidate_id": "ab12cd34", "summary": {...}}
+    {"id": 5, "ok": true, "result": {"candidates": [...], "summaries": [...]}}
+
+The candidate id of a "summary" event is sent as "candidate_id", since "id"
+is the request id.
+
+With --workers N (and --socket) the worker pre-forks: the parent loads the
+model, and the folder given by --preload if any, then forks N processes that
+accept connections on the same socket. The children share the weights and
+the preloaded index copy-on-write and each runs at most --threads-per-worker
+compute threads. A connection stays with the child that accepted it, but
+children do not share later state: a "process" on one connection is not
+visible to another, so send self-contained "shortlist" requests or keep a
+project's requests on one connection.
+"""
+import os
+import sys
+import json
+import time
+import signal
+import argparse
+import threading
+import socketserver
+import warnings
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, TextIO
+
+warnings.filterwarnings("ignore")
+os.environ.setdefault('TOKENIZERS_PARALLELISM', 'false')
+os.environ.setdefault('HF_HUB_DISABLE_SYMLINKS_WARNING', '1')
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from resume_selector_main_class import SEARCH_MODES, ResumeSelector
+from resume_bundle import folder_fingerprint
+from resume_index import INDEX_TYPES
+from resume_encoder import ENCODER_BACKENDS, limit_threads
+from resume_extraction import extraction_backends
+from resume_cache import hash_bytes
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".cache", "resume_selector")
+
+
+class ShortlistWorker:
+    """
+    Dispatches JSON-lines commands to one resident ResumeSelector.
+
+    The worker remembers which folder is currently indexed together with a
+    fingerprint of its PDFs, so repeated "process" calls for an unchanged
+    project folder return immediately instead of re-parsing every resume.
+    When the selector has a cache directory, each folder's index is also kept
+    as an on-disk bundle, so switching between projects or restarting the
+    worker only processes resumes that changed.
+    """
+
+    def __init__(self, selector: ResumeSelector):
+        """
+        Initialize the worker around an already constructed selector.
+
+        Args:
+            selector (ResumeSelector): Warm selector shared by all requests
+        """
+        self.selector = selector
+        self.started_at = time.time()
+        self.requests_served = 0
+        self.folder: Optional[str] = None
+        self.folder_fingerprint: Optional[Dict[str, List[int]]] = None
+        self.global_mode = False
+        self._lock = threading.Lock()
+        self._send: Optional[Callable[[Dict[str, Any]], None]] = None
+
+        self.commands = {
+            "process": self.cmd_process,
+            "search": self.cmd_search,
+            "search_many": self.cmd_search_many,
+            "keyword_search": self.cmd_keyword_search,
+            "summarize": self.cmd_summarize,
+            "shortlist": self.cmd_shortlist,
+            "health": self.cmd_health,
+        }
+
+    def handle_line(self, line: str, send: Optional[Callable[[Dict[str, Any]], None]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Handle one raw protocol line.
+
+        Args:
+            line (str): A single JSON-encoded request
+            send (Optional[Callable[[Dict[str, Any]], None]]): Writes a protocol line before the
+                response; streaming commands use it for their events, which are dropped if None
+
+        Returns:
+            Optional[Dict[str, Any]]: Response object, or None for blank lines
+        """
+        line = line.strip()
+        if not line:
+            return None
+
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as e:
+            return {"id": None, "ok": False, "error": f"Invalid JSON: {e}"}
+
+        if not isinstance(request, dict):
+            return {"id": None, "ok": False, "error": "Request must be a JSON object"}
+
+        return self.handle_request(request, send)
+
+    def handle_request(self, request: Dict[str, Any],
+                       send: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """
+        Dispatch a decoded request to its command handler.
+
+        Args:
+            request (Dict[str, Any]): Request with "cmd" and optional "id"
+            send (Optional[Callable[[Dict[str, Any]], None]]): Writes event lines of streaming commands
+
+        Returns:
+            Dict[str, Any]: Response with "id", "ok" and "result" or "error"
+        """
+        request_id = request.get("id")
+        handler = self.commands.get(request.get("cmd"))
+        if handler is None:
+            return {"id": request_id, "ok": False, "error": f"Unknown command: {request.get('cmd')}"}
+
+        # A single selector holds a single index, so commands are serialized
+        with self._lock:
+            self.requests_served += 1
+            self._send = send
+            try:
+                return {"id": request_id, "ok": True, "result": handler(request)}
+            except Exception as e:
+                print(f"❌ Worker command {request.get('cmd')} failed: {e}", file=sys.stderr)
+                return {"id": request_id, "ok": False, "error": str(e)}
+            finally:
+                self._send = None
+
+    def cmd_process(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Index a folder of PDF resumes unless it is already indexed and unchanged."""
+        folder = request.get("folder")
+        if not folder:
+            raise ValueError("'folder' is required")
+
+        folder = str(Path(folder).resolve())
+        if not os.path.isdir(folder):
+            raise FileNotFoundError(f"Folder {folder} does not exist")
+        if request.get("project_id") is not None:
+            return self._process_project(str(request["project_id"]), folder)
+
+        fingerprint = folder_fingerprint(folder)
+        force = bool(request.get("force", False))
+
+        if not force and folder == self.folder and fingerprint == self.folder_fingerprint and self.selector.is_ready():
+            return {"folder": folder, "resume_count": self.selector.get_resume_count(), "reused": True}
+
+        self.folder = None
+        self.folder_fingerprint = None
+        self.global_mode = False
+        if self.selector.cache_dir:
+            bundle_dir = os.path.join(self.selector.cache_dir, "bundles", hash_bytes(folder.encode("utf-8"))[:16])
+            success = self.selector.load_or_process(folder, bundle_dir)
+        else:
+            success = self.selector.process_resumes(folder)
+        if not success:
+            raise RuntimeError("Failed to process resumes")
+
+        self.folder = folder
+        self.folder_fingerprint = fingerprint
+        return {"folder": folder, "resume_count": self.selector.get_resume_count(), "reused": False}
+
+    def _process_project(self, project_id: str, folder: str) -> Dict[str, Any]:
+        """Sync one project's folder into the global index, persisting it when it changed."""
+        bundle_dir = os.path.join(self.selector.cache_dir, "bundles", "global") if self.selector.cache_dir else None
+
+        if not self.global_mode:
+            # Leaving single-folder mode: start from the saved global index, if any
+            self.folder = None
+            self.folder_fingerprint = None
+            if not (bundle_dir and self.selector.load_bundle(bundle_dir)):
+                self.selector.clear()
+            self.global_mode = True
+
+        success = self.selector.sync_project(project_id, folder)
+        stats = dict(self.selector.last_sync_stats)
+        if bundle_dir and stats["rescanned"] and self.selector.is_ready():
+            self.selector.save_bundle(bundle_dir)
+        if not success:
+            raise RuntimeError("Failed to process resumes")
+
+        return {
+            "folder": folder,
+            "project_id": project_id,
+            "resume_count": len(self.selector.projects[project_id]),
+            "indexed_count": self.selector.get_resume_count(),
+            "reused": not stats["rescanned"],
+            "sync": stats,
+        }
+
+    def _search_scope(self, request: Dict[str, Any]) -> Optional[str]:
+        """Project id a search is restricted to, checking that the index can serve it."""
+        project_id = request.get("project_id")
+        if project_id is None:
+            if not self.selector.is_ready():
+                raise RuntimeError("Index not built. Send a 'process' command first.")
+            return None
+
+        project_id = str(project_id)
+        if not self.global_mode or project_id not in self.selector.projects:
+            raise RuntimeError(f"Project {project_id} not indexed. Send a 'process' command with its project_id first.")
+        return project_id
+
+    def cmd_search(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Search the currently indexed folder for a project description."""
+        description = request.get("description")
+        if not description:
+            raise ValueError("'description' is required")
+        project_id = self._search_scope(request)
+
+        top_k = int(request.get("top_k", 5))
+        candidates = self.selector.search_resumes(description, top_k=top_k, project_id=project_id,
+                                                  mode=request.get("mode"))
+        return {"candidates": self._strip_texts(candidates)}
+
+    def cmd_search_many(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Search the currently indexed folder for several project descriptions in one pass."""
+        descriptions = request.get("descriptions")
+        if not descriptions or not all(isinstance(d, str) and d for d in descriptions):
+            raise ValueError("'descriptions' must be a non-empty list of strings")
+        project_id = self._search_scope(request)
+
+        top_k = int(request.get("top_k", 5))
+        results = self.selector.search_resumes_many(descriptions, top_k=top_k, project_id=project_id,
+                                                    mode=request.get("mode"))
+        return {"results": [{"candidates": self._strip_texts(candidates)} for candidates in results]}
+
+    def cmd_keyword_search(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """BM25 keyword search of the currently indexed folder; needs no embedding."""
+        query = request.get("query")
+        if not query:
+            raise ValueError("'query' is required")
+        project_id = self._search_scope(request)
+
+        top_k = int(request.get("top_k", 5))
+        candidates = self.selector.keyword_search(query, top_k=top_k, project_id=project_id)
+        return {"candidates": self._strip_texts(candidates)}
+
+    def cmd_summarize(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Generate LLM summaries for candidates returned by a previous search."""
+        description = request.get("description")
+        if not description:
+            raise ValueError("'description' is required")
+
+        candidates = [self._candidate_info(candidate) for candidate in request.get("candidates", [])]
+        summaries = self.selector.summarize_candidates(description, candidates, timeout=request.get("timeout"))
+        for candidate_info, summary in zip(candidates, summaries):
+            summary["id"] = candidate_info["id"]
+
+        return {"summaries": summaries}
+
+    def cmd_shortlist(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Process, search and summarize in one request, streaming progress events as they happen."""
+        description = request.get("description")
+        if not description:
+            raise ValueError("'description' is required")
+
+        def emit(event: Dict[str, Any]) -> None:
+            if self._send is not None:
+                fields = {("candidate_id" if key == "id" else key): value for key, value in event.items()}
+                self._send({"id": request.get("id"), **fields})
+
+        self.selector.on_event = emit
+        try:
+            processed = self.cmd_process(request)
+            emit({"event": "index_ready", "resume_count": processed["resume_count"]})
+
+            top_k = int(request.get("top_k", 5))
+            project_id = self._search_scope(request)
+            candidates = self.selector.search_resumes(description, top_k=top_k, project_id=project_id,
+                                                      mode=request.get("mode"))
+            ranking = self._strip_texts(candidates)
+            emit({"event": "candidates", "candidates": ranking})
+
+            summaries = self.selector.summarize_candidates(description, candidates, timeout=request.get("timeout"))
+            for candidate, summary in zip(candidates, summaries):
+                summary["id"] = candidate["id"]
+        finally:
+            self.selector.on_event = None
+
+        return {"process": processed, "candidates": ranking, "summaries": summaries}
+
+    def cmd_health(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Report liveness and what the worker currently holds in memory."""
+        return {
+            "pid": os.getpid(),
+            "ready": self.selector.is_ready(),
+            "model_loaded": self.selector.is_model_loaded(),
+            "folder": self.folder,
+            "resume_count": self.selector.get_resume_count(),
+            "low_memory": self.selector.low_memory,
+            "memory": process_memory(),
+            "index": self.selector.get_index_stats(),
+            "projects": len(self.selector.projects),
+            "uptime_seconds": round(time.time() - self.started_at, 3),
+            "requests_served": self.requests_served,
+            "cache": self.selector.get_cache_stats(),
+        }
+
+    @staticmethod
+    def _strip_texts(candidates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Full resume texts stay in the worker; callers only need the ranking."""
+        return [{key: value for key, value in candidate.items() if key != "text"} for candidate in candidates]
+
+    def _candidate_info(self, candidate: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Rebuild the candidate dict expected by generate_candidate_summary from an id and score.
+
+        The resume text is left out; the selector loads the excerpt it needs by id.
+        """
+        file_id = candidate.get("id")
+        entry = self.selector.get_resume_metadata(file_id)
+        if not entry:
+            raise KeyError(f"Unknown candidate id: {file_id}")
+
+        return {
+            "id": file_id,
+            "score": float(candidate.get("score", 0.0)),
+            "file_name": entry["file_name"],
+            "file_path": entry["file_path"],
+            "metadata": entry["metadata"],
+        }
+
+
+def serve_stdio(worker: ShortlistWorker, stdin: TextIO, stdout: TextIO) -> None:
+    """
+    Serve JSON-lines requests from stdin until EOF.
+
+    Args:
+        worker (ShortlistWorker): Worker handling the requests
+        stdin (TextIO): Request stream
+        stdout (TextIO): Response stream, reserved for protocol lines only
+    """
+    def send(message: Dict[str, Any]) -> None:
+        stdout.write(json.dumps(message) + "\n")
+        stdout.flush()
+
+    for line in stdin:
+        response = worker.handle_line(line, send)
+        if response is not None:
+            send(response)
+
+
+def _socket_server(worker: ShortlistWorker, socket_path: str) -> socketserver.UnixStreamServer:
+    """Bind a Unix socket server that runs each connection in its own thread."""
+    class Handler(socketserver.StreamRequestHandler):
+        def send(self, message: Dict[str, Any]) -> None:
+            self.wfile.write((json.dumps(message) + "\n").encode("utf-8"))
+            self.wfile.flush()
+
+        def handle(self):
+            for raw in self.rfile:
+                response = worker.handle_line(raw.decode("utf-8"), self.send)
+                if response is not None:
+                    self.send(response)
+
+    class Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+    return Server(socket_path, Handler)
+
+
+def serve_socket(worker: ShortlistWorker, socket_path: str) -> None:
+    """
+    Serve JSON-lines requests over a Unix socket, one thread per connection.
+
+    Args:
+        worker (ShortlistWorker): Worker handling the requests
+        socket_path (str): Filesystem path of the Unix socket
+    """
+    with _socket_server(worker, socket_path) as server:
+        print(f"✅ Worker listening on {socket_path}", file=sys.stderr)
+        try:
+            server.serve_forever()
+        finally:
+            if os.path.exists(socket_path):
+                os.unlink(socket_path)
+
+
+def process_memory(pid: Optional[int] = None) -> Dict[str, int]:
+    """
+    Resident memory of a process, from /proc/<pid>/smaps_rollup on Linux.
+
+    "pss_bytes" charges each shared page to the processes sharing it in equal
+    parts, so summing it over pre-forked workers gives their real footprint,
+    while summing "rss_bytes" counts the shared model once per worker.
+
+    Args:
+        pid (Optional[int]): Process id; this process if None
+
+    Returns:
+        Dict[str, int]: rss_bytes, pss_bytes and shared_bytes; empty where /proc is unavailable
+    """
+    fields = {"Rss": "rss_bytes", "Pss": "pss_bytes", "Shared_Clean": "shared_bytes", "Shared_Dirty": "shared_bytes"}
+    memory: Dict[str, int] = {}
+    try:
+        with open(f"/proc/{pid or 'self'}/smaps_rollup", "r") as f:
+            for line in f:
+                name, _, value = line.partition(":")
+                if name in fields:
+                    key = fields[name]
+                    memory[key] = memory.get(key, 0) + int(value.split()[0]) * 1024
+    except OSError:
+        return {}
+    return memory
+
+
+def serve_prefork(worker: ShortlistWorker, socket_path: str, workers: int,
+                  threads_per_worker: Optional[int] = None) -> None:
+    """
+    Serve a Unix socket from `workers` processes forked from this warm one.
+
+    The selector is prepared with prepare_fork() and the listening socket is
+    bound before forking; every child reopens its caches, caps its threads
+    and accepts connections until it is terminated. Children that exit are
+    replaced. SIGTERM or SIGINT stops the children and returns.
+
+    Args:
+        worker (ShortlistWorker): Worker whose selector (and preloaded index) the children share
+        socket_path (str): Filesystem path of the Unix socket
+        workers (int): Number of child processes
+        threads_per_worker (Optional[int]): Compute threads per child; cores / workers if None
+    """
+    threads = threads_per_worker or max(1, (os.cpu_count() or 1) // workers)
+    worker.selector.prepare_fork()
+    server = _socket_server(worker, socket_path)
+    children: Dict[int, None] = {}
+    stopping = False
+
+    def spawn() -> None:
+        pid = os.fork()
+        if pid:
+            children[pid] = None
+            return
+        status = 1
+        try:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            limit_threads(threads)
+            worker.selector.after_fork()
+            worker.started_at = time.time()
+            server.serve_forever()
+            status = 0
+        finally:
+            os._exit(status)
+
+    def stop(signum, frame) -> None:
+        nonlocal stopping
+        stopping = True
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    previous = {signum: signal.signal(signum, stop) for signum in (signal.SIGTERM, signal.SIGINT)}
+    try:
+        for _ in range(workers):
+            spawn()
+        print(f"✅ {workers} workers ({threads} thread(s) each) listening on {socket_path}", file=sys.stderr)
+        while children:
+            pid, _ = os.wait()
+            children.pop(pid, None)
+            if not stopping:
+                print(f"⚠️ Worker {pid} exited; starting a replacement", file=sys.stderr)
+                spawn()
+    finally:
+        for signum, handler in previous.items():
+            signal.signal(signum, handler)
+        server.server_close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Persistent ResumeSelector worker (JSON-lines protocol)")
+    parser.add_argument("--socket", help="Serve on this Unix socket path instead of stdin/stdout")
+    parser.add_argument("--api-key", default=os.environ.get("MISTRAL_API_KEY", ""), help="Mistral API key (defaults to $MISTRAL_API_KEY)")
+    parser.add_argument("--embedding-model", default="BAAI/bge-base-en-v1.5", help="SentenceTransformer model name")
+    parser.add_argument("--embedding-backend", choices=ENCODER_BACKENDS, default="torch", help="Embedding inference backend")
+    parser.add_argument("--encode-batch-size", type=int, default=32, help="Texts per embedding batch")
+    parser.add_argument("--encode-workers", type=int, default=1, help="Processes sharing the model for bulk index builds")
+    parser.add_argument("--encode-threads", type=int, default=None, help="Compute threads per encode process (default: cores / encode workers)")
+    parser.add_argument("--extraction-workers", type=int, default=max(1, (os.cpu_count() or 2) - 1), help="Processes used for PDF extraction")
+    parser.add_argument("--extraction-timeout", type=float, default=60.0, help="Seconds a single PDF may take before it is skipped")
+    parser.add_argument("--extraction-backend", choices=extraction_backends(), default="pdfplumber", help="PDF text backend; auto tries PDFium first")
+    parser.add_argument("--extraction-max-chars", type=int, default=None, help="Stop parsing a PDF after this many characters")
+    parser.add_argument("--extraction-max-pages", type=int, default=None, help="Parse at most this many leading pages of a PDF")
+    parser.add_argument("--llm-concurrency", type=int, default=8, help="Concurrent LLM metadata requests")
+    parser.add_argument("--llm-requests-per-second", type=float, default=None, help="Rate limit for LLM requests")
+    parser.add_argument("--index-type", choices=INDEX_TYPES, default="flat", help="FAISS index type")
+    parser.add_argument("--index-options", type=json.loads, default=None, help='JSON overrides for the index parameters, e.g. \'{"nprobe": 32}\'')
+    parser.add_argument("--low-memory", action="store_true", help="Keep resume texts on disk instead of in memory")
+    parser.add_argument("--cache-dir", default=os.environ.get("RESUME_SELECTOR_CACHE_DIR", DEFAULT_CACHE_DIR), help="Root directory for persistent caches")
+    parser.add_argument("--search-mode", choices=SEARCH_MODES, default="dense", help="Default retrieval mode")
+    parser.add_argument("--fast-start", action="store_true", help="Load the embedding model on first use instead of at startup")
+    parser.add_argument("--workers", type=int, default=1, help="Pre-forked processes sharing the model (requires --socket)")
+    parser.add_argument("--threads-per-worker", type=int, default=None, help="Compute threads per pre-forked worker (default: cores / workers)")
+    parser.add_argument("--preload", help="Resume folder to index before forking, shared by all workers")
+    args = parser.parse_args()
+
+    if args.workers > 1 and not args.socket:
+        parser.error("--workers requires --socket")
+    if args.workers > 1 and args.embedding_backend != "torch":
+        parser.error("--workers requires the torch embedding backend; ONNX Runtime sessions do not survive fork")
+
+    if not args.api_key:
+        print("❌ Mistral API key not configured", file=sys.stderr)
+        sys.exit(1)
+
+    # Anything the selector prints must not corrupt the protocol stream
+    protocol_out = sys.stdout
+    sys.stdout = sys.stderr
+
+    print("Initializing AI Resume Selector worker...", file=sys.stderr)
+    selector = ResumeSelector(api_key=args.api_key, embedding_model=args.embedding_model, quiet=True, cache_dir=args.cache_dir,
+                              embedding_backend=args.embedding_backend, encode_batch_size=args.encode_batch_size,
+                              encode_workers=args.encode_workers, encode_threads=args.encode_threads,
+                              search_mode=args.search_mode,
+                              extraction_workers=args.extraction_workers, extraction_timeout=args.extraction_timeout,
+                              extraction_backend=args.extraction_backend, extraction_max_chars=args.extraction_max_chars,
+                              extraction_max_pages=args.extraction_max_pages,
+                              llm_concurrency=args.llm_concurrency, llm_requests_per_second=args.llm_requests_per_second,
+                              index_type=args.index_type, index_options=args.index_options, low_memory=args.low_memory)
+    if not args.fast_start:
+        selector.warm_up()
+    worker = ShortlistWorker(selector)
+    if args.preload:
+        worker.cmd_process({"folder": args.preload})
+
+    if args.workers > 1:
+        serve_prefork(worker, args.socket, args.workers, args.threads_per_worker)
+    elif args.socket:
+        serve_socket(worker, args.socket)
+    else:
+        serve_stdio(worker, sys.stdin, protocol_out)
+
+
+if __name__ == "__main__":
+    main()
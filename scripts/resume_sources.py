@@ -0,0 +1,83 @@
+"""
+In-memory PDF sources for ResumeSelector.
+
+Resumes do not have to live in a folder: OpportunityApplication keeps them
+as resumeData blobs in the database, and drivers hand those back as bytes
+(sqlite3), memoryview (psycopg2) or file-like blob handles. pdf_buffer turns
+any of these into a memoryview over the existing bytes, and BufferReader
+exposes that memoryview as the seekable binary stream the PDF parsers read
+from, so a blob reaches pdfplumber or PDFium without being copied into a
+second buffer or written to a temporary file.
+
+iter_cursor_rows streams rows from a DB-API cursor with fetchmany(), so only
+one batch of blobs is held at a time. With psycopg2, use a named
+(server-side) cursor for the rows to be streamed from the server as well.
+"""
+import io
+from typing import Any, BinaryIO, Iterator, Tuple, Union
+
+PdfSource = Union[bytes, bytearray, memoryview, BinaryIO]
+
+
+def pdf_buffer(source: PdfSource) -> memoryview:
+    """
+    Zero-copy view of a PDF held in memory.
+
+    Args:
+        source (PdfSource): bytes, bytearray, memoryview or any object supporting the buffer
+            protocol; an io.BytesIO (its whole buffer); or a binary file object, which is read
+            once from its current position
+
+    Returns:
+        memoryview: Flat byte view of the PDF
+    """
+    if isinstance(source, io.BytesIO):
+        return source.getbuffer()
+    if hasattr(source, "read") and not isinstance(source, memoryview):
+        return memoryview(source.read())
+    view = memoryview(source)
+    return view if view.format == "B" and view.ndim == 1 else view.cast("B")
+
+
+class BufferReader(io.RawIOBase):
+    """Read-only, seekable binary stream over a memoryview, without copying it."""
+
+    def __init__(self, buffer: memoryview):
+        super().__init__()
+        self._buffer = buffer
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, target) -> int:
+        chunk = self._buffer[self._position:self._position + len(target)]
+        size = len(chunk)
+        memoryview(target).cast("B")[:size] = chunk
+        self._position += size
+        return size
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += len(self._buffer)
+        if offset < 0:
+            raise ValueError(f"negative seek position {offset}")
+        self._position = offset
+        return offset
+
+    def tell(self) -> int:
+        return self._position
+
+
+def iter_cursor_rows(cursor, batch_size: int) -> Iterator[Tuple[Any, ...]]:
+    """Rows of an executed DB-API cursor, fetched batch_size at a time."""
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            return
+        yield from rows
@@ -0,0 +1,156 @@
+"""
+Disk-backed resume texts for ResumeSelector's low-memory mode.
+
+By default every extracted resume text is held in a Python list. DiskTextList
+keeps the same list interface but stores the texts as concatenated UTF-8 in
+an anonymous spill file and holds only a (blob, start, end) byte range per
+entry. Entries are decoded on every access and never cached, so resident
+memory stays proportional to the number of resumes, not their length.
+excerpt() reads just the first bytes of an entry, which is all the embedding
+profile and the summary prompt need.
+
+Entries loaded from a bundle point straight into its mapped texts.bin and are
+only copied to the spill file when they are replaced.
+"""
+import os
+import mmap
+import tempfile
+from collections.abc import MutableSequence
+from typing import Iterable, List, Optional, Tuple
+
+# Spill files are compacted once replaced or removed texts take up more than
+# half of them and at least this many bytes
+COMPACT_MIN_GARBAGE_BYTES = 1024 * 1024
+
+
+class _SpillFile:
+    """Append-only anonymous file, read back through a memory map that grows with it."""
+
+    def __init__(self, directory: Optional[str] = None):
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = tempfile.TemporaryFile(dir=directory)
+        self._size = 0
+        self._map = None
+
+    def append(self, data: bytes) -> Tuple[int, int]:
+        start = self._size
+        self._file.seek(start)
+        self._file.write(data)
+        self._size += len(data)
+        return start, self._size
+
+    def read(self, start: int, end: int) -> bytes:
+        if start == end:
+            return b""
+        if end > (len(self._map) if self._map is not None else 0):
+            self._file.flush()
+            if self._map is not None:
+                self._map.close()
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._map[start:end]
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+
+class DiskTextList(MutableSequence):
+    """
+    List of texts that keeps only byte ranges in memory.
+
+    Behaves like List[str]: appends, assignments and deletions work as usual,
+    but each new text is written to a spill file and every read decodes it
+    again. Texts already on disk (a bundle's texts.bin) are referenced in place.
+    """
+
+    def __init__(self, directory: Optional[str] = None, blob=None, ranges: Iterable[List[int]] = ()):
+        """
+        Args:
+            directory (Optional[str]): Where to create the spill file; the system temp dir if None
+            blob: Object with read(start, end) -> bytes holding existing texts, e.g. a mapped texts.bin
+            ranges (Iterable[List[int]]): [start, end) byte range of each existing text in `blob`
+        """
+        self._directory = directory
+        self._spill = _SpillFile(directory)
+        self._items: List[tuple] = [(blob, start, end) for start, end in ranges]
+        self._garbage = 0
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self[i] for i in range(*position.indices(len(self._items)))]
+        blob, start, end = self._items[position]
+        return blob.read(start, end).decode("utf-8")
+
+    def __setitem__(self, position, value: str):
+        self._release(self._items[position])
+        self._items[position] = self._write(value)
+        self._maybe_compact()
+
+    def __delitem__(self, position):
+        self._release(self._items[position])
+        del self._items[position]
+        self._maybe_compact()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def insert(self, position, value: str):
+        self._items.insert(position, self._write(value))
+
+    def clear(self):
+        self._items.clear()
+        self._spill.close()
+        self._spill = _SpillFile(self._directory)
+        self._garbage = 0
+
+    def excerpt(self, position: int, chars: int) -> str:
+        """The first `chars` characters of a text, decoding only the bytes they can occupy."""
+        blob, start, end = self._items[position]
+        # A UTF-8 character is at most 4 bytes; a character cut in half at the end is dropped
+        data = blob.read(start, min(end, start + 4 * chars))
+        return data.decode("utf-8", errors="ignore")[:chars]
+
+    def nbytes(self) -> int:
+        """Encoded size of all texts."""
+        return sum(end - start for _, start, end in self._items)
+
+    def close(self) -> None:
+        self._items.clear()
+        self._spill.close()
+
+    def detach(self) -> None:
+        """
+        Write new texts to a fresh spill file, keeping existing texts readable.
+
+        Call in a forked child: the inherited spill file and its offset are
+        shared with the parent and siblings, so appending to it would clobber
+        their texts.
+        """
+        self._spill = _SpillFile(self._directory)
+        self._garbage = 0
+
+    def _write(self, value: str) -> tuple:
+        return (self._spill, *self._spill.append(value.encode("utf-8")))
+
+    def _release(self, item: tuple) -> None:
+        if item[0] is self._spill:
+            self._garbage += item[2] - item[1]
+
+    def _maybe_compact(self) -> None:
+        """Rewrite the spill file without texts that were replaced or removed."""
+        if self._garbage < COMPACT_MIN_GARBAGE_BYTES or 2 * self._garbage < self._spill.size:
+            return
+        old = self._spill
+        self._spill = _SpillFile(self._directory)
+        for position, (blob, start, end) in enumerate(self._items):
+            if blob is old:
+                self._items[position] = (self._spill, *self._spill.append(old.read(start, end)))
+        old.close()
+        self._garbage = 0
@@ -37,11 +37,11 @@ python -m pip install --upgrade pip
 
 # Install required packages
 Write-Host "📥 Installing AI packages..." -ForegroundColor Yellow
-python -m pip install numpy sentence-transformers faiss-cpu pdfplumber mistralai python-dotenv
+python -m pip install numpy scipy sentence-transformers faiss-cpu pdfplumber pypdfium2 mistralai python-dotenv
 
 # Test installation
 Write-Host "🧪 Testing installation..." -ForegroundColor Yellow
-python -c "import numpy, sentence_transformers, faiss, pdfplumber, mistralai; print('✅ All packages installed successfully!')"
+python -c "import numpy, scipy, sentence_transformers, faiss, pdfplumber, pypdfium2, mistralai; print('✅ All packages installed successfully!')"
 
 Write-Host ""
 Write-Host "🎉 Setup complete! Your Python environment is ready for AI features." -ForegroundColor Green
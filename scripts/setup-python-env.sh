@@ -34,11 +34,11 @@ python -m pip install --upgrade pip
 
 # Install required packages
 echo "📥 Installing AI packages..."
-python -m pip install numpy sentence-transformers faiss-cpu pdfplumber mistralai python-dotenv
+python -m pip install numpy scipy sentence-transformers faiss-cpu pdfplumber pypdfium2 mistralai python-dotenv
 
 # Test installation
 echo "🧪 Testing installation..."
-python -c "import numpy, sentence_transformers, faiss, pdfplumber, mistralai; print('✅ All packages installed successfully!')"
+python -c "import numpy, scipy, sentence_transformers, faiss, pdfplumber, pypdfium2, mistralai; print('✅ All packages installed successfully!')"
 
 echo ""
 echo "🎉 Setup complete! Your Python environment is ready for AI features."
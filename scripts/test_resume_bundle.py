@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Tests for saving and memory-mapping per-project index bundles
+"""
+import threading
+import time
+
+import faiss
+import numpy as np
+
+import resume_bundle
+import resume_selector_main_class
+from conftest import write_pdf
+from resume_bundle import LazyRecordMap, LazyTextList, open_bundle, read_manifest, write_bundle
+
+QUERY = "Robotics project using ROS and Embedded C"
+
+
+def test_bundle_round_trip_needs_no_model_or_llm_work(selector_factory, resume_folder, tmp_path):
+    bundle_dir = str(tmp_path / "bundle")
+    built = selector_factory()
+    assert built.process_resumes(str(resume_folder))
+    assert built.save_bundle(bundle_dir, str(resume_folder))
+
+    loaded = selector_factory()
+    assert loaded.load_bundle(bundle_dir, str(resume_folder))
+    assert isinstance(loaded.resumes, LazyTextList)
+    assert isinstance(loaded.resume_metadata, LazyRecordMap)
+    assert loaded.get_resume_count() == 5
+
+    results = loaded.search_resumes(QUERY, top_k=3)
+    assert [(r["id"], r["file_name"], r["text"]) for r in results] == \
+        [(r["id"], r["file_name"], r["text"]) for r in built.search_resumes(QUERY, top_k=3)]
+    assert loaded.mistral_client.calls == 0
+    assert loaded.embedding_model.encode_calls == 1  # the query only
+
+
+def test_stale_bundle_is_detected_and_refreshed(selector_factory, resume_folder, tmp_path):
+    bundle_dir = str(tmp_path / "bundle")
+    first = selector_factory()
+    assert first.load_or_process(str(resume_folder), bundle_dir)
+    assert first.mistral_client.calls == 5
+    generation = read_manifest(bundle_dir)["generation"]
+
+    (resume_folder / "STU002_bala.pdf").unlink()
+    write_pdf(resume_folder / "STU008_hari.pdf", ["Name: Hari Das", "ROS and Embedded C firmware, 7 years"])
+
+    stale = selector_factory()
+    assert not stale.load_bundle(bundle_dir, str(resume_folder))
+
+    refreshed = selector_factory()
+    assert refreshed.load_or_process(str(resume_folder), bundle_dir)
+    assert refreshed.mistral_client.calls == 1
+    assert refreshed.get_resume_count() == 5
+    assert read_manifest(bundle_dir)["generation"] != generation
+    assert not (tmp_path / "bundle" / generation).exists()
+
+    rebuilt = selector_factory()
+    assert rebuilt.process_resumes(str(resume_folder))
+    assert [r["file_name"] for r in refreshed.search_resumes(QUERY, top_k=5)] == \
+        [r["file_name"] for r in rebuilt.search_resumes(QUERY, top_k=5)]
+
+    # The refreshed bundle is current again
+    again = selector_factory()
+    assert again.load_bundle(bundle_dir, str(resume_folder))
+
+
+def test_bundle_rejected_after_prompt_change(selector_factory, resume_folder, tmp_path, monkeypatch):
+    bundle_dir = str(tmp_path / "bundle")
+    selector = selector_factory()
+    assert selector.load_or_process(str(resume_folder), bundle_dir)
+
+    monkeypatch.setattr(resume_selector_main_class, "METADATA_PROMPT_VERSION", "next-version")
+    assert not selector_factory().load_bundle(bundle_dir)
+
+
+def test_concurrent_writers_do_not_delete_each_others_generations(tmp_path, monkeypatch):
+    bundle_dir = tmp_path / "global"
+    real_write_index = faiss.write_index
+
+    def slow_write_index(index, path):
+        # The first writer is still filling its generation when the second one starts
+        if threading.current_thread().name == "slow":
+            time.sleep(0.3)
+        real_write_index(index, path)
+
+    monkeypatch.setattr(resume_bundle.faiss, "write_index", slow_write_index)
+
+    def save(label: str) -> None:
+        index = faiss.IndexIDMap(faiss.IndexFlatIP(4))
+        index.add_with_ids(np.eye(1, 4, dtype=np.float32), np.array([0], dtype=np.int64))
+        write_bundle(str(bundle_dir), index, [label], [0], [f"text of {label}"],
+                     [{"file_name": label, "file_path": label, "metadata": {}}], {"writer": label})
+
+    errors = []
+
+    def run(label: str) -> None:
+        try:
+            save(label)
+        except Exception as e:
+            errors.append(e)
+
+    slow = threading.Thread(target=run, args=("slow",), name="slow")
+    slow.start()
+    time.sleep(0.1)
+    fast = threading.Thread(target=run, args=("fast",), name="fast")
+    fast.start()
+    slow.join()
+    fast.join()
+
+    assert errors == []
+    manifest = read_manifest(str(bundle_dir))
+    generations = [child.name for child in bundle_dir.iterdir() if child.is_dir()]
+    assert generations == [manifest["generation"]]
+    _, texts, _ = open_bundle(str(bundle_dir), manifest)
+    assert texts[0] == f"text of {manifest['writer']}"
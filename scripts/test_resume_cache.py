@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Tests for the persistent resume caches
+"""
+import os
+import shutil
+
+import numpy as np
+import pdfplumber
+
+import resume_selector_main_class
+from conftest import write_pdf
+from resume_cache import EmbeddingStore, TextCache
+
+
+def test_text_cache_skips_pdf_parsing_for_unchanged_files(selector_factory, resume_folder, tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    selector = selector_factory(cache_dir=str(cache_dir))
+    assert selector.process_resumes(str(resume_folder))
+    assert selector.get_cache_stats()["text"]["misses"] == 5
+    texts = list(selector.resumes)
+
+    # A fresh process with the same cache root must not open a single PDF
+    def fail_open(*args, **kwargs):
+        raise AssertionError("pdfplumber.open called for a cached resume")
+
+    monkeypatch.setattr(pdfplumber, "open", fail_open)
+    warm = selector_factory(cache_dir=str(cache_dir))
+
+    # Content addressing: a renamed copy of an already seen resume is still a hit
+    shutil.copy(resume_folder / "STU001_alice.pdf", resume_folder / "STU999_renamed.pdf")
+    assert warm.process_resumes(str(resume_folder))
+
+    stats = warm.get_cache_stats()["text"]
+    assert stats["hits"] == 6
+    assert stats["misses"] == 0
+    alice = next(text for text in texts if text.startswith("Name: Alice"))
+    assert sorted(warm.resumes) == sorted(texts + [alice])
+
+
+def test_text_cache_key_depends_on_settings(tmp_path):
+    cache = TextCache(str(tmp_path))
+    cache.put(TextCache.make_key("abc", {"use_text_flow": True}), "flowed text")
+
+    assert cache.get(TextCache.make_key("abc", {"use_text_flow": True})) == "flowed text"
+    assert cache.get(TextCache.make_key("abc", {"use_text_flow": False})) is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_text_cache_evicts_least_recently_used(tmp_path):
+    cache = TextCache(str(tmp_path), max_bytes=2500)
+    payloads = {name: os.urandom(1000).hex() for name in ("a", "b", "c")}
+
+    cache.put("a", payloads["a"])
+    cache.put("b", payloads["b"])
+    assert cache.get("a") is not None  # "b" is now the least recently used entry
+    cache.put("c", payloads["c"])
+
+    stats = cache.stats()
+    assert stats["evictions"] >= 1
+    assert stats["bytes"] <= 2500
+    assert cache.get("b") is None
+    assert cache.get("c") == payloads["c"]
+
+
+def test_metadata_cache_avoids_repeat_llm_calls(selector_factory, resume_folder, tmp_path, monkeypatch):
+    cache_dir = str(tmp_path / "cache")
+    cold = selector_factory(cache_dir=cache_dir)
+    assert cold.process_resumes(str(resume_folder))
+    assert cold.mistral_client.calls == 5
+
+    warm = selector_factory(cache_dir=cache_dir)
+    assert warm.process_resumes(str(resume_folder))
+    assert warm.mistral_client.calls == 0
+    assert warm.get_cache_stats()["metadata"]["hits"] == 5
+    assert sorted(m["metadata"]["name"] for m in warm.resume_metadata.values()) == \
+        sorted(m["metadata"]["name"] for m in cold.resume_metadata.values())
+
+    # Changing the prompt version invalidates every entry
+    monkeypatch.setattr(resume_selector_main_class, "METADATA_PROMPT_VERSION", "next-version")
+    changed = selector_factory(cache_dir=cache_dir)
+    assert changed.process_resumes(str(resume_folder))
+    assert changed.mistral_client.calls == 5
+
+
+def test_metadata_cache_never_stores_fallback(selector_factory, tmp_path):
+    selector = selector_factory(cache_dir=str(tmp_path / "cache"))
+    selector.mistral_client.fail = True
+    assert selector.extract_metadata("Name: Alice Rao\nPython")["name"] == "Unknown"
+
+    selector.mistral_client.fail = False
+    assert selector.extract_metadata("Name: Alice Rao\nPython")["name"] == "Alice Rao"
+    assert selector.mistral_client.calls == 2
+    assert selector.get_cache_stats()["metadata"]["entries"] == 1
+
+
+def test_embedding_store_encodes_only_new_resumes(selector_factory, resume_folder, tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    cold = selector_factory(cache_dir=cache_dir)
+    assert cold.process_resumes(str(resume_folder))
+    assert cold.last_index_stats == {"reused": 0, "computed": 5}
+
+    write_pdf(resume_folder / "STU006_farah.pdf", ["Name: Farah Khan", "FPGA and Verilog hobbyist"])
+    warm = selector_factory(cache_dir=cache_dir)
+    assert warm.process_resumes(str(resume_folder))
+    assert warm.last_index_stats == {"reused": 5, "computed": 1}
+    assert warm.embedding_model.encode_calls == 1
+    assert warm.embedding_model.encoded_texts == 1
+
+    # Stored vectors must rank exactly like freshly computed ones
+    fresh = selector_factory()
+    assert fresh.process_resumes(str(resume_folder))
+    query = "Verilog FPGA design"
+    assert [c["file_name"] for c in warm.search_resumes(query, top_k=6)] == \
+        [c["file_name"] for c in fresh.search_resumes(query, top_k=6)]
+
+
+def test_embedding_store_round_trip(tmp_path):
+    store = EmbeddingStore(str(tmp_path), "BAAI/bge-base-en-v1.5", 4)
+    keys = [EmbeddingStore.make_key(text) for text in ("a", "b", "c")]
+    vectors = np.arange(12, dtype=np.float32).reshape(3, 4)
+
+    store.put_many(keys[:2], vectors[:2])
+    found, missing = store.get_many(keys)
+    assert missing == [2]
+    np.testing.assert_array_equal(found[:2], vectors[:2])
+
+    store.put_many(keys, vectors)
+    reopened = EmbeddingStore(str(tmp_path), "BAAI/bge-base-en-v1.5", 4)
+    found, missing = reopened.get_many(list(reversed(keys)))
+    assert missing == []
+    np.testing.assert_array_equal(found, vectors[::-1])
+    assert reopened.stats()["entries"] == 3
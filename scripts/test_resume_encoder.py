@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Tests for the ONNX Runtime encoder helpers and backend selection
+"""
+import numpy as np
+import pytest
+
+import resume_selector_main_class
+from conftest import FakeSentenceTransformer
+from resume_encoder import encode_parallel, length_sorted_batches, pool
+
+QUERY = "Robotics project using ROS and Embedded C"
+
+
+class FakeOnnxEncoder(FakeSentenceTransformer):
+    """Fake encoder with the OnnxSentenceEncoder surface: a window of 40 characters."""
+
+    window = 40
+
+    def __init__(self, model_name, export_dir=None, quantize=False, batch_size=32, **kwargs):
+        super().__init__(model_name)
+        self.quantize = quantize
+        self.batch_sizes = []
+
+    def truncate(self, texts):
+        return [text[:self.window] for text in texts]
+
+    def encode(self, texts, show_progress_bar=False, batch_size=32, **kwargs):
+        self.batch_sizes.append(batch_size)
+        return super().encode(texts, show_progress_bar, batch_size, **kwargs)
+
+
+def test_length_sorted_batches_cover_every_position_once():
+    lengths = np.array([5, 120, 7, 64, 512, 9, 30])
+    batches = length_sorted_batches(lengths, 3)
+
+    assert [len(b) for b in batches] == [3, 3, 1]
+    assert sorted(np.concatenate(batches).tolist()) == list(range(len(lengths)))
+    # Each batch is padded to its own longest text: far less than padding everything to 512
+    assert sum(len(b) * lengths[b].max() for b in batches) < len(lengths) * lengths.max() / 2
+
+
+def test_pooling_matches_sentence_transformers_modes():
+    hidden = np.arange(2 * 3 * 2, dtype=np.float32).reshape(2, 3, 2)
+    mask = np.array([[1, 1, 0], [1, 1, 1]])
+
+    assert np.array_equal(pool(hidden, mask, "cls"), hidden[:, 0])
+    assert np.allclose(pool(hidden, mask, "mean")[0], hidden[0, :2].mean(axis=0))
+    assert np.array_equal(pool(hidden, mask, "max")[0], hidden[0, 1])
+    with pytest.raises(ValueError):
+        pool(hidden, mask, "weightedmean")
+
+
+def test_onnx_backend_keeps_its_own_embedding_store(selector_factory, resume_folder, tmp_path, monkeypatch):
+    monkeypatch.setattr(resume_selector_main_class, "OnnxSentenceEncoder", FakeOnnxEncoder)
+    cache_dir = str(tmp_path / "cache")
+
+    torch_selector = selector_factory(cache_dir=cache_dir)
+    assert torch_selector.process_resumes(str(resume_folder))
+
+    selector = selector_factory(cache_dir=cache_dir, embedding_backend="onnx_int8", encode_batch_size=8)
+    assert selector.embedding_model.quantize
+    assert selector.embedding_model_id.endswith("@onnx_int8")
+    assert selector.process_resumes(str(resume_folder))
+    # Vectors of the torch backend are not reused for the quantized model
+    assert selector.last_index_stats == {"reused": 0, "computed": 5}
+    assert set(selector.embedding_model.batch_sizes) == {8}
+    assert selector.search_resumes(QUERY, top_k=1)
+
+    # Truncated texts are the cache keys, so the same backend reuses every vector
+    again = selector_factory(cache_dir=cache_dir, embedding_backend="onnx_int8")
+    assert again.process_resumes(str(resume_folder))
+    assert again.last_index_stats == {"reused": 5, "computed": 0}
+
+
+def test_unknown_embedding_backend_is_rejected(selector_factory):
+    with pytest.raises(ValueError):
+        selector_factory(embedding_backend="tensorrt")
+
+
+def test_encode_parallel_keeps_input_order():
+    model = FakeSentenceTransformer("fake-model")
+    texts = [f"Resume {i} with Python and skill{i % 7}" for i in range(50)]
+
+    sharded = encode_parallel(model, texts, workers=3, threads=1, batch_size=4)
+    assert sharded.dtype == np.float32
+    assert np.array_equal(sharded, np.asarray(model.encode(texts), dtype=np.float32))
+    assert encode_parallel(model, [], workers=2).shape == (0, model.dim)
+
+
+def test_bulk_build_matches_single_process(selector_factory, resume_folder, monkeypatch):
+    single = selector_factory()
+    assert single.process_resumes(str(resume_folder))
+
+    monkeypatch.setattr(resume_selector_main_class, "BULK_ENCODE_MIN_TEXTS", 2)
+    bulk = selector_factory(encode_workers=2, encode_threads=1)
+    assert bulk.process_resumes(str(resume_folder))
+
+    ranked = [[(r["file_name"], r["score"]) for r in s.search_resumes(QUERY, top_k=5)] for s in (single, bulk)]
+    assert ranked[0] == ranked[1]
+    with pytest.raises(ValueError):
+        selector_factory(embedding_backend="onnx", encode_workers=2)
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Tests for pipeline progress events
+"""
+import io
+import json
+
+from conftest import SAMPLE_RESUMES
+from resume_events import stream_events, write_ndjson
+from resume_selector_worker import ShortlistWorker, serve_stdio
+
+QUERY = "Robotics project using ROS and Embedded C"
+
+
+def test_stream_events_ends_with_done_or_error():
+    def run(emit):
+        emit({"event": "step", "n": 1})
+        return 42
+
+    events = list(stream_events(run))
+    assert [e["event"] for e in events] == ["step", "done"]
+    assert events[-1]["result"] == 42
+    assert all("elapsed" in e for e in events)
+
+    def fail(emit):
+        raise RuntimeError("boom")
+
+    events = list(stream_events(fail))
+    assert [(e["event"], e["error"]) for e in events] == [("error", "boom")]
+
+
+def test_shortlist_events_arrive_stage_by_stage(selector_factory, resume_folder):
+    selector = selector_factory(llm_concurrency=4)
+    events = list(selector.shortlist_events(str(resume_folder), QUERY, top_k=3))
+    names = [e["event"] for e in events]
+
+    assert names.count("extracted") == len(SAMPLE_RESUMES)
+    assert names.count("metadata") == len(SAMPLE_RESUMES)
+    assert names.count("summary") == 3
+    assert names[-1] == "done"
+    # Every stage finishes before the next begins; the ranking precedes the first summary
+    assert names.index("index_ready") > max(i for i, n in enumerate(names) if n == "metadata")
+    assert names.index("candidates") < names.index("summary")
+
+    ranking = events[names.index("candidates")]["candidates"]
+    assert ranking[0]["file_name"] == "STU003_chitra.pdf"
+    assert all("text" not in c for c in ranking)
+    summaries = {e["position"]: e for e in events if e["event"] == "summary"}
+    assert [summaries[i]["id"] for i in range(3)] == [c["id"] for c in ranking]
+    assert events[-1]["result"]["summaries"] == [summaries[i]["summary"] for i in range(3)]
+    assert selector.on_event is None
+
+    buffer = io.StringIO()
+    write_ndjson(events, buffer)
+    assert [json.loads(line)["event"] for line in buffer.getvalue().splitlines()] == names
+
+
+def test_shortlist_events_report_failure(selector_factory, tmp_path):
+    events = list(selector_factory().shortlist_events(str(tmp_path / "missing"), QUERY))
+    assert [e["event"] for e in events] == ["error"]
+
+
+def test_worker_streams_shortlist_events(selector_factory, resume_folder):
+    worker = ShortlistWorker(selector_factory())
+    request = {"id": 9, "cmd": "shortlist", "folder": str(resume_folder), "description": QUERY, "top_k": 2}
+    stdout = io.StringIO()
+    serve_stdio(worker, io.StringIO(json.dumps(request) + "\n"), stdout)
+
+    lines = [json.loads(line) for line in stdout.getvalue().splitlines()]
+    assert all(line["id"] == 9 for line in lines)
+    events, response = lines[:-1], lines[-1]
+    assert all("ok" not in e for e in events)
+    assert [e["event"] for e in events][-3:] == ["candidates", "summary", "summary"]
+    assert response["ok"]
+    result = response["result"]
+    assert [s["id"] for s in result["summaries"]] == [c["id"] for c in result["candidates"]]
+    assert {e["candidate_id"] for e in events if e["event"] == "summary"} == {c["id"] for c in result["candidates"]}
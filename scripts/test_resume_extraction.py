@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Tests for PDF extraction backends, budgets and multi-process extraction
+"""
+import os
+import time
+import multiprocessing
+
+import pytest
+
+import resume_extraction
+from conftest import SAMPLE_RESUMES, write_pages_pdf
+from resume_extraction import extract_pdf_text, extract_texts_parallel, register_backend
+from resume_selector_main_class import PDF_EXTRACT_SETTINGS
+
+requires_fork = pytest.mark.skipif(
+    multiprocessing.get_start_method() != "fork",
+    reason="patched extractor is only inherited by forked workers"
+)
+
+
+def test_parallel_extraction_matches_serial(selector_factory, resume_folder):
+    (resume_folder / "STU000_broken.pdf").write_bytes(b"%PDF-1.4 this is not really a pdf")
+
+    serial = selector_factory()
+    parallel = selector_factory(extraction_workers=3)
+    assert serial.process_resumes(str(resume_folder))
+    assert parallel.process_resumes(str(resume_folder))
+
+    assert parallel.file_paths == serial.file_paths
+    assert list(parallel.resumes) == list(serial.resumes)
+    assert parallel.get_resume_count() == 5
+
+
+@requires_fork
+def test_hung_and_crashing_files_are_isolated(resume_folder, monkeypatch):
+    real_extract = resume_extraction.extract_pdf_text
+
+    def flaky_extract(path, settings):
+        if "bala" in str(path):
+            time.sleep(60)
+        if "dev" in str(path):
+            os._exit(1)
+        return real_extract(path, settings)
+
+    monkeypatch.setattr(resume_extraction, "extract_pdf_text", flaky_extract)
+    paths = sorted(str(p) for p in resume_folder.glob("*.pdf"))
+
+    started = time.monotonic()
+    outcomes = extract_texts_parallel(paths, PDF_EXTRACT_SETTINGS, workers=2, timeout=1.0)
+    assert time.monotonic() - started < 10
+
+    by_name = {os.path.basename(path): outcome for path, outcome in zip(paths, outcomes)}
+    assert by_name["STU002_bala.pdf"] == (None, "timed out after 1s")
+    assert by_name["STU004_dev.pdf"] == (None, "worker process crashed")
+    assert by_name["STU001_alice.pdf"][0].startswith("Name: Alice Rao")
+    assert by_name["STU003_chitra.pdf"][0].startswith("Name: Chitra Nair")
+    assert by_name["STU005_esha.pdf"][0].startswith("Name: Esha Menon")
+
+
+@pytest.mark.parametrize("backend", ["pdfminer", "pdfium", "auto"])
+def test_fast_backends_match_pdfplumber(resume_folder, backend):
+    for path in sorted(resume_folder.glob("*.pdf")):
+        expected = extract_pdf_text(str(path), PDF_EXTRACT_SETTINGS)
+        assert extract_pdf_text(str(path), PDF_EXTRACT_SETTINGS, backend=backend) == expected
+        with open(path, "rb") as source:
+            assert extract_pdf_text(source, PDF_EXTRACT_SETTINGS, backend=backend) == expected
+
+    with pytest.raises(ValueError):
+        extract_pdf_text(str(path), PDF_EXTRACT_SETTINGS, backend="ocr")
+
+
+def test_budget_stops_parsing_early(tmp_path, monkeypatch):
+    pages = [[f"Page {number} of the resume", "Python and SQL projects"] for number in range(1, 11)]
+    path = str(write_pages_pdf(tmp_path / "long.pdf", pages))
+    read = []
+
+    def counting_pages(source, settings):
+        for page_text in resume_extraction._pdfplumber_pages(source, settings):
+            read.append(page_text)
+            yield page_text
+
+    monkeypatch.setattr(resume_extraction, "_BACKENDS", dict(resume_extraction._BACKENDS))
+    register_backend("counting", counting_pages)
+
+    full = extract_pdf_text(path, PDF_EXTRACT_SETTINGS, backend="counting")
+    assert len(read) == 10 and full.count("Page ") == 10
+
+    read.clear()
+    assert extract_pdf_text(path, PDF_EXTRACT_SETTINGS, backend="counting", max_pages=2) == full.split("\n\nPage 3")[0]
+    assert len(read) == 2
+
+    read.clear()
+    text = extract_pdf_text(path, PDF_EXTRACT_SETTINGS, backend="counting", max_chars=60)
+    assert text == full[:60]
+    assert len(read) == 2
+
+    with pytest.raises(ValueError):
+        register_backend("auto", counting_pages)
+
+
+@pytest.mark.parametrize("fast_text", ["", "\ufffd" * 80 + "Name"])
+def test_auto_falls_back_to_pdfplumber(resume_folder, monkeypatch, fast_text):
+    def unreadable_pages(source, settings):
+        # Leave a file object at its end, as a real backend would
+        if hasattr(source, "read"):
+            source.read()
+        yield fast_text
+
+    monkeypatch.setattr(resume_extraction, "_pdfium_pages", unreadable_pages)
+    path = resume_folder / "STU003_chitra.pdf"
+    expected = "\n".join(SAMPLE_RESUMES["STU003_chitra.pdf"])
+    assert extract_pdf_text(str(path), PDF_EXTRACT_SETTINGS, backend="auto") == expected
+    with open(path, "rb") as source:
+        assert extract_pdf_text(source, PDF_EXTRACT_SETTINGS, backend="auto") == expected
+
+
+def test_selector_extraction_budget_and_cache_key(selector_factory, resume_folder, tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    full = selector_factory(cache_dir=cache_dir)
+    budgeted = selector_factory(cache_dir=cache_dir, extraction_backend="auto", extraction_max_chars=15)
+    path = str(resume_folder / "STU001_alice.pdf")
+
+    assert full.extract_text_from_pdf(path).startswith("Name: Alice Rao\nSoftware")
+    # A different budget is a different cache entry, not a hit on the full text
+    assert budgeted.extract_text_from_pdf(path) == "Name: Alice Rao"
+    assert full._text_cache_key(path) != budgeted._text_cache_key(path)
+
+    parallel = selector_factory(extraction_workers=2, extraction_backend="pdfium", extraction_max_pages=1)
+    assert parallel.process_resumes(str(resume_folder))
+    assert parallel.get_resume_count() == 5
+
+    with pytest.raises(ValueError):
+        selector_factory(extraction_backend="ocr")
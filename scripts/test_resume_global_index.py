@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Tests for the global cross-project index
+"""
+import shutil
+
+import pytest
+
+from conftest import SAMPLE_RESUMES, write_pdf
+from resume_selector_worker import ShortlistWorker
+
+QUERY = "Robotics project using ROS and Embedded C"
+
+
+@pytest.fixture
+def project_folders(resume_folder, tmp_path):
+    """Two projects; Chitra and Dev applied to both, under different file names."""
+    other = tmp_path / "project-applications" / "proj456"
+    other.mkdir(parents=True)
+    shutil.copy(resume_folder / "STU003_chitra.pdf", other / "chitra_resume.pdf")
+    shutil.copy(resume_folder / "STU004_dev.pdf", other / "dev_resume.pdf")
+    write_pdf(other / "STU006_farah.pdf", ["Name: Farah Ali", "ROS navigation stack, Embedded C, 5 years"])
+    return resume_folder, other
+
+
+def test_shared_resumes_are_processed_once(selector_factory, project_folders):
+    first, second = project_folders
+    selector = selector_factory()
+
+    assert selector.sync_project("proj123", str(first))
+    assert selector.sync_project("proj456", str(second))
+    assert selector.last_sync_stats == {"added": 1, "removed": 0, "shared": 2, "rescanned": 1}
+    assert selector.get_resume_count() == 6
+    assert selector.mistral_client.calls == 6
+    assert selector.embedding_model.encoded_texts == 6
+
+    # Unchanged folders are not rescanned
+    assert selector.sync_project("proj123", str(first))
+    assert selector.last_sync_stats["rescanned"] == 0
+
+
+def test_search_is_restricted_to_project_applicants(selector_factory, project_folders):
+    first, second = project_folders
+    selector = selector_factory()
+    selector.sync_project("proj123", str(first))
+    selector.sync_project("proj456", str(second))
+
+    results = selector.search_resumes(QUERY, top_k=10, project_id="proj456")
+    assert sorted(r["file_name"] for r in results) == ["STU006_farah.pdf", "chitra_resume.pdf", "dev_resume.pdf"]
+    assert all(r["file_path"].startswith(str(second)) for r in results)
+
+    results = selector.search_resumes(QUERY, top_k=10, project_id="proj123")
+    assert sorted(r["file_name"] for r in results) == sorted(SAMPLE_RESUMES)
+    assert selector.search_resumes(QUERY, project_id="unknown") == []
+
+    # Filtering does not change the relative order of the project's candidates
+    unfiltered = [r["id"] for r in selector.search_resumes(QUERY, top_k=10)]
+    assert [r["id"] for r in results] == [fid for fid in unfiltered if fid in {r["id"] for r in results}]
+
+
+def test_replaced_resume_is_dropped_when_unreferenced(selector_factory, project_folders):
+    first, second = project_folders
+    selector = selector_factory()
+    selector.sync_project("proj123", str(first))
+    selector.sync_project("proj456", str(second))
+
+    # Dev's new resume replaces the old one in proj456 only; proj123 still references the old version
+    write_pdf(second / "dev_resume.pdf", ["Name: Dev Patel", "Backend developer, 5 years of Java, Docker and Kubernetes"])
+    selector.sync_project("proj456", str(second))
+    assert selector.last_sync_stats["added"] == 1
+    assert selector.get_resume_count() == 7
+
+    write_pdf(first / "STU004_dev.pdf", ["Name: Dev Patel", "Backend developer, 5 years of Java, Docker and Kubernetes"])
+    selector.sync_project("proj123", str(first))
+    assert selector.last_sync_stats == {"added": 0, "removed": 1, "shared": 5, "rescanned": 1}
+    assert selector.get_resume_count() == 6
+
+    assert selector.remove_project("proj456")
+    assert selector.get_resume_count() == 5
+
+
+def test_worker_global_mode_persists_across_restarts(selector_factory, project_folders, tmp_path):
+    first, second = project_folders
+    cache_dir = str(tmp_path / "cache")
+
+    worker = ShortlistWorker(selector_factory(cache_dir=cache_dir))
+    response = worker.handle_request({"cmd": "process", "folder": str(first), "project_id": "proj123"})
+    assert response["ok"] and response["result"]["resume_count"] == 5
+    response = worker.handle_request({"cmd": "process", "folder": str(second), "project_id": "proj456"})
+    assert response["result"]["sync"]["shared"] == 2
+    assert response["result"]["indexed_count"] == 6
+
+    search = worker.handle_request({"cmd": "search", "description": QUERY, "top_k": 3, "project_id": "proj456"})
+    assert search["ok"]
+    assert len(search["result"]["candidates"]) == 3
+    assert not worker.handle_request({"cmd": "search", "description": QUERY, "project_id": "nope"})["ok"]
+
+    restarted = ShortlistWorker(selector_factory(cache_dir=cache_dir))
+    response = restarted.handle_request({"cmd": "process", "folder": str(second), "project_id": "proj456"})
+    assert response["result"]["reused"] is True
+    assert restarted.selector.mistral_client.calls == 0
+    again = restarted.handle_request({"cmd": "search", "description": QUERY, "top_k": 3, "project_id": "proj456"})
+    assert again["result"]["candidates"] == search["result"]["candidates"]
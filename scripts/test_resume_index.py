@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Tests for the pluggable FAISS index factory
+"""
+import numpy as np
+import faiss
+import pytest
+
+from resume_index import (
+    SQ8_MIN_TRAINING_POINTS, index_params, index_type_of, make_index, min_training_points, remove_ids,
+    search_parameters, upgrade_index, vector_bytes,
+)
+
+DIM = 32
+QUERY = "Robotics project using ROS and Embedded C"
+
+
+def clustered_vectors(count, seed=0):
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(20, DIM))
+    vectors = (centers[rng.integers(0, 20, count)] + 0.3 * rng.normal(size=(count, DIM))).astype("float32")
+    faiss.normalize_L2(vectors)
+    return vectors
+
+
+def recall_at_10(index, exact, queries):
+    _, expected = exact.search(queries, 10)
+    _, found = index.search(queries, 10)
+    return np.mean([len(set(e) & set(f)) / 10 for e, f in zip(expected, found)])
+
+
+@pytest.mark.parametrize("index_type,options", [
+    ("sqfp16", {}),
+    ("sq8", {}),
+    ("ivf_flat", {}),
+    ("hnsw", {}),
+    ("ivf_pq", {"pq_nbits": 4, "pq_m": 8}),
+])
+def test_index_types_agree_with_exact_search(index_type, options):
+    vectors = clustered_vectors(3000)
+    ids = np.arange(3000, dtype="int64") * 2
+    exact = make_index("flat", DIM, vectors, ids)
+    index = make_index(index_type, DIM, vectors, ids, options)
+
+    assert index_type_of(index) == index_type
+    assert index.ntotal == 3000
+    # PQ codes are lossy; 4-bit codes on 32 dims only need to beat chance by a wide margin
+    assert recall_at_10(index, exact, vectors[:100]) > (0.2 if index_type == "ivf_pq" else 0.9)
+
+
+def test_small_corpora_stay_flat_until_they_can_be_trained():
+    vectors = clustered_vectors(2000)
+    needed = min_training_points("ivf_flat", 1000, index_params())
+    assert needed == 39 * 31
+
+    index = make_index("ivf_flat", DIM, vectors[:500], np.arange(500, dtype="int64"))
+    assert index_type_of(index) == "flat"
+    assert upgrade_index(index, "ivf_flat", DIM) is index
+
+    index.add_with_ids(vectors[500:], np.arange(500, 2000, dtype="int64"))
+    upgraded = upgrade_index(index, "ivf_flat", DIM)
+    assert index_type_of(upgraded) == "ivf_flat"
+    assert upgraded.ntotal == 2000
+    assert recall_at_10(upgraded, index, vectors[:50]) > 0.9
+
+
+def test_scalar_quantization_shrinks_stored_vectors(tmp_path):
+    vectors = clustered_vectors(SQ8_MIN_TRAINING_POINTS)
+    ids = np.arange(len(vectors), dtype="int64")
+    exact = make_index("flat", DIM, vectors, ids)
+    fp16 = make_index("sqfp16", DIM, vectors, ids)
+    sq8 = make_index("sq8", DIM, vectors, ids)
+
+    assert vector_bytes(fp16) * 2 == vector_bytes(exact) == vector_bytes(sq8) * 4
+
+    # Quantized codes are what gets persisted, and scores stay close to float32
+    path = str(tmp_path / "sq8.faiss")
+    faiss.write_index(sq8, path)
+    loaded = faiss.read_index(path, faiss.IO_FLAG_MMAP)
+    assert index_type_of(loaded) == "sq8"
+    expected, _ = exact.search(vectors[:20], 5)
+    scores, _ = loaded.search(vectors[:20], 5)
+    assert np.abs(scores - expected).max() < 0.02
+
+    # Too few vectors to learn SQ8 ranges from: stay flat until there are
+    small = make_index("sq8", DIM, vectors[:100], ids[:100])
+    assert index_type_of(small) == "flat"
+    small.add_with_ids(vectors[100:], ids[100:])
+    assert index_type_of(upgrade_index(small, "sq8", DIM)) == "sq8"
+
+
+def test_hnsw_cannot_remove_but_others_can():
+    vectors = clustered_vectors(100)
+    ids = np.arange(100, dtype="int64")
+    assert not remove_ids(make_index("hnsw", DIM, vectors, ids), ids[:1])
+
+    flat = make_index("flat", DIM, vectors, ids)
+    assert remove_ids(flat, ids[:1])
+    assert flat.ntotal == 99
+
+
+@pytest.mark.parametrize("index_type,options", [
+    ("ivf_flat", {"nprobe": 1}),
+    ("ivf_pq", {"nprobe": 1, "pq_nbits": 4, "pq_m": 8}),
+])
+def test_filtered_ivf_search_ranks_every_member(index_type, options):
+    vectors = clustered_vectors(3000)
+    ids = np.arange(3000, dtype="int64")
+    index = make_index(index_type, DIM, vectors, ids, options)
+    assert index_type_of(index) == index_type
+
+    # Members spread over the whole corpus, so most sit outside the query's closest list
+    members = ids[::60]
+    params = search_parameters(index, faiss.IDSelectorBatch(members))
+    _, found = index.search(vectors[:3], len(members), params=params)
+    for row in found:
+        assert sorted(row) == list(members)
+
+
+def test_selector_with_hnsw_skips_removed_resumes(selector_factory, resume_folder, tmp_path):
+    selector = selector_factory(index_type="hnsw")
+    assert selector.process_resumes(str(resume_folder))
+    assert index_type_of(selector.index) == "hnsw"
+
+    top = selector.search_resumes(QUERY, top_k=1)[0]
+    assert selector.remove_resume(top["id"])
+    results = selector.search_resumes(QUERY, top_k=5)
+    assert top["id"] not in [r["id"] for r in results]
+    assert len(results) == 4
+
+    bundle_dir = str(tmp_path / "bundle")
+    assert selector.save_bundle(bundle_dir)
+    assert not selector_factory().load_bundle(bundle_dir)  # built for a different index type
+    loaded = selector_factory(index_type="hnsw")
+    assert loaded.load_bundle(bundle_dir)
+    assert [r["id"] for r in loaded.search_resumes(QUERY, top_k=5)] == [r["id"] for r in results]
+
+
+def test_selector_with_sqfp16_ranks_like_float32(selector_factory, resume_folder):
+    exact = selector_factory()
+    quantized = selector_factory(index_type="sqfp16")
+    assert exact.process_resumes(str(resume_folder))
+    assert quantized.process_resumes(str(resume_folder))
+
+    stats = quantized.get_index_stats()
+    assert stats["layout"] == "sqfp16"
+    assert stats["vector_bytes"] * 2 == stats["float32_bytes"]
+    expected = exact.search_resumes(QUERY, top_k=5)
+    results = quantized.search_resumes(QUERY, top_k=5)
+    assert [r["file_name"] for r in results] == [r["file_name"] for r in expected]
+    assert np.allclose([r["score"] for r in results], [r["score"] for r in expected], atol=1e-3)
+
+
+def test_unknown_index_settings_are_rejected(selector_factory):
+    with pytest.raises(ValueError):
+        selector_factory(index_type="lsh")
+    with pytest.raises(ValueError):
+        selector_factory(index_options={"nprobes": 4})
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Tests for the BM25 keyword index and hybrid search
+"""
+import numpy as np
+import pytest
+
+import resume_selector_main_class
+from resume_lexical import BM25Index, tokenize
+from resume_selector_worker import ShortlistWorker
+
+QUERY = "Robotics project using ROS and Embedded C"
+
+
+def test_tokenize_keeps_language_names():
+    assert tokenize("C++, C# and Node.js with the .NET stack.") == ["c++", "c#", "node.js", ".net", "stack"]
+
+
+def test_bm25_prefers_rare_terms_and_listed_skills():
+    index = BM25Index()
+    index.set_row(0, "Python developer building Python services")
+    index.set_row(1, "Hardware engineer writing Verilog for FPGA boards")
+    index.set_row(2, "Python and SQL reporting", skills=["Verilog"])
+    index.set_row(4, "Python scripting")
+
+    rows, scores = index.search("verilog", top_k=5)
+    assert rows.tolist() == [2, 1]
+    assert np.all(np.diff(scores) <= 0)
+    assert index.search("python", top_k=1)[0].tolist() == [0]
+    assert index.search("haskell", top_k=5)[0].tolist() == []
+
+    # Restricting to rows and clearing a row both drop it from the results
+    assert index.search("verilog", top_k=5, rows=np.array([1, 4]))[0].tolist() == [1]
+    index.clear_row(2)
+    assert index.search("verilog", top_k=5)[0].tolist() == [1]
+    assert index.scores("verilog")[3] == 0.0
+
+
+def test_keyword_search_covers_the_whole_corpus(selector_factory, resume_folder):
+    selector = selector_factory()
+    assert selector.process_resumes(str(resume_folder))
+
+    hits = selector.keyword_search("Verilog", top_k=5)
+    assert [hit["file_name"] for hit in hits] == ["STU002_bala.pdf"]
+    assert hits[0]["score"] > 0
+
+    # Removing and updating resumes keeps the postings in step
+    selector.remove_resume(hits[0]["id"])
+    assert selector.keyword_search("Verilog") == []
+    docker_id = selector.keyword_search("Docker")[0]["id"]
+    selector.update_resume(docker_id, metadata={"skills": ["Verilog"]})
+    assert [hit["id"] for hit in selector.keyword_search("Verilog")] == [docker_id]
+
+
+def test_hybrid_search_fuses_dense_and_keyword_rankings(selector_factory, resume_folder):
+    selector = selector_factory(search_mode="hybrid")
+    assert selector.process_resumes(str(resume_folder))
+
+    dense = selector.search_resumes(QUERY, top_k=5, mode="dense")
+    hybrid = selector.search_resumes(QUERY, top_k=5)
+    assert hybrid[0]["file_name"] == "STU003_chitra.pdf"
+    assert hybrid[0]["keyword_score"] > 0
+    assert {c["id"] for c in hybrid} == {c["id"] for c in dense}
+    assert all(0 < c["score"] <= 1 for c in hybrid)
+    assert [c["score"] for c in hybrid] == sorted((c["score"] for c in hybrid), reverse=True)
+
+    with pytest.raises(ValueError):
+        selector.search_resumes(QUERY, mode="sparse")
+
+
+def test_hybrid_search_after_low_memory_bundle_load(selector_factory, resume_folder, tmp_path):
+    bundle_dir = str(tmp_path / "bundle")
+    builder = selector_factory()
+    assert builder.process_resumes(str(resume_folder))
+    assert builder.save_bundle(bundle_dir, str(resume_folder))
+
+    selector = selector_factory(low_memory=True)
+    assert selector.load_bundle(bundle_dir)
+    assert selector.search_resumes("Verilog FPGA design", top_k=1, mode="hybrid")[0]["file_name"] == "STU002_bala.pdf"
+
+    worker = ShortlistWorker(selector)
+    response = worker.handle_request({"id": 1, "cmd": "keyword_search", "query": "Docker", "top_k": 3})
+    assert response["ok"], response
+    assert [c["file_name"] for c in response["result"]["candidates"]] == ["STU004_dev.pdf"]
+
+
+def test_keyword_only_candidates_keep_their_dense_score(selector_factory, resume_folder, monkeypatch):
+    selector = selector_factory()
+    assert selector.process_resumes(str(resume_folder))
+    monkeypatch.setattr(resume_selector_main_class, "RRF_DEPTH", 2)
+
+    dense = {c["id"]: c["score"] for c in selector.search_resumes("Java Docker SQL", top_k=5, mode="dense")}
+    hybrid = selector.search_resumes("Java Docker SQL", top_k=5, mode="hybrid")
+    assert len(hybrid) > 2
+    for candidate in hybrid:
+        assert candidate["semantic_score"] == pytest.approx(dense[candidate["id"]])
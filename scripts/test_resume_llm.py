@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Tests for concurrent LLM metadata extraction
+"""
+import time
+import asyncio
+
+from conftest import SAMPLE_RESUMES, FakeMistral, fake_metadata_for
+from resume_llm import TokenBucket, complete_with_retries
+
+TEXTS = ["\n".join(lines) for lines in SAMPLE_RESUMES.values()] * 4
+
+
+def test_concurrent_metadata_keeps_input_order(selector_factory):
+    selector = selector_factory()
+    selector.mistral_client.delay = 0.05
+
+    started = time.monotonic()
+    results = selector.extract_metadata_many(TEXTS, concurrency=10)
+    elapsed = time.monotonic() - started
+
+    assert [r["name"] for r in results] == [fake_metadata_for(text)["name"] for text in TEXTS]
+    assert selector.mistral_client.max_in_flight == 10
+    # 20 requests of 50 ms each: serial would take 1 s
+    assert elapsed < 0.5
+
+
+def test_rate_limited_requests_are_retried(selector_factory):
+    selector = selector_factory()
+    selector.mistral_client.rate_limited = 3
+
+    results = selector.extract_metadata_many(TEXTS[:5], concurrency=5)
+    assert all(r["name"] != "Unknown" for r in results)
+    assert selector.mistral_client.calls == 8
+
+
+class CountingBucket(TokenBucket):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.acquired = 0
+
+    async def acquire(self) -> None:
+        self.acquired += 1
+        await super().acquire()
+
+
+def test_every_attempt_takes_a_token():
+    client = FakeMistral()
+    client.rate_limited = 2
+    bucket = CountingBucket(rate=1000)
+    messages = [{"role": "user", "content": TEXTS[0]}]
+
+    async def complete_twice():
+        await complete_with_retries(client, base_delay=0.001, rate_limiter=bucket, model="m", messages=messages)
+        assert client.calls == 3
+        assert bucket.acquired == 3
+
+        await complete_with_retries(client, rate_limiter=bucket, first_token_taken=True, model="m", messages=messages)
+        assert bucket.acquired == 3
+
+    asyncio.run(complete_twice())
+
+
+def test_cached_metadata_is_not_rate_limited(selector_factory, tmp_path):
+    selector = selector_factory(cache_dir=str(tmp_path), llm_requests_per_second=2)
+    texts = TEXTS[:5]
+    cold = selector.extract_metadata_many(texts, concurrency=5)
+    calls = selector.mistral_client.calls
+
+    # 20 cache hits at 2 requests/s would take about 10 s if each took a token
+    started = time.monotonic()
+    warm = selector.extract_metadata_many(texts * 4, concurrency=5)
+    assert time.monotonic() - started < 0.5
+    assert selector.mistral_client.calls == calls
+    assert warm == cold * 4
+
+
+def test_async_batches_reuse_one_event_loop(selector_factory):
+    # The client is bound to the loop of its first request, like mistralai's pooled AsyncClient
+    selector = selector_factory()
+    first = selector.extract_metadata_many(TEXTS[:5], concurrency=8)
+    second = selector.extract_metadata_many(TEXTS[5:10], concurrency=8)
+    assert all(r["name"] != "Unknown" for r in first + second)
+    assert selector.mistral_client.calls == 10
+
+
+def test_failures_fall_back_without_caching(selector_factory, tmp_path):
+    selector = selector_factory(cache_dir=str(tmp_path))
+    selector.mistral_client.fail = True
+    assert {r["name"] for r in selector.extract_metadata_many(TEXTS[:5], concurrency=5)} == {"Unknown"}
+    assert selector.get_cache_stats()["metadata"]["entries"] == 0
+
+
+def test_process_resumes_with_llm_concurrency(selector_factory, resume_folder):
+    serial = selector_factory()
+    concurrent = selector_factory(llm_concurrency=4)
+    assert serial.process_resumes(str(resume_folder))
+    assert concurrent.process_resumes(str(resume_folder))
+
+    assert [concurrent.resume_metadata[fid]["metadata"] for fid in concurrent.file_ids] == \
+        [serial.resume_metadata[fid]["metadata"] for fid in serial.file_ids]
+
+
+def test_token_bucket_limits_rate():
+    async def acquire_all():
+        bucket = TokenBucket(rate=20, capacity=1)
+        started = time.monotonic()
+        for _ in range(6):
+            await bucket.acquire()
+        return time.monotonic() - started
+
+    assert asyncio.run(acquire_all()) >= 0.2
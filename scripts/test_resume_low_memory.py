@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Tests for low-memory mode and the disk-backed text list
+"""
+import resume_texts
+from resume_texts import DiskTextList
+
+QUERY = "Robotics project using ROS and Embedded C"
+
+
+def test_disk_text_list_behaves_like_a_list(tmp_path):
+    texts = DiskTextList(str(tmp_path))
+    texts.extend(["alpha", "", "ünïcödé"])
+    texts[0] = "beta"
+    del texts[1]
+    texts.append("gamma")
+
+    assert list(texts) == ["beta", "ünïcödé", "gamma"]
+    assert texts.excerpt(1, 3) == "ünï"
+    assert texts.excerpt(0, 100) == "beta"
+    assert texts.nbytes() == len("betaünïcödégamma".encode("utf-8"))
+
+    texts.clear()
+    assert len(texts) == 0
+
+
+def test_disk_text_list_compacts_replaced_texts(tmp_path, monkeypatch):
+    monkeypatch.setattr(resume_texts, "COMPACT_MIN_GARBAGE_BYTES", 10)
+    texts = DiskTextList(str(tmp_path))
+    texts.extend(["a" * 10, "b" * 10])
+    for i in range(5):
+        texts[0] = str(i) * 10
+
+    assert texts._spill.size <= 40
+    assert list(texts) == ["4" * 10, "b" * 10]
+
+
+def test_low_memory_results_reference_text_by_id(selector_factory, resume_folder):
+    normal = selector_factory()
+    low = selector_factory(low_memory=True)
+    assert normal.process_resumes(str(resume_folder))
+    assert low.process_resumes(str(resume_folder))
+
+    assert isinstance(low.resumes, DiskTextList)
+    assert all("text" not in entry for entry in low.resume_metadata.values())
+
+    expected = normal.search_resumes(QUERY, top_k=5)
+    results = low.search_resumes(QUERY, top_k=5)
+    assert [r["file_name"] for r in results] == [r["file_name"] for r in expected]
+    assert [r["score"] for r in results] == [r["score"] for r in expected]
+    for result, full in zip(results, expected):
+        assert "text" not in result
+        assert full["text"].startswith(result["excerpt"])
+        assert low.get_resume_text(result["id"]) == full["text"]
+
+
+def test_low_memory_summaries_load_the_excerpt(selector_factory, resume_folder, tmp_path):
+    normal = selector_factory(cache_dir=str(tmp_path / "cache"))
+    low = selector_factory(cache_dir=str(tmp_path / "cache"), low_memory=True)
+    assert normal.process_resumes(str(resume_folder))
+    assert low.process_resumes(str(resume_folder))
+
+    expected = normal.search_resumes(QUERY, top_k=2)
+    candidates = low.search_resumes(QUERY, top_k=2)
+    assert [low._summary_prompt(QUERY, c)[0] for c in candidates] == \
+        [normal._summary_prompt(QUERY, c)[0] for c in expected]
+
+    # Both modes share summary cache entries
+    normal.summarize_candidates(QUERY, expected)
+    calls = low.mistral_client.calls
+    low.summarize_candidates(QUERY, candidates)
+    assert low.mistral_client.calls == calls
+
+
+def test_low_memory_bundle_round_trip(selector_factory, resume_folder, tmp_path):
+    bundle = str(tmp_path / "bundle")
+    selector = selector_factory(low_memory=True)
+    assert selector.load_or_process(str(resume_folder), bundle)
+    texts = [selector.get_resume_text(file_id) for file_id in selector.file_ids]
+
+    warm = selector_factory(low_memory=True)
+    assert warm.load_bundle(bundle, str(resume_folder))
+    assert isinstance(warm.resumes, DiskTextList)
+    assert [warm.get_resume_text(file_id) for file_id in warm.file_ids] == texts
+
+    file_id = warm.file_ids[0]
+    assert warm.update_resume(file_id, str(resume_folder / "STU002_bala.pdf"))
+    assert "Bala Krishnan" in warm.get_resume_text(file_id)
+    assert warm.remove_resume(warm.file_ids[1])
+    assert warm.search_resumes(QUERY, top_k=10)
@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Tests for the Aho-Corasick term matcher
+"""
+import random
+
+from resume_matcher import TermMatcher
+
+
+def test_matches_every_overlapping_term():
+    matcher = TermMatcher()
+    ids = {term: matcher.add(term) for term in ["c", "embedded c", "ros", "robotics", "java", "javascript"]}
+    assert matcher.add("ros") == ids["ros"] and len(matcher) == 6
+
+    found = matcher.match("robotics project using ros and embedded c")
+    assert found == {ids["c"], ids["embedded c"], ids["ros"], ids["robotics"]}
+    assert matcher.match("javascript") == {ids["c"], ids["java"], ids["javascript"]}
+    assert matcher.match("") == set()
+
+
+def test_agrees_with_substring_checks_while_growing():
+    rng = random.Random(7)
+    matcher = TermMatcher()
+    terms = []
+    for _ in range(400):
+        term = "".join(rng.choice("ab c") for _ in range(rng.randint(0, 5)))
+        terms.append(term)
+        matcher.add(term)
+        text = "".join(rng.choice("abc d") for _ in range(rng.randint(0, 30)))
+        assert matcher.match(text) == {matcher.get(t) for t in set(terms) if t in text}
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Tests for the pre-forked worker pool
+"""
+import gc
+import os
+import json
+import time
+import signal
+import socket
+import tempfile
+
+from resume_selector_worker import ShortlistWorker, process_memory, serve_prefork
+
+QUERY = "Robotics project using ROS and Embedded C"
+
+
+def _children(pid: int):
+    with open(f"/proc/{pid}/task/{pid}/children") as f:
+        return [int(child) for child in f.read().split()]
+
+
+def _wait_for(condition, timeout: float = 20.0):
+    deadline = time.time() + timeout
+    while not condition():
+        assert time.time() < deadline, "timed out"
+        time.sleep(0.05)
+
+
+def _request(socket_path: str, request):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(socket_path)
+        client.sendall((json.dumps(request) + "\n").encode("utf-8"))
+        reader = client.makefile("r", encoding="utf-8")
+        return json.loads(reader.readline())
+
+
+def test_prefork_workers_share_the_preloaded_index(selector_factory, resume_folder, tmp_path):
+    selector = selector_factory(cache_dir=str(tmp_path / "cache"))
+    worker = ShortlistWorker(selector)
+    worker.cmd_process({"folder": str(resume_folder)})
+    socket_path = os.path.join(tempfile.mkdtemp(), "worker.sock")
+
+    server = os.fork()
+    if server == 0:
+        status = 1
+        try:
+            serve_prefork(worker, socket_path, workers=2, threads_per_worker=1)
+            status = 0
+        finally:
+            os._exit(status)
+
+    try:
+        _wait_for(lambda: os.path.exists(socket_path) and len(_children(server)) == 2)
+        response = _request(socket_path, {"id": 1, "cmd": "search", "description": QUERY, "top_k": 1})
+        assert response["ok"]
+        assert response["result"]["candidates"][0]["file_name"] == "STU003_chitra.pdf"
+
+        health = _request(socket_path, {"id": 2, "cmd": "health"})["result"]
+        assert health["pid"] in _children(server)
+        assert health["model_loaded"] and health["ready"]
+        assert health["memory"]["pss_bytes"] <= health["memory"]["rss_bytes"]
+
+        # A worker that dies is replaced
+        victim = _children(server)[0]
+        os.kill(victim, signal.SIGKILL)
+        _wait_for(lambda: victim not in _children(server) and len(_children(server)) == 2)
+        assert _request(socket_path, {"id": 3, "cmd": "health"})["ok"]
+    finally:
+        os.kill(server, signal.SIGTERM)
+        _, status = os.waitpid(server, 0)
+
+    assert os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0
+    assert not os.path.exists(socket_path)
+
+
+def test_after_fork_reopens_caches(selector_factory, resume_folder, tmp_path):
+    selector = selector_factory(cache_dir=str(tmp_path / "cache"), low_memory=True)
+    assert selector.process_resumes(str(resume_folder))
+    text = selector.resumes[0]
+
+    selector.prepare_fork()
+    assert selector.text_cache is None and selector._embedding_store is None
+    selector.after_fork()
+    assert selector.metadata_cache.stats()["entries"] == 5
+    assert selector.embedding_store.stats()["entries"] == 5
+
+    # Existing texts stay readable after the spill file is replaced
+    selector.resumes.append("new text")
+    assert selector.resumes[0] == text and selector.resumes[-1] == "new text"
+    assert process_memory()["rss_bytes"] > 0
+    gc.unfreeze()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Tests for the normalized resume record store
+"""
+from resume_records import ResumeRecord, ResumeRecordStore
+
+
+def make_record(file_id, skills=("Python",)):
+    return ResumeRecord(file_id, f"{file_id}.pdf", f"/resumes/{file_id}.pdf", {
+        "name": file_id,
+        "skills": ", ".join(skills),
+        "experience_years": "several",
+        "education": [{"degree": "Master of Technology"}],
+        "job_titles": [{"title": "Software Intern"}],
+    })
+
+
+def test_records_are_normalized_once():
+    record = make_record("a", skills=("Python", "SQL"))
+    assert record.skills == ("Python", "SQL")
+    assert record.skills_lower == ("python", "sql")
+    assert record.experience_years == 0
+    assert record.education_lower == ("master of technology",)
+    assert record.job_titles == ("Software Intern",)
+
+
+def test_store_lookups_and_row_reuse():
+    store = ResumeRecordStore()
+    rows = [store.add(make_record(file_id)) for file_id in ("a", "b", "c")]
+    assert rows == [0, 1, 2]
+    assert store.file_id_for_path("/resumes/b.pdf") == "b"
+
+    assert store.remove("b")
+    assert not store.remove("b")
+    assert store.file_id_for_path("/resumes/b.pdf") is None
+    assert store.add(make_record("d")) == 1
+    assert store.get("d").file_name == "d.pdf"
+    assert len(store) == 3
+
+    # Replacing a record keeps its row and moves its path
+    moved = ResumeRecord("a", "a.pdf", "/elsewhere/a.pdf", {"name": "a"})
+    assert store.add(moved) == 0
+    assert store.file_id_for_path("/resumes/a.pdf") is None
+    assert store.file_id_for_path("/elsewhere/a.pdf") == "a"
+
+
+def test_reserved_rows_load_on_first_access():
+    loaded = []
+
+    def loader(file_id):
+        loaded.append(file_id)
+        return make_record(file_id)
+
+    store = ResumeRecordStore(loader=loader)
+    store.reserve("a", "/resumes/a.pdf")
+    store.reserve("b", "/resumes/b.pdf")
+    assert store.file_id_for_path("/resumes/b.pdf") == "b"
+    assert loaded == []
+
+    assert store.get("b").skills == ("Python",)
+    store.get("b")
+    assert loaded == ["b"]
+
+
+def test_search_uses_o1_path_lookup(selector_factory, resume_folder):
+    selector = selector_factory()
+    assert selector.process_resumes(str(resume_folder))
+    for file_id, path in zip(selector.file_ids, selector.file_paths):
+        assert selector._get_file_id_by_path(path) == file_id
+        assert selector.records.get(file_id).name == selector.resume_metadata[file_id]["metadata"]["name"]
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Tests for vectorized metadata reranking
+"""
+import numpy as np
+import pytest
+
+from resume_records import ResumeRecord
+from resume_rerank import MetadataReranker
+
+DESCRIPTIONS = [
+    "Robotics project using ROS and Embedded C",
+    "Senior Verilog engineer for FPGA work, Master degree preferred",
+    "Junior Software Intern for a React and SQL dashboard",
+    "PhD researcher in Machine Learning with Python",
+]
+
+METADATA = [
+    {"skills": ["Python", "SQL", "python"], "experience_years": 2, "education": ["Master of Technology"],
+     "job_titles": ["Software Intern"]},
+    {"skills": "Verilog; FPGA | Embedded C", "experience_years": 7, "education": [{"degree": "PhD and Master"}],
+     "job_titles": [{"title": "Hardware Engineer"}]},
+    {"skills": [{"skill": "ROS"}, {"name": "Embedded C"}], "experience_years": "n/a", "education": []},
+    {},
+]
+
+
+@pytest.mark.parametrize("description", DESCRIPTIONS)
+def test_vectorized_scores_match_scalar_scores(selector_factory, description):
+    selector = selector_factory()
+    reranker = MetadataReranker()
+    for row, metadata in enumerate(METADATA):
+        reranker.set_row(row, ResumeRecord(str(row), "", "", metadata))
+
+    expected = [selector.calculate_metadata_similarity(description, metadata) for metadata in METADATA]
+    np.testing.assert_allclose(reranker.score(description), expected)
+    np.testing.assert_allclose(reranker.score(description, np.array([3, 1])), [expected[3], expected[1]])
+
+    reranker.clear_row(1)
+    assert reranker.score(description)[1] == 0
+
+
+def test_search_reranks_the_whole_corpus(selector_factory, resume_folder):
+    selector = selector_factory()
+    assert selector.process_resumes(str(resume_folder))
+
+    description = "Senior Java and Docker backend developer"
+    results = selector.search_resumes(description, top_k=5)
+    assert len(results) == 5
+
+    expected = {}
+    query = f"Project Requirements:\n{description}\nLooking for relevant candidates."
+    embedding = selector.embedding_model.encode([query]).astype("float32")
+    embedding /= np.linalg.norm(embedding)
+    vectors = np.stack([selector.index.reconstruct(selector._index_ids[fid]) for fid in selector.file_ids])
+    for file_id, semantic in zip(selector.file_ids, vectors @ embedding[0]):
+        metadata = selector.resume_metadata[file_id]["metadata"]
+        expected[file_id] = semantic * 0.6 + selector.calculate_metadata_similarity(description, metadata) * 0.4
+
+    assert [r["id"] for r in results] == sorted(expected, key=expected.get, reverse=True)
+    assert [r["score"] for r in results] == pytest.approx(sorted(expected.values(), reverse=True), abs=1e-5)
+
+
+def test_partial_dense_ranking_matches_full_sort(selector_factory, resume_folder):
+    selector = selector_factory()
+    assert selector.process_resumes(str(resume_folder))
+    index_ids = np.array([selector._index_ids[fid] for fid in selector.file_ids], dtype=np.int64)
+    # Heavy ties: the partial ranking must break them in FAISS order, like a stable full sort
+    scores = np.array([0.5, 0.9, 0.5, 0.9, 0.5], dtype=np.float32)
+    metadata_scores = np.zeros(len(index_ids), dtype=np.float32)
+
+    full_ids, full_scores = selector._dense_ranking(scores, index_ids, metadata_scores)
+    for depth in range(len(index_ids) + 2):
+        ids, top_scores = selector._dense_ranking(scores, index_ids, metadata_scores, depth)
+        assert ids == full_ids[:depth]
+        assert top_scores.tolist() == full_scores[:depth].tolist()
+
+
+def test_reranker_follows_incremental_updates(selector_factory, resume_folder):
+    selector = selector_factory()
+    assert selector.process_resumes(str(resume_folder))
+    description = "Senior engineer with Kubernetes"
+    selector.search_resumes(description, top_k=5)
+
+    dev_id = next(fid for fid in selector.file_ids if selector.resume_metadata[fid]["file_name"] == "STU004_dev.pdf")
+    assert selector.update_resume(dev_id, metadata={"skills": ["Kubernetes"], "experience_years": 9})
+    assert selector.search_resumes(description, top_k=1)[0]["id"] == dev_id
+
+    assert selector.remove_resume(dev_id)
+    assert dev_id not in [r["id"] for r in selector.search_resumes(description, top_k=5)]
+    assert len(selector.search_resumes(description, top_k=5)) == 4
+
+
+def test_batch_search_matches_single_queries(selector_factory, resume_folder):
+    selector = selector_factory()
+    assert selector.process_resumes(str(resume_folder))
+    descriptions = DESCRIPTIONS + ["Senior Java and Docker backend developer"]
+
+    encode_calls = selector.embedding_model.encode_calls
+    batched = selector.search_resumes_many(descriptions, top_k=3)
+    assert selector.embedding_model.encode_calls == encode_calls + 1
+
+    assert batched == [selector.search_resumes(description, top_k=3) for description in descriptions]
+    assert selector.search_resumes_many([], top_k=3) == []
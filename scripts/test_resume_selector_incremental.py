@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Tests for incremental add/remove/update on ResumeSelector
+"""
+import shutil
+
+import pytest
+
+from conftest import write_pdf
+from resume_selector_main_class import SEARCH_MODES
+
+QUERIES = [
+    "Robotics project using ROS and Python",
+    "Senior FPGA engineer with Verilog, Master degree preferred",
+    "Junior web developer: React, Django, SQL",
+    "Machine Learning research intern",
+]
+
+
+def ranking(selector, query, top_k=5):
+    return [(c["file_name"], c["score"]) for c in selector.search_resumes(query, top_k=top_k)]
+
+
+def assert_same_rankings(incremental, rebuilt):
+    for query in QUERIES:
+        got = ranking(incremental, query)
+        expected = ranking(rebuilt, query)
+        assert [name for name, _ in got] == [name for name, _ in expected], query
+        assert [score for _, score in got] == pytest.approx([score for _, score in expected], abs=1e-6), query
+
+
+def test_incremental_updates_match_full_rebuild(selector_factory, resume_folder, tmp_path):
+    staging = tmp_path / "staging"
+    staging.mkdir()
+    shutil.move(str(resume_folder / "STU005_esha.pdf"), staging / "STU005_esha.pdf")
+
+    incremental = selector_factory()
+    assert incremental.process_resumes(str(resume_folder))
+    assert incremental.get_resume_count() == 4
+    ids = {entry["file_name"]: file_id for file_id, entry in incremental.resume_metadata.items()}
+
+    # New application arrives
+    shutil.move(str(staging / "STU005_esha.pdf"), resume_folder / "STU005_esha.pdf")
+    esha_id = incremental.add_resume(str(resume_folder / "STU005_esha.pdf"))
+    assert esha_id is not None
+
+    # Application withdrawn
+    (resume_folder / "STU004_dev.pdf").unlink()
+    assert incremental.remove_resume(ids["STU004_dev.pdf"])
+    assert not incremental.remove_resume(ids["STU004_dev.pdf"])
+
+    # Resume re-uploaded with new content
+    write_pdf(resume_folder / "STU001_alice.pdf", ["Name: Alice Rao", "Now 3 years of ROS and Embedded C robotics"])
+    assert incremental.update_resume(ids["STU001_alice.pdf"], str(resume_folder / "STU001_alice.pdf"))
+
+    llm_calls = incremental.mistral_client.calls
+    assert incremental.get_resume_count() == 4
+    assert incremental.index.ntotal == 4
+    assert llm_calls == 4 + 1 + 1  # initial batch, one add, one update
+
+    rebuilt = selector_factory()
+    assert rebuilt.process_resumes(str(resume_folder))
+    assert_same_rankings(incremental, rebuilt)
+
+
+def test_update_metadata_only_reindexes_in_place(selector_factory, resume_folder):
+    selector = selector_factory()
+    assert selector.process_resumes(str(resume_folder))
+    dev_id = next(fid for fid, entry in selector.resume_metadata.items() if entry["file_name"] == "STU004_dev.pdf")
+
+    assert selector.update_resume(dev_id, metadata={"skills": ["ROS", "Verilog", "FPGA"]})
+    assert selector.get_resume_metadata(dev_id)["metadata"]["name"] == "Dev Patel"
+    assert selector.get_resume_metadata(dev_id)["metadata"]["skills"] == ["ROS", "Verilog", "FPGA"]
+    assert selector.index.ntotal == 5
+    assert not selector.update_resume("missing", metadata={"name": "Nobody"})
+
+
+def test_search_after_removing_every_resume(selector_factory, resume_folder):
+    selector = selector_factory()
+    assert selector.process_resumes(str(resume_folder))
+    for file_id in list(selector.resume_metadata):
+        assert selector.remove_resume(file_id)
+    assert selector.index.ntotal == 0
+
+    for mode in SEARCH_MODES:
+        assert selector.search_resumes("ROS navigation", top_k=3, mode=mode) == []
+        assert selector.search_resumes_many(["ROS navigation", "Verilog"], top_k=3, mode=mode) == [[], []]
+
+
+def test_add_resume_from_bytes(selector_factory, resume_folder, tmp_path):
+    selector = selector_factory()
+    pdf_bytes = write_pdf(tmp_path / "upload.pdf", ["Name: Gita Rao", "ROS navigation and Verilog"]).read_bytes()
+
+    file_id = selector.add_resume(pdf_bytes, file_name="STU007_gita.pdf")
+    assert selector.is_ready()
+    results = selector.search_resumes("ROS navigation", top_k=1)
+    assert results[0]["id"] == file_id
+    assert results[0]["file_name"] == "STU007_gita.pdf"
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Tests for the long-lived JSON-lines shortlisting worker
+"""
+import io
+import json
+
+from resume_selector_worker import ShortlistWorker, serve_stdio
+
+
+def test_worker_protocol_round_trip(selector_factory, resume_folder):
+    selector = selector_factory()
+    worker = ShortlistWorker(selector)
+
+    requests = [
+        {"id": 1, "cmd": "health"},
+        {"id": 2, "cmd": "process", "folder": str(resume_folder)},
+        {"id": 3, "cmd": "search", "description": "Robotics project using ROS", "top_k": 2},
+    ]
+    stdin = io.StringIO("\n".join(json.dumps(r) for r in requests) + "\n\n")
+    stdout = io.StringIO()
+    serve_stdio(worker, stdin, stdout)
+
+    responses = [json.loads(line) for line in stdout.getvalue().splitlines()]
+    assert [r["id"] for r in responses] == [1, 2, 3]
+    assert all(r["ok"] for r in responses)
+    assert responses[0]["result"]["ready"] is False
+    assert responses[1]["result"]["resume_count"] == 5
+
+    candidates = responses[2]["result"]["candidates"]
+    assert len(candidates) == 2
+    assert candidates[0]["file_name"] == "STU003_chitra.pdf"
+    assert "text" not in candidates[0]
+
+    summary = worker.handle_request({
+        "id": 4,
+        "cmd": "summarize",
+        "description": "Robotics project using ROS",
+        "candidates": [{"id": c["id"], "score": c["score"]} for c in candidates],
+    })
+    assert summary["ok"]
+    assert [s["id"] for s in summary["result"]["summaries"]] == [c["id"] for c in candidates]
+
+
+def test_worker_reuses_unchanged_folder(selector_factory, resume_folder):
+    worker = ShortlistWorker(selector_factory())
+
+    first = worker.handle_request({"cmd": "process", "folder": str(resume_folder)})
+    second = worker.handle_request({"cmd": "process", "folder": str(resume_folder)})
+    assert first["result"]["reused"] is False
+    assert second["result"]["reused"] is True
+
+    (resume_folder / "STU005_esha.pdf").unlink()
+    third = worker.handle_request({"cmd": "process", "folder": str(resume_folder)})
+    assert third["result"]["reused"] is False
+    assert third["result"]["resume_count"] == 4
+
+
+def test_worker_reports_errors(selector_factory):
+    worker = ShortlistWorker(selector_factory())
+
+    assert worker.handle_line("not json")["ok"] is False
+    assert worker.handle_request({"id": 7, "cmd": "nope"}) == {"id": 7, "ok": False, "error": "Unknown command: nope"}
+
+    response = worker.handle_request({"id": 8, "cmd": "search", "description": "anything"})
+    assert response["ok"] is False
+    assert "process" in response["error"]
+
+
+def test_worker_search_many(selector_factory, resume_folder):
+    worker = ShortlistWorker(selector_factory())
+    worker.handle_request({"cmd": "process", "folder": str(resume_folder)})
+
+    descriptions = ["Robotics project using ROS", "FPGA design in Verilog"]
+    response = worker.handle_request({"cmd": "search_many", "descriptions": descriptions, "top_k": 2})
+    assert response["ok"]
+    results = response["result"]["results"]
+    assert [r["candidates"][0]["file_name"] for r in results] == ["STU003_chitra.pdf", "STU002_bala.pdf"]
+    assert all("text" not in c for r in results for c in r["candidates"])
+
+    assert not worker.handle_request({"cmd": "search_many", "descriptions": []})["ok"]
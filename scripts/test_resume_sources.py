@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Tests for ingesting resumes from memory and database cursors
+"""
+import io
+import sqlite3
+
+import pytest
+
+from conftest import SAMPLE_RESUMES
+from resume_sources import BufferReader, iter_cursor_rows, pdf_buffer
+
+QUERY = "Robotics project using ROS and Embedded C"
+
+
+class CountingCursor:
+    """Cursor wrapper recording the size of every fetchmany() call."""
+
+    def __init__(self, cursor):
+        self.cursor = cursor
+        self.fetches = []
+
+    def fetchmany(self, size):
+        rows = self.cursor.fetchmany(size)
+        self.fetches.append(len(rows))
+        return rows
+
+
+@pytest.fixture
+def applications_db(resume_folder):
+    """An OpportunityApplication stand-in with the sample resumes as blobs; Dev applied twice to opp1."""
+    db = sqlite3.connect(":memory:")
+    db.execute("CREATE TABLE applications (id TEXT, opportunity_id TEXT, resume_data BLOB)")
+    blobs = {name: (resume_folder / name).read_bytes() for name in SAMPLE_RESUMES}
+    rows = [(f"app{i}", "opp1", blob) for i, blob in enumerate(blobs.values())]
+    rows.append(("app9", "opp1", blobs["STU004_dev.pdf"]))
+    rows.append(("app10", "opp1", b"%PDF-1.4 this is not really a pdf"))
+    rows.append(("app11", "opp2", blobs["STU003_chitra.pdf"]))
+    rows.append(("app12", "opp2", None))
+    db.executemany("INSERT INTO applications VALUES (?, ?, ?)", rows)
+    yield db
+    db.close()
+
+
+def applicants(db, opportunity_id):
+    return db.execute(
+        "SELECT id, resume_data FROM applications WHERE opportunity_id = ? AND resume_data IS NOT NULL ORDER BY rowid",
+        (opportunity_id,)
+    )
+
+
+def test_buffers_are_read_without_copies():
+    data = b"%PDF-1.4 0123456789"
+    assert pdf_buffer(data).obj is data
+    assert pdf_buffer(memoryview(data)[2:]).tobytes() == data[2:]
+    assert pdf_buffer(io.BytesIO(data)).tobytes() == data
+    with pytest.raises(TypeError):
+        pdf_buffer("not bytes")
+
+    reader = BufferReader(pdf_buffer(data))
+    assert reader.read(4) == b"%PDF"
+    reader.seek(-3, io.SEEK_END)
+    assert reader.read() == b"789"
+    assert reader.read(5) == b""
+    reader.seek(2)
+    assert reader.tell() == 2 and reader.read(3) == b"DF-"
+
+
+def test_cursor_rows_are_fetched_in_batches(applications_db):
+    cursor = CountingCursor(applicants(applications_db, "opp1"))
+    assert [row[0] for row in iter_cursor_rows(cursor, 3)] == [f"app{i}" for i in range(5)] + ["app9", "app10"]
+    assert cursor.fetches == [3, 3, 1, 0]
+
+
+def test_ingest_cursor_builds_project_from_blobs(selector_factory, applications_db):
+    selector = selector_factory()
+    cursor = CountingCursor(applicants(applications_db, "opp1"))
+
+    ids = selector.ingest_cursor(cursor, project_id="opp1", batch_size=2)
+    assert len(ids) == 5
+    assert cursor.fetches == [2, 2, 2, 1, 0]
+    assert selector.last_sync_stats == {"added": 5, "removed": 0, "shared": 0, "rescanned": 1}
+    # The duplicate blob is extracted and analysed once; the broken one is skipped
+    assert selector.mistral_client.calls == 5
+    assert selector.embedding_model.encoded_texts == 5
+
+    results = selector.search_resumes(QUERY, top_k=3, project_id="opp1")
+    assert results[0]["file_name"] == "app2"
+
+    # Chitra is shared with opp2; nothing is extracted again
+    assert selector.ingest_cursor(applicants(applications_db, "opp2"), project_id="opp2") == [ids[2]]
+    assert selector.last_sync_stats["shared"] == 1
+    assert selector.mistral_client.calls == 5
+
+    # Withdrawn applications leave the project, and the index unless another project holds them
+    applications_db.execute("DELETE FROM applications WHERE id IN ('app2', 'app3', 'app9')")
+    assert selector.ingest_cursor(applicants(applications_db, "opp1"), project_id="opp1") == [ids[0], ids[1], ids[4]]
+    assert selector.last_sync_stats == {"added": 0, "removed": 1, "shared": 3, "rescanned": 1}
+    assert selector.get_resume_count() == 4
+
+
+def test_single_resumes_from_memory(selector_factory, resume_folder):
+    selector = selector_factory()
+    data = (resume_folder / "STU002_bala.pdf").read_bytes()
+
+    bala = selector.add_resume(io.BytesIO(data), file_name="bala.pdf")
+    chitra = selector.add_resume(memoryview(bytearray((resume_folder / "STU003_chitra.pdf").read_bytes())))
+    assert selector.get_resume_text(bala).startswith("Name: Bala Krishnan")
+    assert selector.get_resume_text(chitra).startswith("Name: Chitra Nair")
+    assert selector.search_resumes("Verilog FPGA design", top_k=1)[0]["id"] == bala
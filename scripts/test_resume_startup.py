@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Tests for deferred imports and lazy model loading
+"""
+import os
+import sys
+import json
+import subprocess
+
+from resume_lazy import LazyAttribute, LazyModule
+from resume_selector_worker import ShortlistWorker
+
+QUERY = "Robotics project using ROS and Embedded C"
+HEAVY_MODULES = ["sentence_transformers", "torch", "transformers", "mistralai", "faiss", "scipy", "pdfplumber"]
+
+
+def test_importing_the_selector_leaves_heavy_modules_unloaded():
+    script = (
+        "import sys, json, resume_selector_main_class, resume_selector_worker; "
+        f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script], cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True, text=True, check=True
+    ).stdout
+    assert json.loads(output.strip().splitlines()[-1]) == []
+
+
+def test_lazy_stand_ins_import_on_first_use():
+    module = LazyModule("json")
+    assert "not loaded" in repr(module)
+    assert module.dumps([1]) == "[1]"
+    assert "not loaded" not in repr(module)
+
+    decoder = LazyAttribute("json", "JSONDecoder")
+    assert decoder().decode("[2]") == [2]
+    assert decoder.resolve() is json.JSONDecoder
+
+
+def test_model_is_loaded_by_the_first_search(selector_factory, resume_folder):
+    selector = selector_factory()
+    assert not selector.is_model_loaded()
+    assert selector._mistral_client is None
+
+    assert selector.process_resumes(str(resume_folder))
+    assert selector.is_model_loaded()
+    assert selector.search_resumes(QUERY, top_k=1)[0]["file_name"] == "STU003_chitra.pdf"
+
+
+def test_warm_up_loads_model_and_store(selector_factory, tmp_path):
+    selector = selector_factory(cache_dir=str(tmp_path / "cache"))
+    worker = ShortlistWorker(selector)
+    assert worker.handle_request({"id": 1, "cmd": "health"})["result"]["model_loaded"] is False
+    assert "embeddings" not in selector.get_cache_stats()
+
+    selector.warm_up()
+    assert worker.handle_request({"id": 2, "cmd": "health"})["result"]["model_loaded"] is True
+    assert selector.embedding_dim == 64
+    assert "embeddings" in selector.get_cache_stats()
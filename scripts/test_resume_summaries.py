@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Tests for concurrent, cached candidate summaries
+"""
+import time
+import asyncio
+
+QUERY = "Robotics project using ROS and Embedded C"
+
+
+def test_summaries_run_concurrently_in_order(selector_factory, resume_folder):
+    selector = selector_factory()
+    assert selector.process_resumes(str(resume_folder))
+    candidates = selector.search_resumes(QUERY, top_k=5)
+    selector.mistral_client.delay = 0.1
+
+    started = time.monotonic()
+    summaries = selector.summarize_candidates(QUERY, candidates)
+    elapsed = time.monotonic() - started
+
+    assert [s["name"] for s in summaries] == [c["metadata"]["name"] for c in candidates]
+    assert selector.mistral_client.max_in_flight == 5
+    # Five requests of 100 ms each: serial would take 0.5 s
+    assert elapsed < 0.35
+
+
+def test_summaries_are_cached_per_project_and_resume(selector_factory, resume_folder, tmp_path):
+    selector = selector_factory(cache_dir=str(tmp_path / "cache"))
+    assert selector.process_resumes(str(resume_folder))
+    candidates = selector.search_resumes(QUERY, top_k=3)
+    calls = selector.mistral_client.calls
+
+    first = selector.summarize_candidates(QUERY, candidates)
+    assert selector.mistral_client.calls == calls + 3
+
+    rescored = [dict(c, score=0.5) for c in candidates]
+    again = selector.summarize_candidates(QUERY, rescored)
+    assert selector.mistral_client.calls == calls + 3
+    assert [s["reasons"] for s in again] == [s["reasons"] for s in first]
+    assert {s["score"] for s in again} == {0.5}
+    assert selector.generate_candidate_summary(QUERY, candidates[0])["reasons"] == first[0]["reasons"]
+    assert selector.mistral_client.calls == calls + 3
+
+    # A different project description is a different summary
+    selector.summarize_candidates("Web dashboard in React", candidates)
+    assert selector.mistral_client.calls == calls + 6
+    assert selector.get_cache_stats()["summaries"]["entries"] == 6
+
+
+def test_slow_candidate_times_out_without_blocking_others(selector_factory, resume_folder, tmp_path):
+    selector = selector_factory(cache_dir=str(tmp_path / "cache"))
+    assert selector.process_resumes(str(resume_folder))
+    candidates = selector.search_resumes(QUERY, top_k=5)
+
+    chat = selector.mistral_client.chat
+    real_complete = chat.complete_async
+
+    async def slow_for_bala(model, messages, **kwargs):
+        if "Name: Bala" in messages[0]["content"]:
+            await asyncio.sleep(5)
+        return await real_complete(model, messages, **kwargs)
+
+    chat.complete_async = slow_for_bala
+
+    started = time.monotonic()
+    summaries = selector.summarize_candidates(QUERY, candidates, timeout=0.2)
+    assert time.monotonic() - started < 2
+
+    by_name = {s["name"]: s for s in summaries}
+    assert by_name["Bala Krishnan"]["error"] == "Timed out after 0.2s"
+    assert all("error" not in s for name, s in by_name.items() if name != "Bala Krishnan")
+
+    # The timeout was not cached: the next attempt asks the LLM again
+    chat.complete_async = real_complete
+    retried = selector.summarize_candidates(QUERY, candidates, timeout=0.2)
+    assert all("error" not in s for s in retried)
+
+
+def test_reopened_shortlist_is_not_rate_limited(selector_factory, resume_folder, tmp_path):
+    selector = selector_factory(cache_dir=str(tmp_path / "cache"), llm_requests_per_second=1)
+    assert selector.process_resumes(str(resume_folder))
+    candidates = selector.search_resumes(QUERY, top_k=5)
+    first = selector.summarize_candidates(QUERY, candidates)
+    calls = selector.mistral_client.calls
+
+    # Ten cache hits at 1 request/s would take about 9 s if each took a token
+    started = time.monotonic()
+    again = selector.summarize_candidates(QUERY, candidates * 2)
+    assert time.monotonic() - started < 0.5
+    assert selector.mistral_client.calls == calls
+    assert [s["reasons"] for s in again] == [s["reasons"] for s in first] * 2
+
+
+def test_summaries_after_concurrent_processing(selector_factory, resume_folder):
+    # The worker runs process (concurrent metadata) and then summarize on the same selector
+    selector = selector_factory(llm_concurrency=8)
+    assert selector.process_resumes(str(resume_folder))
+    candidates = selector.search_resumes(QUERY, top_k=3)
+    summaries = selector.summarize_candidates(QUERY, candidates)
+    assert all("error" not in s for s in summaries)
+    assert [s["name"] for s in summaries] == [c["metadata"]["name"] for c in candidates]